@@ -10,7 +10,9 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/3.2/ref/settings/
 """
 
+from datetime import timedelta
 from pathlib import Path
+import os
 import sys
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -21,8 +23,15 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 # See https://docs.djangoproject.com/en/3.2/howto/deployment/checklist/
 
 # SECURITY WARNING: keep the secret key used in production secret!
-with open(BASE_DIR / 'secret_key.txt') as f:
-    SECRET_KEY = f.read().strip()
+# It signs every token: read it from SECRET_KEY or from the untracked
+# secret_key.txt, never from version control. Tests use a throwaway key.
+if 'test' in sys.argv:
+    SECRET_KEY = 'test-secret-key-not-for-production'
+elif os.environ.get('SECRET_KEY'):
+    SECRET_KEY = os.environ['SECRET_KEY']
+else:
+    with open(BASE_DIR / 'secret_key.txt') as f:
+        SECRET_KEY = f.read().strip()
 
 # SECURITY WARNING: don't run with debug turned on in production!
 DEBUG = True
@@ -136,6 +145,16 @@ REST_FRAMEWORK = {
         'app.authentication.BearerAuthentication',
     ],
     'EXCEPTION_HANDLER': 'app.handler.custom_exception_handler',
+    # orjson-backed JSON codec, falls back to the stdlib when not installed
+    'DEFAULT_RENDERER_CLASSES': [
+        'app.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'app.parsers.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
 }
 
 CORS_ALLOWED_ORIGINS = [
@@ -146,4 +165,131 @@ PASSWORD_HASHERS = [
     'django.contrib.auth.hashers.BCryptPasswordHasher',
 ]
 
+# Password hashing runs on a bounded pool so login bursts cannot occupy
+# every request worker; requests beyond WORKERS + QUEUE_SIZE get a 503.
+# Sync (WSGI) views block their worker while queued, so they may only queue
+# behind SYNC_QUEUE_SIZE other sync logins and otherwise fail fast.
+PASSWORD_HASHING_POOL = {
+    'WORKERS': 2,
+    'QUEUE_SIZE': 16,
+    'SYNC_QUEUE_SIZE': 0,
+    'TIMEOUT': 5,
+}
+
+# Serve /login and /users with native async views (enabled by asgi.py)
+ASYNC_PASSWORD_VIEWS = os.environ.get('ASYNC_PASSWORD_VIEWS') == 'true'
+
 AUTH_USER_MODEL = 'app.User'
+
+# Set MUSIC_CACHE_DIR to share cached musics between worker processes
+# through the file backend instead of keeping them in local memory. It is
+# required when running more than one process: the per-user versions that
+# retire cached musics live in the cache backend too.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+}
+
+for alias in ['music_pages', 'musics']:
+
+    if os.environ.get('MUSIC_CACHE_DIR'):
+        CACHES[alias] = {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': os.path.join(os.environ['MUSIC_CACHE_DIR'], alias),
+            'OPTIONS': {'MAX_ENTRIES': 10000},
+        }
+    else:
+        CACHES[alias] = {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': alias,
+            'OPTIONS': {'MAX_ENTRIES': 10000},
+        }
+
+# Rendered music list pages, versioned per user (TIMEOUT in seconds)
+MUSIC_PAGE_CACHE = {
+    'ALIAS': 'music_pages',
+    'TIMEOUT': 300,
+}
+
+# Largest array accepted by the bulk music endpoints, and the number of
+# rows each of their queries reads or writes at once
+MUSIC_BULK_LIMIT = 10000
+MUSIC_BULK_BATCH_SIZE = 500
+
+# Musics read per query while streaming GET /musics/export
+MUSIC_EXPORT = {
+    'CHUNK_SIZE': 1000,
+}
+
+# POST /musics/import inserts BATCH_SIZE rows per transaction and reports at
+# most MAX_ERRORS invalid lines. Uploads larger than INLINE_LIMIT bytes are
+# kept in DIR and imported by a job (set MUSIC_IMPORT_DIR to move it).
+MUSIC_IMPORT = {
+    'BATCH_SIZE': 1000,
+    'MAX_ERRORS': 1000,
+    'INLINE_LIMIT': 1024 * 1024,
+    'DIR': os.environ.get('MUSIC_IMPORT_DIR', BASE_DIR / 'imports'),
+}
+
+# Responses of writes sent with an Idempotency-Key header are replayed for
+# TTL seconds; a retry arriving while the first request still runs waits up
+# to WAIT seconds for its response (POLL_INTERVAL in seconds). A request that
+# has not stored its response after LOCK seconds is presumed dead and a retry
+# runs it again.
+IDEMPOTENCY = {
+    'TTL': 24 * 60 * 60,
+    'WAIT': 10,
+    'LOCK': 60,
+    'POLL_INTERVAL': 0.1,
+}
+
+# Trash purges delete BATCH_SIZE rows per transaction. empty_list purges
+# inline up to INLINE_LIMIT musics and queues a job for larger trash bins;
+# purge_trash removes musics deleted RETENTION_DAYS ago.
+MUSIC_PURGE = {
+    'BATCH_SIZE': 1000,
+    'INLINE_LIMIT': 1000,
+    'RETENTION_DAYS': 30,
+}
+
+# Jobs table run by `manage.py run_jobs` (LEASE_SECONDS, RETRY_DELAY and
+# POLL_INTERVAL in seconds). A job whose lease runs out without a progress
+# report is claimed again; failures are retried after RETRY_DELAY * attempts.
+JOBS = {
+    'PROCESSES': 2,
+    'LEASE_SECONDS': 300,
+    'MAX_ATTEMPTS': 3,
+    'RETRY_DELAY': 30,
+    'POLL_INTERVAL': 1,
+}
+
+# Serialized musics by id; ids without a music are remembered for
+# NEGATIVE_TIMEOUT seconds (TIMEOUT and NEGATIVE_TIMEOUT in seconds). Entries
+# are checked against a per-user version kept in the same backend, which every
+# counter adjustment bumps.
+MUSIC_OBJECT_CACHE = {
+    'ALIAS': 'musics',
+    'TIMEOUT': 300,
+    'NEGATIVE_TIMEOUT': 30,
+}
+
+# Per-process cache of authenticated users, keyed by id (TTL in seconds)
+AUTH_USER_CACHE = {
+    'MAXSIZE': 1024,
+    'TTL': 300,
+}
+
+# Per-process cache of verified JWT payloads, never kept past the token 'exp'
+AUTH_TOKEN_CACHE = {
+    'MAXSIZE': 4096,
+    'TTL': 3600,
+}
+
+# Build request.user from the token claims instead of the users table.
+# Deleted or deactivated users keep access until their token expires.
+AUTH_STATELESS_PRINCIPAL = False
+
+# Access tokens are short-lived; clients renew them through /token/refresh
+ACCESS_TOKEN_LIFETIME = timedelta(minutes=15)
+REFRESH_TOKEN_LIFETIME = timedelta(days=30)
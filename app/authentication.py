@@ -1,10 +1,24 @@
+import time
 import jwt
 from django.conf import settings
+from django.db import router
 from rest_framework import authentication
 from rest_framework import exceptions
 from app import messages
+from app.cache import LRUCache
 from app.models import User
 
+user_cache = LRUCache(maxsize=settings.AUTH_USER_CACHE['MAXSIZE'],
+                      ttl=settings.AUTH_USER_CACHE['TTL'])
+token_cache = LRUCache(maxsize=settings.AUTH_TOKEN_CACHE['MAXSIZE'],
+                       ttl=settings.AUTH_TOKEN_CACHE['TTL'])
+
+PRINCIPAL_CLAIMS = ['username', 'email']
+
+USER_FIELDS = [field.attname for field in User._meta.concrete_fields]
+
+PUBLIC_PATHS = ['/login', '/users', '/token/refresh', '/token/revoke']
+
 
 class BearerAuthentication(authentication.BaseAuthentication):
 
@@ -29,6 +43,18 @@ class BearerAuthentication(authentication.BaseAuthentication):
             raise exceptions.AuthenticationFailed(messages.NO_TOKEN_PROVIDED)
 
         token = auth[1]
+        payload = self.verified_payload(token)
+
+        if settings.AUTH_STATELESS_PRINCIPAL:
+            return (self.stateless_principal(payload), None)
+
+        return self.authenticate_credentials(payload.get('user_id'))
+
+    def verified_payload(self, token):
+
+        payload = token_cache.get(token)
+        if payload is not None:
+            return payload
 
         try:
 
@@ -39,17 +65,39 @@ class BearerAuthentication(authentication.BaseAuthentication):
         except jwt.ExpiredSignatureError:
             raise exceptions.AuthenticationFailed(messages.TOKEN_EXPIRED)
 
-        return self.authenticate_credentials(payload.get('user_id'))
+        expiration = payload.get('exp')
+        ttl = expiration - time.time() if expiration else None
+        token_cache.set(token, payload, ttl=ttl)
 
-    def authenticate_credentials(self, user_id):
+        return payload
 
-        try:
+    def stateless_principal(self, payload):
 
-            user = User.objects.get(id=user_id)
-        except User.DoesNotExist:
+        user_id = payload.get('user_id')
+        if user_id is None:
             raise exceptions.AuthenticationFailed(messages.INVALID_TOKEN)
 
-        return (user, None)
+        claims = [claim for claim in PRINCIPAL_CLAIMS if claim in payload]
+        values = [user_id] + [payload[claim] for claim in claims]
+
+        # Every column not carried by the token stays deferred, so the users
+        # table is only queried if a view reads one of them.
+        return User.from_db(router.db_for_read(User), ['id'] + claims, values)
+
+    def authenticate_credentials(self, user_id):
+
+        # Only the row values are shared between requests; every request gets
+        # its own User instance to read or modify.
+        row = user_cache.get(user_id)
+        if row is None:
+
+            row = User.objects.filter(id=user_id).values_list(*USER_FIELDS).first()
+            if row is None:
+                raise exceptions.AuthenticationFailed(messages.INVALID_TOKEN)
+
+            user_cache.set(user_id, row)
+
+        return (User.from_db(router.db_for_read(User), USER_FIELDS, row), None)
 
     def _not_authenticate(self, request):
-        return request.method == 'POST' and (request.path == '/login' or request.path == '/users')
+        return request.method == 'POST' and request.path in PUBLIC_PATHS
@@ -0,0 +1,217 @@
+import hashlib
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from django.conf import settings
+from django.core.cache import caches
+
+
+class LRUCache:
+
+    def __init__(self, maxsize=1024, ttl=300):
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+
+        with self._lock:
+
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+
+            (expires_at, value) = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+            return value
+
+    def set(self, key, value, ttl=None):
+
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if ttl <= 0 or self.maxsize <= 0:
+            return
+
+        with self._lock:
+
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+
+        with self._lock:
+
+            lookups = self.hits + self.misses
+
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': self.hits / lookups if lookups else 0.0,
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+            }
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class VersionedCache:
+
+    def __init__(self, alias='default', timeout=300, prefix=''):
+
+        self.alias = alias
+        self.timeout = timeout
+        self.prefix = prefix
+        self.hits = 0
+        self.misses = 0
+        self.hit_seconds = 0.0
+        self.miss_seconds = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def backend(self):
+        return caches[self.alias]
+
+    def key(self, *parts):
+
+        raw = ':'.join(str(part) for part in parts)
+
+        return '{}:{}'.format(self.prefix, hashlib.md5(raw.encode('utf-8')).hexdigest())
+
+    def get(self, key, version):
+        return self.backend.get(key, version=version)
+
+    def set(self, key, value, version):
+        self.backend.set(key, value, timeout=self.timeout, version=version)
+
+    def record(self, hit, seconds):
+
+        with self._lock:
+
+            if hit:
+                self.hits += 1
+                self.hit_seconds += seconds
+            else:
+                self.misses += 1
+                self.miss_seconds += seconds
+
+    def clear(self):
+
+        self.backend.clear()
+
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.hit_seconds = 0.0
+            self.miss_seconds = 0.0
+
+    def stats(self):
+
+        with self._lock:
+
+            lookups = self.hits + self.misses
+
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': self.hits / lookups if lookups else 0.0,
+                'hit_latency_ms': self.hit_seconds / self.hits * 1e3 if self.hits else 0.0,
+                'miss_latency_ms': self.miss_seconds / self.misses * 1e3 if self.misses else 0.0,
+            }
+
+
+class ReadThroughCache:
+
+    MISSING = '<missing>'
+
+    def __init__(self, alias='default', timeout=300, negative_timeout=30, prefix=''):
+
+        self.alias = alias
+        self.timeout = timeout
+        self.negative_timeout = negative_timeout
+        self.prefix = prefix
+
+    @property
+    def backend(self):
+        return caches[self.alias]
+
+    def key(self, id):
+        return '{}:{}'.format(self.prefix, id)
+
+    def version_key(self, user_id):
+        return '{}:version:{}'.format(self.prefix, user_id)
+
+    def version(self, user_id):
+
+        # A fresh token rather than a counter, so a version evicted from the
+        # backend never comes back equal to one older entries carry.
+        version = self.backend.get(self.version_key(user_id))
+        if version is None:
+            self.backend.add(self.version_key(user_id), uuid.uuid4().hex, timeout=None)
+            version = self.backend.get(self.version_key(user_id))
+
+        return version
+
+    def bump(self, user_id):
+        self.backend.set(self.version_key(user_id), uuid.uuid4().hex, timeout=None)
+
+    def get_or_load(self, id, load, version=None):
+
+        # Entries carry the owner's version they were loaded at and only serve
+        # reads at that version, so a write made in another process, which
+        # bumps the version kept in the shared backend, still retires them.
+        entry = self.backend.get(self.key(id))
+        if entry is not None and entry[0] == version:
+            return None if entry[1] == self.MISSING else entry[1]
+
+        value = load(id)
+        if value is None:
+            self.backend.set(self.key(id), (version, self.MISSING),
+                             timeout=self.negative_timeout)
+        else:
+            self.backend.set(self.key(id), (version, value), timeout=self.timeout)
+
+        return value
+
+    def delete_many(self, ids):
+        self.backend.delete_many([self.key(id) for id in ids])
+
+    def clear(self):
+        self.backend.clear()
+
+
+music_page_cache = VersionedCache(alias=settings.MUSIC_PAGE_CACHE['ALIAS'],
+                                  timeout=settings.MUSIC_PAGE_CACHE['TIMEOUT'],
+                                  prefix='music-pages')
+music_cache = ReadThroughCache(
+    alias=settings.MUSIC_OBJECT_CACHE['ALIAS'],
+    timeout=settings.MUSIC_OBJECT_CACHE['TIMEOUT'],
+    negative_timeout=settings.MUSIC_OBJECT_CACHE['NEGATIVE_TIMEOUT'],
+    prefix='musics')
@@ -0,0 +1,29 @@
+import hashlib
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+
+def make_etag(*parts):
+
+    key = ':'.join(str(part) for part in parts)
+
+    return quote_etag(hashlib.md5(key.encode('utf-8')).hexdigest())
+
+
+def not_modified(request, etag, last_modified):
+
+    response = get_conditional_response(
+        request, etag=etag, last_modified=int(last_modified.timestamp()))
+
+    if response is not None:
+        set_validators(response, etag, last_modified)
+
+    return response
+
+
+def set_validators(response, etag, last_modified):
+
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(last_modified.timestamp())
+
+    return response
@@ -0,0 +1,106 @@
+import asyncio
+import threading
+from concurrent import futures
+from django.conf import settings
+from django.contrib.auth import hashers
+
+
+class HashingUnavailable(Exception):
+    pass
+
+
+class PasswordHashingPool:
+
+    def __init__(self, workers=2, queue_size=16, timeout=5, sync_queue_size=0):
+
+        self.timeout = timeout
+        self._executor = futures.ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix='password-hashing')
+        self._slots = threading.BoundedSemaphore(workers + queue_size)
+        self._sync_slots = threading.BoundedSemaphore(workers + sync_queue_size)
+
+    def submit(self, fn, *args):
+
+        if not self._slots.acquire(blocking=False):
+            raise HashingUnavailable
+
+        try:
+
+            future = self._executor.submit(self._call, fn, args)
+        except RuntimeError:
+            self._slots.release()
+            raise HashingUnavailable
+
+        future.add_done_callback(self._release_if_cancelled)
+
+        return future
+
+    def _call(self, fn, args):
+
+        try:
+
+            return fn(*args)
+        finally:
+            self._slots.release()
+
+    def _release_if_cancelled(self, future):
+
+        if future.cancelled():
+            self._slots.release()
+
+    def run(self, fn, *args):
+
+        # A sync caller holds its request worker while it waits, so it only
+        # queues behind sync_queue_size others; async callers wait for free.
+        if not self._sync_slots.acquire(blocking=False):
+            raise HashingUnavailable
+
+        try:
+
+            future = self.submit(fn, *args)
+
+            try:
+
+                return future.result(timeout=self.timeout)
+            except futures.TimeoutError:
+                future.cancel()
+                raise HashingUnavailable
+        finally:
+            self._sync_slots.release()
+
+    async def arun(self, fn, *args):
+
+        future = self.submit(fn, *args)
+
+        try:
+
+            return await asyncio.wait_for(asyncio.wrap_future(future),
+                                          self.timeout)
+        except asyncio.TimeoutError:
+            future.cancel()
+            raise HashingUnavailable
+
+
+password_pool = PasswordHashingPool(
+    workers=settings.PASSWORD_HASHING_POOL['WORKERS'],
+    queue_size=settings.PASSWORD_HASHING_POOL['QUEUE_SIZE'],
+    sync_queue_size=settings.PASSWORD_HASHING_POOL['SYNC_QUEUE_SIZE'],
+    timeout=settings.PASSWORD_HASHING_POOL['TIMEOUT']
+)
+
+
+def check_password(user, password):
+    return password_pool.run(hashers.check_password, password, user.password)
+
+
+def make_password(password):
+    return password_pool.run(hashers.make_password, password)
+
+
+async def acheck_password(user, password):
+    return await password_pool.arun(hashers.check_password, password,
+                                    user.password)
+
+
+async def amake_password(password):
+    return await password_pool.arun(hashers.make_password, password)
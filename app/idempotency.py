@@ -0,0 +1,112 @@
+import datetime
+import functools
+import hashlib
+import time
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from rest_framework.response import Response
+from rest_framework import status
+from app import messages
+from app.models import IdempotencyKey
+
+IDEMPOTENT_METHODS = ['POST', 'PUT', 'PATCH', 'DELETE']
+
+
+def idempotent(view):
+
+    @functools.wraps(view)
+    def wrapper(request, *args, **kwargs):
+
+        key = request.headers.get('Idempotency-Key')
+        if not key or request.method not in IDEMPOTENT_METHODS:
+            return view(request, *args, **kwargs)
+
+        if len(key) > 255:
+            return Response({'message': messages.IDEMPOTENCY_KEY_TOO_LONG}, status=status.HTTP_400_BAD_REQUEST)
+
+        fingerprint = hashlib.sha256(b'\n'.join([
+            request.method.encode('ascii'), request.path.encode('utf-8'), request.body
+        ])).hexdigest()
+
+        # Concurrent requests with the same key race for the unique row: the
+        # winner runs the view, the others wait for its stored response.
+        deadline = time.monotonic() + settings.IDEMPOTENCY['WAIT']
+        while True:
+
+            (record, claimed) = _claim(request.user, key, fingerprint)
+            if claimed:
+                break
+
+            if record is not None:
+
+                if record.fingerprint != fingerprint:
+                    return Response({'message': messages.IDEMPOTENCY_KEY_REUSED},
+                                    status=status.HTTP_422_UNPROCESSABLE_ENTITY)
+
+                if record.status_code is not None:
+                    return Response(record.response, status=record.status_code,
+                                    headers={'Idempotent-Replayed': 'true'})
+
+                if time.monotonic() >= deadline:
+                    return Response({'message': messages.IDEMPOTENCY_KEY_IN_PROGRESS},
+                                    status=status.HTTP_409_CONFLICT)
+
+                time.sleep(settings.IDEMPOTENCY['POLL_INTERVAL'])
+
+        # Once the lock is taken over, a late response is no longer stored.
+        locked = IdempotencyKey.objects.filter(id=record.id, locked_until=record.locked_until)
+
+        try:
+
+            response = view(request, *args, **kwargs)
+        except Exception:
+            locked.delete()
+            raise
+
+        # Server errors are not kept, so a retry runs the request again.
+        if response.status_code >= 500:
+            locked.delete()
+        else:
+            locked.update(status_code=response.status_code, response=response.data,
+                          locked_until=None)
+
+        return response
+
+    return wrapper
+
+
+def _claim(user, key, fingerprint):
+
+    now = timezone.now()
+    locked_until = now + datetime.timedelta(seconds=settings.IDEMPOTENCY['LOCK'])
+
+    try:
+
+        with transaction.atomic():
+            expires_at = now + datetime.timedelta(seconds=settings.IDEMPOTENCY['TTL'])
+            return (IdempotencyKey.objects.create(user=user, key=key, fingerprint=fingerprint,
+                                                  expires_at=expires_at,
+                                                  locked_until=locked_until), True)
+    except IntegrityError:
+        pass
+
+    record = IdempotencyKey.objects.filter(user=user, key=key).first()
+
+    if record is not None and record.expires_at <= now:
+        record.delete()
+        return (None, False)
+
+    # A pending record whose lock ran out belongs to a request that died; the
+    # retry whose compare-and-set UPDATE still matches the old lock takes over.
+    if (record is not None and record.status_code is None and
+            record.fingerprint == fingerprint and
+            (record.locked_until is None or record.locked_until <= now)):
+        taken = IdempotencyKey.objects.filter(
+            id=record.id, status_code=None, locked_until=record.locked_until).update(
+            locked_until=locked_until)
+        if taken:
+            record.locked_until = locked_until
+            return (record, True)
+
+    return (record, False)
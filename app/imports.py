@@ -0,0 +1,132 @@
+import codecs
+import csv
+import datetime
+import json
+from django.conf import settings
+from django.core.exceptions import FieldError
+from django.core.files.storage import FileSystemStorage
+from django.db import transaction
+from app import jobs, messages
+from app.cache import music_cache
+from app.models import Music, MusicCounter
+from app.validators import music_validator
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+import_storage = FileSystemStorage(location=settings.MUSIC_IMPORT['DIR'])
+
+FORMATS = ['ndjson', 'csv']
+CONTENT_TYPE_FORMATS = {
+    'application/x-ndjson': 'ndjson',
+    'application/jsonl': 'ndjson',
+    'text/csv': 'csv',
+}
+EXTENSION_FORMATS = {'.ndjson': 'ndjson', '.jsonl': 'ndjson', '.csv': 'csv'}
+
+
+def import_musics(user, file, import_format, batch_size=None, progress=None):
+
+    batch_size = batch_size or settings.MUSIC_IMPORT['BATCH_SIZE']
+    rows = _csv_rows(file) if import_format == 'csv' else _ndjson_rows(file)
+    today = datetime.date.today()
+
+    report = {'imported': 0, 'existing': 0, 'failed': 0, 'errors': []}
+    (batch, valid) = (set(), 0)
+
+    # Rows are read one at a time from the upload and only a batch of
+    # identities is held at once, so the file size does not matter.
+    for (line, data, message) in rows:
+        try:
+
+            if message is not None:
+                raise FieldError(message)
+            batch.add(Music.identity(music_validator.validate(data, today)))
+            valid += 1
+        except FieldError as e:
+            report['failed'] += 1
+            if len(report['errors']) < settings.MUSIC_IMPORT['MAX_ERRORS']:
+                report['errors'].append({'line': line, 'message': str(e)})
+
+        if len(batch) >= batch_size:
+            _insert(user, batch, valid, report)
+            (batch, valid) = (set(), 0)
+            if progress is not None:
+                progress(line)
+
+    _insert(user, batch, valid, report)
+
+    return report
+
+
+def _insert(user, identities, valid, report):
+
+    if not identities:
+        return
+
+    with transaction.atomic():
+        musics = [Music(user=user, **dict(zip(Music.IDENTITY_FIELDS, identity)))
+                  for identity in identities]
+        inserted = Music.objects.bulk_insert_or_ignore(
+            musics, batch_size=settings.MUSIC_BULK_BATCH_SIZE)
+        MusicCounter.objects.adjust(user, active=inserted)
+
+    music_cache.delete_many(Music.objects.ids_by_identity(
+        user, identities, settings.MUSIC_BULK_BATCH_SIZE).values())
+
+    report['imported'] += inserted
+    report['existing'] += valid - inserted
+
+
+def _ndjson_rows(file):
+
+    for (line, raw) in enumerate(file, 1):
+
+        if not raw.strip():
+            continue
+
+        try:
+
+            yield (line, _loads(raw), None)
+        except ValueError:
+            yield (line, None, messages.INVALID_JSON_LINE)
+
+
+def _csv_rows(file):
+
+    reader = csv.DictReader(codecs.iterdecode(file, 'utf-8'))
+
+    while True:
+        try:
+
+            data = next(reader)
+        except StopIteration:
+            return
+        except UnicodeDecodeError:
+            # The decoder cannot resume after a bad byte sequence.
+            yield (reader.line_num + 1, None, messages.INVALID_CSV_LINE)
+            return
+        except csv.Error:
+            yield (reader.line_num, None, messages.INVALID_CSV_LINE)
+            continue
+
+        if data.get('feat') in (None, ''):
+            data.pop('feat', None)
+
+        yield (reader.line_num, data, None)
+
+
+@jobs.handler('import_musics')
+def import_musics_job(job, name, import_format):
+
+    with import_storage.open(name, 'rb') as file:
+        report = import_musics(job.user, file, import_format,
+                               progress=lambda line: jobs.report(job, line))
+
+    import_storage.delete(name)
+
+    return report
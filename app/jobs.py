@@ -0,0 +1,69 @@
+import datetime
+from django.conf import settings
+from django.utils import timezone
+from app.models import Job
+
+HANDLERS = {}
+
+
+def handler(kind):
+
+    def register(fn):
+        HANDLERS[kind] = fn
+        return fn
+
+    return register
+
+
+def enqueue(user, kind, payload=None, total=None):
+    return Job.objects.enqueue(user, kind, payload, total,
+                               max_attempts=settings.JOBS['MAX_ATTEMPTS'])
+
+
+def report(job, progress):
+
+    # Progress doubles as the heartbeat: a handler that keeps reporting
+    # keeps its lease, a crashed worker's job is claimed again once the
+    # lease runs out.
+    now = timezone.now()
+    job.progress = progress
+    job.leased().update(
+        progress=progress, updated_at=now,
+        leased_until=now + datetime.timedelta(seconds=settings.JOBS['LEASE_SECONDS']))
+
+
+def run_next(worker):
+
+    job = Job.objects.claim(worker, settings.JOBS['LEASE_SECONDS'])
+    if job is not None:
+        run(job)
+
+    return job
+
+
+def run(job):
+
+    try:
+
+        result = HANDLERS[job.kind](job, **job.payload)
+    except Exception as e:
+        _retry_or_fail(job, '{}: {}'.format(type(e).__name__, e))
+        return
+
+    job.leased().update(status=Job.DONE, result=result, error='',
+                        leased_until=None, updated_at=timezone.now())
+
+
+def _retry_or_fail(job, error):
+
+    now = timezone.now()
+
+    if job.attempts >= job.max_attempts:
+        job.leased().update(status=Job.FAILED, error=error, leased_until=None,
+                            updated_at=now)
+        return
+
+    delay = settings.JOBS['RETRY_DELAY'] * job.attempts
+    job.leased().update(status=Job.QUEUED, error=error, leased_until=None,
+                        run_after=now + datetime.timedelta(seconds=delay),
+                        updated_at=now)
@@ -0,0 +1,44 @@
+import datetime
+import timeit
+import jwt
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from app.authentication import BearerAuthentication, token_cache
+
+
+class Command(BaseCommand):
+    help = 'Measures the per-request cost of verifying a bearer token, cold and memoized.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=20000)
+
+    def handle(self, *args, **options):
+
+        iterations = options['iterations']
+        authentication = BearerAuthentication()
+
+        expiration = datetime.datetime.today() + datetime.timedelta(days=1)
+        token = jwt.encode({'user_id': 1, 'exp': int(expiration.timestamp())},
+                           settings.SECRET_KEY, algorithm='HS256').encode('utf-8')
+
+        def cold():
+            token_cache.delete(token)
+            authentication.verified_payload(token)
+
+        def memoized():
+            authentication.verified_payload(token)
+
+        token_cache.delete(token)
+        cold_seconds = timeit.timeit(cold, number=iterations)
+
+        authentication.verified_payload(token)
+        memoized_seconds = timeit.timeit(memoized, number=iterations)
+
+        token_cache.delete(token)
+
+        self.stdout.write('jwt.decode per request: {:.2f} us'.format(
+            cold_seconds / iterations * 1e6))
+        self.stdout.write('memoized per request:   {:.2f} us'.format(
+            memoized_seconds / iterations * 1e6))
+        self.stdout.write('speedup:                {:.1f}x'.format(
+            cold_seconds / memoized_seconds))
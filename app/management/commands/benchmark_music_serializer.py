@@ -0,0 +1,52 @@
+import datetime
+import timeit
+from django.core.management.base import BaseCommand
+from rest_framework.renderers import JSONRenderer
+from app.models import Music
+from app.serializers import MusicReadSerializer, MusicSerializer
+
+
+class Command(BaseCommand):
+    help = 'Compares the per-row cost of MusicSerializer and MusicReadSerializer.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=500)
+        parser.add_argument('--repeat', type=int, default=20)
+
+    def handle(self, *args, **options):
+
+        (rows, repeat) = (options['rows'], options['repeat'])
+        now = datetime.datetime.now()
+
+        musics = [Music(
+            id=index,
+            title='Title {}'.format(index),
+            artist='Artist {}'.format(index % 50),
+            release_date=datetime.date(2000, 1, 1) + datetime.timedelta(days=index),
+            duration=datetime.time(0, 3, index % 60),
+            number_views=index,
+            feat=index % 2 == 0,
+            created_at=now,
+            updated_at=now
+        ) for index in range(rows)]
+        tuples = [tuple(getattr(music, field) for field in MusicReadSerializer.FIELDS)
+                  for music in musics]
+
+        renderer = JSONRenderer()
+        model_output = renderer.render(MusicSerializer(musics, many=True).data)
+        read_output = renderer.render(MusicReadSerializer(tuples).data)
+        if model_output != read_output:
+            self.stderr.write('Serializers produced different output!')
+            return
+
+        model_seconds = timeit.timeit(
+            lambda: MusicSerializer(musics, many=True).data, number=repeat)
+        read_seconds = timeit.timeit(
+            lambda: MusicReadSerializer(tuples).data, number=repeat)
+
+        self.stdout.write('MusicSerializer per row:     {:.2f} us'.format(
+            model_seconds / repeat / rows * 1e6))
+        self.stdout.write('MusicReadSerializer per row: {:.2f} us'.format(
+            read_seconds / repeat / rows * 1e6))
+        self.stdout.write('speedup:                     {:.1f}x'.format(
+            model_seconds / read_seconds))
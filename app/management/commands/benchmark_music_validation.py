@@ -0,0 +1,44 @@
+import datetime
+import timeit
+from django.core.management.base import BaseCommand
+from app.serializers import MusicSerializer
+from app.validators import music_validator
+
+
+class Command(BaseCommand):
+    help = 'Measures how many music payloads per second MusicValidator and MusicSerializer validate.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--records', type=int, default=1000)
+        parser.add_argument('--repeat', type=int, default=5)
+
+    def handle(self, *args, **options):
+
+        (records, repeat) = (options['records'], options['repeat'])
+
+        payloads = [{
+            'title': 'Title {}'.format(index),
+            'artist': 'Artist {}'.format(index % 50),
+            'release_date': str(datetime.date(2000, 1, 1) + datetime.timedelta(days=index)),
+            'duration': '00:03:{:02d}'.format(index % 60),
+            'number_views': index,
+            'feat': index % 2 == 0,
+        } for index in range(records)]
+
+        (valid, errors) = music_validator.validate_many(payloads)
+        if errors:
+            self.stderr.write('Benchmark payloads are invalid: {}'.format(errors[0]))
+            return
+
+        validator_seconds = timeit.timeit(
+            lambda: music_validator.validate_many(payloads), number=repeat)
+        serializer_seconds = timeit.timeit(
+            lambda: [MusicSerializer(data=payload).is_valid() for payload in payloads],
+            number=repeat)
+
+        self.stdout.write('MusicValidator:  {:,.0f} records/s'.format(
+            records * repeat / validator_seconds))
+        self.stdout.write('MusicSerializer: {:,.0f} records/s'.format(
+            records * repeat / serializer_seconds))
+        self.stdout.write('speedup:         {:.1f}x'.format(
+            serializer_seconds / validator_seconds))
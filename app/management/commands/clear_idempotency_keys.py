@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from app.models import IdempotencyKey
+
+
+class Command(BaseCommand):
+    help = 'Deletes the stored responses of expired idempotency keys.'
+
+    def handle(self, *args, **options):
+
+        (deleted, _) = IdempotencyKey.objects.filter(expires_at__lte=timezone.now()).delete()
+
+        self.stdout.write('{} idempotency key(s) deleted.'.format(deleted))
@@ -0,0 +1,29 @@
+import datetime
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from app.models import Music, User
+from app.purge import purge_musics
+
+
+class Command(BaseCommand):
+    help = 'Definitively deletes musics that have been in the trash for more than --days days.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int,
+                            default=settings.MUSIC_PURGE['RETENTION_DAYS'],
+                            help='Retention period of soft-deleted musics.')
+
+    def handle(self, *args, **options):
+
+        # Soft deletes save updated_at, so it dates the move to the trash.
+        older_than = timezone.now() - datetime.timedelta(days=options['days'])
+
+        user_ids = Music.objects.filter(deleted__in=[True]).order_by().values_list(
+            'user_id', flat=True).distinct()
+
+        purged = 0
+        for user_id in list(user_ids):
+            purged += purge_musics(User(pk=user_id), older_than=older_than)
+
+        self.stdout.write('{} music(s) purged.'.format(purged))
@@ -0,0 +1,54 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, F, Q
+from django.utils import timezone
+from app.models import Music, MusicCounter, User
+
+
+class Command(BaseCommand):
+    help = 'Recomputes the per-user active/deleted music counters from the musics table.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--user', type=int, action='append', dest='users',
+                            help='Only reconcile the given user id (repeatable).')
+
+    def handle(self, *args, **options):
+
+        users = User.objects.all()
+        if options['users']:
+            users = users.filter(id__in=options['users'])
+
+        corrected = 0
+        for user_id in users.values_list('id', flat=True).iterator():
+            if self._reconcile(user_id):
+                corrected += 1
+
+        self.stdout.write('{} counter(s) corrected.'.format(corrected))
+
+    def _reconcile(self, user_id):
+
+        with transaction.atomic():
+
+            counter = MusicCounter.objects.select_for_update().filter(
+                user_id=user_id).first()
+            counts = Music.objects.filter(user_id=user_id).aggregate(
+                active=Count('id', filter=Q(deleted__in=[False])),
+                deleted=Count('id', filter=Q(deleted__in=[True]))
+            )
+
+            if counter is None:
+                MusicCounter.objects.create(user_id=user_id,
+                                            active_count=counts['active'],
+                                            deleted_count=counts['deleted'])
+                return False
+
+            if (counter.active_count, counter.deleted_count) == (counts['active'], counts['deleted']):
+                return False
+
+            # Bumping the version retires the ETags and cached pages built on
+            # the drifted totals.
+            MusicCounter.objects.filter(user_id=user_id).update(
+                active_count=counts['active'], deleted_count=counts['deleted'],
+                version=F('version') + 1, updated_at=timezone.now())
+
+            return True
@@ -0,0 +1,53 @@
+import multiprocessing
+import os
+import socket
+import time
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connections
+from app import jobs
+
+
+class Command(BaseCommand):
+    help = 'Runs queued jobs from the jobs table in one or more worker processes.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--processes', type=int,
+                            default=settings.JOBS['PROCESSES'])
+        parser.add_argument('--once', action='store_true',
+                            help='Exit once no job is ready to run.')
+
+    def handle(self, *args, **options):
+
+        if options['processes'] <= 1:
+            self._work(options['once'])
+            return
+
+        # Forked children must not share the parent's database connections.
+        connections.close_all()
+
+        processes = [multiprocessing.Process(target=self._work, args=(options['once'],))
+                     for _ in range(options['processes'])]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+    def _work(self, once):
+
+        worker = '{}:{}'.format(socket.gethostname(), os.getpid())
+
+        try:
+
+            while True:
+                job = jobs.run_next(worker)
+                if job is not None:
+                    self.stdout.write('Job {} ({}) run by {}.'.format(job.id, job.kind, worker))
+                elif once:
+                    return
+                else:
+                    time.sleep(settings.JOBS['POLL_INTERVAL'])
+        except KeyboardInterrupt:
+            pass
+        finally:
+            connections.close_all()
@@ -4,6 +4,8 @@ USERNAME_IS_REQUIRED = 'Username is required!'
 EMAIL_INVALID = 'E-mail invalid!'
 EMAIL_IS_REQUIRED = 'E-mail is required!'
 PASSWORD_IS_REQUIRED = 'Password is required!'
+PASSWORD_HASHING_BUSY = 'Too many logins in progress, try again later!'
+INVALID_JSON_BODY = 'Invalid JSON body!'
 
 # Music Messages
 ID_IS_REQUIRED = 'Id is required!'
@@ -15,6 +17,26 @@ MUSIC_NOT_FOUND = 'Music not found!'
 RELEASE_DATE_CANNOT_BE_FUTURE = 'Release Date cannot be future!'
 WRONG_RELEASE_DATE_FORMAT = 'Wrong Release Date format, try yyyy-MM-dd!'
 WRONG_DURATION_FORMAT = 'Wrong Duration format, try HH:mm:ss!'
+INVALID_CURSOR = 'Invalid cursor!'
+INVALID_SIZE = 'Size must be a positive integer!'
+NUMBER_VIEWS_MUST_BE_INTEGER = 'Number Views must be an integer!'
+FEAT_MUST_BE_BOOLEAN = 'Feat must be a boolean!'
+MUSIC_MUST_BE_AN_OBJECT = 'Music must be an object!'
+MUSICS_MUST_BE_A_LIST = 'Musics must be a list!'
+MUSIC_ALREADY_EXISTS = 'Music already exists!'
+FILE_IS_REQUIRED = 'File is required!'
+INVALID_IMPORT_FORMAT = 'Import format must be ndjson or csv!'
+INVALID_JSON_LINE = 'Invalid JSON line!'
+INVALID_CSV_LINE = 'Invalid CSV line!'
+
+# Idempotency Messages
+IDEMPOTENCY_KEY_TOO_LONG = 'Idempotency-Key must have at most 255 characters!'
+IDEMPOTENCY_KEY_REUSED = 'Idempotency-Key already used with another request!'
+IDEMPOTENCY_KEY_IN_PROGRESS = 'A request with this Idempotency-Key is in progress, try again later!'
+
+# Job Messages
+JOB_NOT_FOUND = 'Job not found!'
+JOB_LEASE_EXPIRED = 'Job lease expired on its last attempt!'
 
 # Authorization Messages
 HEADER_AUTHORIZATION_NOT_PRESENT = 'Header Authorization not present!'
@@ -22,6 +44,9 @@ NO_BEARER_AUTHENTICATION_SCHEME = 'No Bearer HTTP authentication scheme!'
 NO_TOKEN_PROVIDED = 'No token provided!'
 INVALID_TOKEN = 'Invalid token!'
 TOKEN_EXPIRED = 'Log in again, your token has expired!'
+REFRESH_TOKEN_IS_REQUIRED = 'Refresh token is required!'
+INVALID_REFRESH_TOKEN = 'Invalid refresh token!'
+REFRESH_TOKEN_EXPIRED = 'Log in again, your refresh token has expired!'
 
 
 def get_invalid_date(date):
@@ -32,6 +57,18 @@ def get_invalid_time(time):
     return "'{}' is not a valid time!".format(time)
 
 
+def get_unknown_fields(fields):
+    return 'Unknown fields: {}!'.format(', '.join(fields))
+
+
+def get_too_long(field, max_length):
+    return '{} must have at most {} characters!'.format(field, max_length)
+
+
+def get_too_many_musics(limit):
+    return 'At most {} musics per request!'.format(limit)
+
+
 def get_email_already_registered(email):
     return 'The {} e-mail has already been registered!'.format(email)
 
@@ -0,0 +1,21 @@
+# Generated by Django 3.2.25 on 2026-10-17 19:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='music',
+            index=models.Index(fields=['user', 'deleted', 'artist', 'title', 'id'], name='musics_user_deleted_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='music',
+            index=models.Index(fields=['user', 'deleted', 'updated_at'], name='musics_user_deleted_upd_idx'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 3.2.25 on 2026-10-17 20:01
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0002_music_access_path_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MusicCounter',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, serialize=False, to='app.user')),
+                ('active_count', models.IntegerField(default=0)),
+                ('deleted_count', models.IntegerField(default=0)),
+            ],
+            options={
+                'db_table': 'music_counters',
+            },
+        ),
+    ]
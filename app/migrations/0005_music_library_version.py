@@ -0,0 +1,24 @@
+# Generated by Django 3.2.25 on 2026-10-17 20:16
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0004_refresh_tokens'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='musiccounter',
+            name='updated_at',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.AddField(
+            model_name='musiccounter',
+            name='version',
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 3.2.25 on 2026-10-17 20:36
+
+from django.db import migrations, models
+
+IDENTITY_FIELDS = ['user', 'title', 'artist', 'release_date', 'duration',
+                   'number_views', 'feat']
+
+
+def remove_duplicate_musics(apps, schema_editor):
+
+    Music = apps.get_model('app', 'Music')
+    MusicCounter = apps.get_model('app', 'MusicCounter')
+
+    duplicates = Music.objects.values(*IDENTITY_FIELDS).annotate(
+        total=models.Count('id')).filter(total__gt=1).order_by()
+
+    users = set()
+    for identity in duplicates:
+
+        identity.pop('total')
+        # Keeps the oldest active copy, or the oldest one when all are deleted.
+        ids = list(Music.objects.filter(**identity).order_by(
+            'deleted', 'id').values_list('id', flat=True))
+        Music.objects.filter(id__in=ids[1:]).delete()
+        users.add(identity['user'])
+
+    # Counters are rebuilt from the remaining musics on their next read.
+    MusicCounter.objects.filter(user__in=users).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0005_music_library_version'),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_musics, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='music',
+            constraint=models.UniqueConstraint(fields=('user', 'title', 'artist', 'release_date', 'duration', 'number_views', 'feat'), name='musics_identity_unique'),
+        ),
+    ]
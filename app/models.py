@@ -1,5 +1,13 @@
-from django.db import models
+import datetime
+import re
+import unicodedata
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import IntegrityError, connections, models, transaction
+from django.db.models import F, Q
+from django.utils import timezone
 from django.contrib.auth.models import AbstractUser
+from app import messages
+from app.cache import music_cache
 
 
 class User(AbstractUser):
@@ -14,10 +22,168 @@ class User(AbstractUser):
     REQUIRED_FIELDS = []
 
 
+MYSQL_DUPLICATE_ENTRY = 1062
+
+
+def _fold(identity):
+    return tuple(''.join(char for char in unicodedata.normalize('NFKD', value)
+                         if not unicodedata.combining(char)).casefold().rstrip()
+                 if isinstance(value, str) else value for value in identity)
+
+
+class MusicQuerySet(models.QuerySet):
+
+    def library(self, user, deleted=False):
+
+        # ``deleted__in`` keeps the flag as an indexable comparison; a bare
+        # ``deleted=...`` is compiled to ``NOT deleted`` on SQLite, which
+        # cannot seek the composite (user, deleted, ...) indexes.
+        return self.filter(user=user, deleted__in=[deleted])
+
+    def insert_or_get(self, **values):
+
+        music = self.model(**values)
+        (inserted, id) = self._insert_ignoring_conflicts([music])
+        if not inserted:
+            identity = {field: getattr(music, field) for field in Music.IDENTITY_FIELDS}
+            return (self.get(user=music.user, **identity), False)
+
+        music.pk = id
+        music._state.adding = False
+        music._state.db = self.db
+
+        return (music, True)
+
+    def ids_by_identity(self, user, identities, batch_size):
+
+        identities = list(identities)
+        ids = {}
+
+        for start in range(0, len(identities), batch_size):
+
+            batch = set(identities[start:start + batch_size])
+            rows = self.filter(
+                user=user, title__in={identity[0] for identity in batch}
+            ).order_by('id').values_list('id', *Music.IDENTITY_FIELDS)
+
+            folded = set()
+            for (id, *identity) in rows:
+                if tuple(identity) in batch:
+                    ids.setdefault(tuple(identity), id)
+                else:
+                    folded.add(_fold(identity))
+
+            # The unique index compares with the column collation, which may
+            # ignore case, accents or trailing spaces. Identities that only
+            # match a row that way are resolved by the database itself.
+            for identity in batch - ids.keys():
+                if _fold(identity) in folded:
+                    values = dict(zip(Music.IDENTITY_FIELDS, identity))
+                    id = self.filter(user=user, **values).order_by('id').values_list(
+                        'id', flat=True).first()
+                    if id is not None:
+                        ids[identity] = id
+
+        return ids
+
+    def bulk_insert_or_ignore(self, musics, batch_size=None):
+
+        fields = [field for field in self.model._meta.concrete_fields
+                  if not field.primary_key]
+        max_batch_size = connections[self.db].ops.bulk_batch_size(fields, musics)
+        batch_size = min(batch_size, max_batch_size) if batch_size else max_batch_size
+
+        return sum(self._insert_ignoring_conflicts(musics[start:start + batch_size])[0]
+                   for start in range(0, len(musics), batch_size))
+
+    def _insert_ignoring_conflicts(self, musics):
+
+        # One statement per batch: rows that collide with the identity
+        # constraint are skipped by the database instead of raising, so
+        # concurrent inserts of the same music cannot both succeed.
+        if not musics:
+            return (0, None)
+
+        connection = connections[self.db]
+        quote = connection.ops.quote_name
+        fields = [field for field in self.model._meta.concrete_fields
+                  if not field.primary_key]
+
+        columns = ', '.join(quote(field.column) for field in fields)
+        row = '({})'.format(', '.join(['%s'] * len(fields)))
+        params = [field.get_db_prep_save(field.pre_save(music, True), connection)
+                  for music in musics for field in fields]
+
+        sql = 'INTO {} ({}) VALUES {}'.format(
+            quote(self.model._meta.db_table), columns, ', '.join([row] * len(musics)))
+
+        if connection.vendor == 'mysql':
+            return self._insert_on_duplicate_key(connection, sql, params, len(musics))
+
+        target = ', '.join(quote(self.model._meta.get_field(field).column)
+                           for field in ['user'] + Music.IDENTITY_FIELDS)
+        sql = 'INSERT {} ON CONFLICT ({}) DO NOTHING'.format(sql, target)
+
+        if connection.vendor == 'postgresql':
+            sql = '{} RETURNING {}'.format(sql, quote(self.model._meta.pk.column))
+
+        with connection.cursor() as cursor:
+
+            cursor.execute(sql, params)
+
+            if connection.vendor == 'postgresql':
+                ids = [id for (id,) in cursor.fetchall()]
+                return (len(ids), ids[0] if ids else None)
+
+            return (cursor.rowcount, cursor.lastrowid)
+
+    def _insert_on_duplicate_key(self, connection, sql, params, rows):
+
+        # Unlike INSERT IGNORE, which also downgrades truncations and foreign
+        # key failures to warnings, these only absorb the duplicate key.
+        with connection.cursor() as cursor:
+
+            if rows == 1:
+                # The server reports no statement info for a single row and
+                # CLIENT_FOUND_ROWS counts an ignored duplicate as affected.
+                try:
+
+                    with transaction.atomic(using=self.db):
+                        cursor.execute('INSERT {}'.format(sql), params)
+                except IntegrityError as e:
+                    if e.args[0] != MYSQL_DUPLICATE_ENTRY:
+                        raise
+                    return (0, None)
+
+                return (1, cursor.lastrowid)
+
+            pk = connection.ops.quote_name(self.model._meta.pk.column)
+            cursor.execute('INSERT {} ON DUPLICATE KEY UPDATE {} = {}'.format(sql, pk, pk),
+                           params)
+
+            # rowcount includes the duplicates (Django connects with
+            # CLIENT_FOUND_ROWS); the statement info counts them apart.
+            duplicates = re.search(r'Duplicates: (\d+)', connection.connection.info())
+
+            return (rows - int(duplicates.group(1)), cursor.lastrowid)
+
+
 class Music(models.Model):
     class Meta:
         db_table = 'musics'
         ordering = ['artist', 'title']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'title', 'artist', 'release_date', 'duration',
+                        'number_views', 'feat'],
+                name='musics_identity_unique'),
+        ]
+        indexes = [
+            models.Index(fields=['user', 'deleted', 'artist', 'title', 'id'],
+                         name='musics_user_deleted_order_idx'),
+            models.Index(fields=['user', 'deleted', 'updated_at'],
+                         name='musics_user_deleted_upd_idx'),
+        ]
 
     title = models.CharField(max_length=100)
     artist = models.CharField(max_length=100)
@@ -30,3 +196,180 @@ class Music(models.Model):
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+
+    IDENTITY_FIELDS = ['title', 'artist', 'release_date', 'duration',
+                       'number_views', 'feat']
+
+    objects = MusicQuerySet.as_manager()
+
+    @classmethod
+    def identity(cls, values):
+
+        values = {'number_views': 0, 'feat': False, **values}
+
+        return tuple(values[field] for field in cls.IDENTITY_FIELDS)
+
+
+class MusicCounterManager(models.Manager):
+
+    def for_user(self, user):
+
+        try:
+
+            return self.get(user=user)
+        except self.model.DoesNotExist:
+            return self._create_from_musics(user)
+
+    def adjust(self, user, active=0, deleted=0):
+
+        updated = self.filter(user=user).update(
+            active_count=F('active_count') + active,
+            deleted_count=F('deleted_count') + deleted,
+            version=F('version') + 1,
+            updated_at=timezone.now()
+        )
+
+        if not updated:
+            self._create_from_musics(user, active, deleted)
+
+        # Retires the user's cached musics; bumped again on commit so a read
+        # made before the write is visible cannot keep the new version.
+        music_cache.bump(user.id)
+        transaction.on_commit(lambda: music_cache.bump(user.id))
+
+    def touch(self, user):
+        self.adjust(user)
+
+    def _create_from_musics(self, user, active=0, deleted=0):
+
+        try:
+
+            with transaction.atomic():
+                return self.create(
+                    user=user,
+                    active_count=Music.objects.library(user).count(),
+                    deleted_count=Music.objects.library(user, deleted=True).count()
+                )
+        except IntegrityError:
+            if active or deleted:
+                self.adjust(user, active, deleted)
+
+            return self.get(user=user)
+
+
+class MusicCounter(models.Model):
+    class Meta:
+        db_table = 'music_counters'
+
+    user = models.OneToOneField(User, on_delete=models.CASCADE,
+                                primary_key=True)
+    active_count = models.IntegerField(default=0)
+    deleted_count = models.IntegerField(default=0)
+    version = models.PositiveBigIntegerField(default=0)
+    updated_at = models.DateTimeField(default=timezone.now)
+
+    objects = MusicCounterManager()
+
+
+class RefreshToken(models.Model):
+    class Meta:
+        db_table = 'refresh_tokens'
+
+    token_hash = models.CharField(max_length=64, unique=True)
+    family = models.UUIDField(db_index=True)
+    revoked = models.BooleanField(default=False)
+    expires_at = models.DateTimeField()
+    user = models.ForeignKey(User, on_delete=models.CASCADE)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+
+class JobManager(models.Manager):
+
+    def enqueue(self, user, kind, payload=None, total=None, max_attempts=3):
+        return self.create(user=user, kind=kind, payload=payload or {},
+                           total=total, max_attempts=max_attempts)
+
+    def claim(self, worker, lease_seconds):
+
+        now = timezone.now()
+        expired = Q(status=Job.RUNNING, leased_until__lt=now)
+        exhausted = Q(attempts__gte=F('max_attempts'))
+
+        # A job whose worker died on its last attempt is failed here, or a
+        # job that crashes its worker would be claimed again forever.
+        self.filter(expired & exhausted).update(
+            status=Job.FAILED, error=messages.JOB_LEASE_EXPIRED, leased_until=None,
+            updated_at=now)
+
+        claimable = (Q(status=Job.QUEUED, run_after__lte=now) |
+                     (expired & ~exhausted))
+
+        # Leases are taken with a compare-and-set UPDATE instead of
+        # SELECT ... FOR UPDATE SKIP LOCKED, which SQLite does not have: the
+        # worker whose UPDATE still matches the claimable condition wins.
+        candidates = self.filter(claimable).order_by('run_after', 'id')
+        for id in candidates.values_list('id', flat=True)[:10]:
+            claimed = self.filter(claimable, id=id).update(
+                status=Job.RUNNING, worker=worker, attempts=F('attempts') + 1,
+                leased_until=now + datetime.timedelta(seconds=lease_seconds),
+                updated_at=now)
+            if claimed:
+                return self.get(id=id)
+
+        return None
+
+
+class Job(models.Model):
+    class Meta:
+        db_table = 'jobs'
+        indexes = [
+            models.Index(fields=['status', 'run_after'],
+                         name='jobs_status_run_after_idx'),
+        ]
+
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    DONE = 'done'
+    FAILED = 'failed'
+
+    user = models.ForeignKey(User, on_delete=models.CASCADE)
+    kind = models.CharField(max_length=50)
+    payload = models.JSONField(default=dict)
+    status = models.CharField(max_length=10, default=QUEUED)
+    progress = models.IntegerField(default=0)
+    total = models.IntegerField(null=True)
+    result = models.JSONField(null=True)
+    error = models.TextField(default='')
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=3)
+    run_after = models.DateTimeField(default=timezone.now)
+    leased_until = models.DateTimeField(null=True)
+    worker = models.CharField(max_length=100, default='')
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = JobManager()
+
+    def leased(self):
+        return Job.objects.filter(id=self.id, status=Job.RUNNING, worker=self.worker)
+
+
+class IdempotencyKey(models.Model):
+    class Meta:
+        db_table = 'idempotency_keys'
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'key'],
+                                    name='idempotency_keys_user_key_unique'),
+        ]
+
+    user = models.ForeignKey(User, on_delete=models.CASCADE)
+    key = models.CharField(max_length=255)
+    fingerprint = models.CharField(max_length=64)
+    status_code = models.PositiveSmallIntegerField(null=True)
+    response = models.JSONField(null=True, encoder=DjangoJSONEncoder)
+    expires_at = models.DateTimeField(db_index=True)
+    locked_until = models.DateTimeField(null=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
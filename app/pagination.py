@@ -0,0 +1,63 @@
+import base64
+import binascii
+import json
+from django.core.exceptions import FieldError
+from django.core.paginator import Paginator
+from django.db.models import Q
+from app import messages
+
+KEYSET_ORDERING = ['artist', 'title', 'id']
+
+
+class CountedPaginator(Paginator):
+
+    def __init__(self, object_list, per_page, count, **kwargs):
+
+        super().__init__(object_list, per_page, **kwargs)
+        self._count = count
+
+    @property
+    def count(self):
+        return self._count
+
+
+def encode_cursor(key):
+
+    raw = json.dumps(list(key), separators=(',', ':')).encode('utf-8')
+
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor):
+
+    try:
+
+        padding = '=' * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(cursor + padding)
+        (artist, title, id) = json.loads(raw.decode('utf-8'))
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError):
+        raise FieldError(messages.INVALID_CURSOR)
+
+    if not isinstance(artist, str) or not isinstance(title, str) or not isinstance(id, int):
+        raise FieldError(messages.INVALID_CURSOR)
+
+    return (artist, title, id)
+
+
+def keyset_page(queryset, cursor, size, key):
+
+    queryset = queryset.order_by(*KEYSET_ORDERING)
+
+    if cursor:
+        (artist, title, id) = decode_cursor(cursor)
+        queryset = queryset.filter(artist__gte=artist).filter(
+            Q(artist__gt=artist) |
+            Q(artist=artist, title__gt=title) |
+            Q(artist=artist, title=title, id__gt=id)
+        )
+
+    rows = list(queryset[:size + 1])
+    if len(rows) > size:
+        return (rows[:size], encode_cursor(key(rows[size - 1])))
+
+    return (rows, None)
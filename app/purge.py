@@ -0,0 +1,40 @@
+from django.conf import settings
+from django.db import transaction
+from app import jobs
+from app.cache import music_cache
+from app.models import Music, MusicCounter
+
+
+def purge_musics(user, older_than=None, batch_size=None, progress=None):
+
+    batch_size = batch_size or settings.MUSIC_PURGE['BATCH_SIZE']
+
+    musics = Music.objects.library(user, deleted=True)
+    if older_than is not None:
+        musics = musics.filter(updated_at__lt=older_than)
+
+    # Each batch is its own short transaction: rows are picked by primary
+    # key through the library indexes and removed with one DELETE, so no
+    # lock outlives a batch however large the trash is.
+    purged = 0
+    while True:
+
+        ids = list(musics.order_by().values_list('id', flat=True)[:batch_size])
+        if not ids:
+            return purged
+
+        with transaction.atomic():
+            (deleted, _) = Music.objects.library(user, deleted=True).filter(
+                id__in=ids).delete()
+            MusicCounter.objects.adjust(user, deleted=-deleted)
+
+        music_cache.delete_many(ids)
+
+        purged += deleted
+        if progress is not None:
+            progress(purged)
+
+
+@jobs.handler('purge_musics')
+def purge_musics_job(job):
+    return purge_musics(job.user, progress=lambda purged: jobs.report(job, purged))
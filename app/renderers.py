@@ -0,0 +1,55 @@
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_encoder = JSONEncoder()
+
+
+class FastJSONRenderer(JSONRenderer):
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+
+        if orjson is None or data is None or self.ensure_ascii or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # orjson encodes date, time and datetime natively with the same ISO
+        # strings as DRF's encoder; anything else goes through that encoder.
+        ret = orjson.dumps(data, default=_encoder.default,
+                           option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z)
+
+        if b'\xe2\x80\xa8' in ret or b'\xe2\x80\xa9' in ret:
+            ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(
+                b'\xe2\x80\xa9', b'\\u2029')
+
+        return ret
+
+
+# Export formats: the views stream the rows themselves, so only error bodies
+# and import reports reach render(), and those stay JSON whatever was
+# negotiated.
+class _StreamingFormatRenderer(FastJSONRenderer):
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+
+        response = (renderer_context or {}).get('response')
+        if response is not None:
+            response['Content-Type'] = FastJSONRenderer.media_type
+
+        return super().render(data, accepted_media_type, renderer_context)
+
+
+class NDJSONRenderer(_StreamingFormatRenderer):
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
+
+
+class CSVRenderer(_StreamingFormatRenderer):
+    media_type = 'text/csv'
+    format = 'csv'
@@ -1,5 +1,6 @@
+from django.utils import timezone
 from rest_framework import serializers
-from app.models import Music, User
+from app.models import Job, Music, User
 
 
 class BaseSerializer(serializers.ModelSerializer):
@@ -12,7 +13,8 @@ class BaseSerializer(serializers.ModelSerializer):
 
         return ret
 
-    def _format_datetime(self, datetime_str):
+    @staticmethod
+    def _format_datetime(datetime_str):
 
         if not datetime_str:
             return ''
@@ -35,3 +37,65 @@ class MusicSerializer(BaseSerializer):
     class Meta:
         model = Music
         exclude = ['deleted', 'user']
+
+
+class JobSerializer(BaseSerializer):
+    class Meta:
+        model = Job
+        fields = ['id', 'kind', 'status', 'progress', 'total', 'result',
+                  'error', 'attempts', 'created_at', 'updated_at']
+
+
+class MusicReadSerializer:
+
+    FIELDS = ['id', 'title', 'artist', 'release_date', 'duration',
+              'number_views', 'feat', 'created_at', 'updated_at']
+
+    def __init__(self, rows, fields=None):
+
+        self.rows = rows
+        self.fields = fields or self.FIELDS
+        self._formatters = [_READ_FORMATTERS.get(field) for field in self.fields]
+
+    @property
+    def data(self):
+        return [self.to_representation(row) for row in self.rows]
+
+    def to_representation(self, row):
+
+        ret = {}
+        for (field, formatter, value) in zip(self.fields, self._formatters, row):
+            if formatter is not None:
+                value = formatter(value)
+            ret[field] = value
+
+        return ret
+
+
+def _format_date_or_time(value):
+    return None if value is None else value.isoformat()
+
+
+def _format_datetime(value):
+
+    if value is None:
+        return ''
+
+    if timezone.is_aware(value):
+        representation = serializers.DateTimeField().to_representation(value)
+        return BaseSerializer._format_datetime(representation)
+
+    # Same output as BaseSerializer._format_datetime on the ISO string,
+    # including the minutes-only form when there are no microseconds.
+    if value.microsecond:
+        return value.isoformat(' ', 'milliseconds')
+
+    return value.isoformat(' ', 'minutes')
+
+
+_READ_FORMATTERS = {
+    'release_date': _format_date_or_time,
+    'duration': _format_date_or_time,
+    'created_at': _format_datetime,
+    'updated_at': _format_datetime,
+}
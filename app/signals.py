@@ -0,0 +1,22 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from app.authentication import user_cache
+from app.cache import music_cache
+from app.models import Music, User
+
+
+@receiver([post_save, post_delete], sender=User)
+def invalidate_cached_user(sender, instance, **kwargs):
+
+    user_cache.delete(instance.pk)
+    transaction.on_commit(lambda: user_cache.delete(instance.pk))
+
+
+# Queryset updates and deletes skip this signal; the views invalidating
+# through them clear music_cache themselves.
+@receiver(post_save, sender=Music)
+def invalidate_cached_music(sender, instance, **kwargs):
+
+    music_cache.delete_many([instance.pk])
+    transaction.on_commit(lambda: music_cache.delete_many([instance.pk]))
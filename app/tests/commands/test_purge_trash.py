@@ -0,0 +1,44 @@
+import datetime
+from io import StringIO
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from app.models import Music, MusicCounter
+from app.tests.factories import MusicFactory, create_user
+
+
+class PurgeTrashTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+
+        cls.db_user1 = create_user()
+        cls.db_user2 = create_user('2')
+
+        MusicFactory.create_batch(3, deleted=True, user=cls.db_user1)
+        MusicFactory.create_batch(2, deleted=True, user=cls.db_user2)
+        MusicFactory.create_batch(2, user=cls.db_user1)
+
+        expired = timezone.now() - datetime.timedelta(days=31)
+        Music.objects.filter(user=cls.db_user1).update(updated_at=expired)
+        Music.objects.filter(user=cls.db_user2).exclude(
+            id=Music.objects.filter(user=cls.db_user2).first().id).update(updated_at=expired)
+
+    def test_purge_trash_removes_only_expired_deleted_musics(self):
+
+        out = StringIO()
+
+        call_command('purge_trash', stdout=out)
+
+        self.assertEqual(0, Music.objects.library(self.db_user1, deleted=True).count())
+        self.assertEqual(2, Music.objects.library(self.db_user1).count())
+        self.assertEqual(1, Music.objects.library(self.db_user2, deleted=True).count())
+        self.assertEqual(0, MusicCounter.objects.for_user(self.db_user1).deleted_count)
+        self.assertEqual(1, MusicCounter.objects.for_user(self.db_user2).deleted_count)
+        self.assertIn('4 music(s) purged.', out.getvalue())
+
+    def test_purge_trash_with_days(self):
+
+        call_command('purge_trash', days=0, stdout=StringIO())
+
+        self.assertFalse(Music.objects.filter(deleted=True).exists())
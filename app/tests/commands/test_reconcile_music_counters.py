@@ -0,0 +1,45 @@
+from io import StringIO
+from django.core.management import call_command
+from django.test import TestCase
+from app.models import MusicCounter
+from app.tests.factories import MusicFactory, create_user
+
+
+class ReconcileMusicCountersTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+
+        cls.db_user1 = create_user()
+        cls.db_user2 = create_user('2')
+
+        MusicFactory.create_batch(4, user=cls.db_user1)
+        MusicFactory.create_batch(3, deleted=True, user=cls.db_user1)
+        MusicFactory.create_batch(2, user=cls.db_user2)
+
+    def test_reconcile_corrects_drifted_counters(self):
+
+        drifted = MusicCounter.objects.create(user=self.db_user1, active_count=10,
+                                              deleted_count=0)
+        out = StringIO()
+
+        call_command('reconcile_music_counters', stdout=out)
+
+        counter_user1 = MusicCounter.objects.get(user=self.db_user1)
+        counter_user2 = MusicCounter.objects.get(user=self.db_user2)
+
+        self.assertEqual(4, counter_user1.active_count)
+        self.assertEqual(3, counter_user1.deleted_count)
+        self.assertEqual(drifted.version + 1, counter_user1.version)
+        self.assertGreater(counter_user1.updated_at, drifted.updated_at)
+        self.assertEqual(2, counter_user2.active_count)
+        self.assertEqual(0, counter_user2.deleted_count)
+        self.assertIn('1 counter(s) corrected.', out.getvalue())
+
+    def test_reconcile_only_given_users(self):
+
+        call_command('reconcile_music_counters', user=[self.db_user2.id],
+                     stdout=StringIO())
+
+        self.assertFalse(MusicCounter.objects.filter(user=self.db_user1).exists())
+        self.assertTrue(MusicCounter.objects.filter(user=self.db_user2).exists())
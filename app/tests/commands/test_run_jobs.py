@@ -0,0 +1,25 @@
+from io import StringIO
+from django.core.management import call_command
+from django.test import TestCase
+from app import jobs
+from app.models import Job, Music, MusicCounter
+from app.tests.factories import MusicFactory, create_user
+
+
+class RunJobsTest(TestCase):
+
+    def test_run_jobs_once(self):
+
+        db_user = create_user()
+        MusicFactory.create_batch(3, deleted=True, user=db_user)
+        MusicFactory.create(user=db_user)
+        job = jobs.enqueue(db_user, 'purge_musics', total=3)
+        out = StringIO()
+
+        call_command('run_jobs', processes=1, once=True, stdout=out)
+
+        job.refresh_from_db()
+        self.assertEqual((Job.DONE, 3, 3), (job.status, job.result, job.progress))
+        self.assertEqual(1, Music.objects.filter(user=db_user).count())
+        self.assertEqual(0, MusicCounter.objects.for_user(db_user).deleted_count)
+        self.assertIn('Job {} (purge_musics)'.format(job.id), out.getvalue())
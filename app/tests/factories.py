@@ -9,7 +9,7 @@ class MusicFactory(factory.django.DjangoModelFactory):
     class Meta:
         model = Music
 
-    title = ' '.join(fake.words())
+    title = factory.Sequence(lambda n: '{} {}'.format(' '.join(fake.words()), n))
     artist = fake.name()
     release_date = fake.date()
     duration = fake.time()
@@ -0,0 +1,66 @@
+from rest_framework import status
+from django.test import TestCase
+from django.urls import reverse
+from parameterized import parameterized
+from app import messages
+from app.models import Job
+from app.tests import base_tdd
+from app.tests.factories import create_user
+
+client = base_tdd.get_client()
+
+
+class GetJobTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+
+        cls.db_user1 = create_user()
+        cls.header_user1 = base_tdd.generate_header(cls.db_user1)
+
+        cls.job_user1 = Job.objects.create(user=cls.db_user1, kind='purge_musics',
+                                           total=20, progress=5)
+        cls.job_user2 = Job.objects.create(user=create_user('2'), kind='purge_musics')
+
+    def test_get_job(self):
+
+        response = client.get(
+            reverse('get_job', kwargs={'id': self.job_user1.id}),
+            **self.header_user1
+        )
+
+        self.assertEqual(self.job_user1.id, response.data.get('id'))
+        self.assertEqual('purge_musics', response.data.get('kind'))
+        self.assertEqual(Job.QUEUED, response.data.get('status'))
+        self.assertEqual(5, response.data.get('progress'))
+        self.assertEqual(20, response.data.get('total'))
+        self.assertIsNone(response.data.get('result'))
+        self.assertTrue(base_tdd.match_date_time(response.data.get('created_at')))
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+
+    @parameterized.expand([
+        ('job_user2',),
+        (None,),
+    ])
+    def test_get_job_not_found(self, job):
+
+        id = getattr(self, job).id if job else 0
+
+        response = client.get(
+            reverse('get_job', kwargs={'id': id}),
+            **self.header_user1
+        )
+
+        self.assertEqual(messages.JOB_NOT_FOUND, response.data.get('message'))
+        self.assertEqual(status.HTTP_404_NOT_FOUND, response.status_code)
+
+    def test_get_job_without_authorization_header(self):
+
+        response = client.get(
+            reverse('get_job', kwargs={'id': self.job_user1.id})
+        )
+
+        expected_message = messages.HEADER_AUTHORIZATION_NOT_PRESENT
+
+        self.assertEqual(expected_message, response.data.get('message'))
+        self.assertEqual(status.HTTP_401_UNAUTHORIZED, response.status_code)
@@ -0,0 +1,152 @@
+import datetime
+import json
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from app import messages
+from app.models import Music, MusicCounter
+from app.tests import base_tdd
+from app.tests.factories import MusicFactory, create_user
+
+client = base_tdd.get_client()
+
+
+class BulkCreateMusicsTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+
+        cls.db_user1 = create_user()
+        cls.header_user1 = base_tdd.generate_header(cls.db_user1)
+
+    def _music_json(self, title='Title Test', **kwargs):
+        return {
+            'title': title,
+            'artist': 'Artist Test',
+            'release_date': str(datetime.date.today()),
+            'duration': '00:03:00',
+            **kwargs,
+        }
+
+    def _post(self, data):
+        return client.post(reverse('post_put_musics_bulk'), data=json.dumps(data),
+                           content_type='application/json', **self.header_user1)
+
+    def test_bulk_create_musics(self):
+
+        musics = [self._music_json('Title {}'.format(i), number_views=i, feat=i % 2 == 0)
+                  for i in range(3)]
+
+        MusicCounter.objects.for_user(self.db_user1)
+
+        # identity lookup, insert, counter update and id lookup inside one
+        # savepoint
+        with self.assertNumQueries(6):
+            response = self._post(musics)
+
+        self.assertEqual(status.HTTP_201_CREATED, response.status_code)
+        self.assertEqual([], response.data.get('errors'))
+
+        created = response.data.get('created')
+        self.assertEqual([0, 1, 2], [item.get('index') for item in created])
+
+        for (item, music) in zip(created, musics):
+
+            db_music = Music.objects.get(id=item.get('id'), user=self.db_user1)
+
+            self.assertEqual(music.get('title'), db_music.title)
+            self.assertEqual(music.get('number_views'), db_music.number_views)
+            self.assertEqual(music.get('feat'), db_music.feat)
+            self.assertFalse(db_music.deleted)
+            self.assertIsNotNone(db_music.created_at)
+
+        self.assertEqual(3, MusicCounter.objects.get(user=self.db_user1).active_count)
+
+    def test_bulk_create_reports_item_errors(self):
+
+        musics = [
+            self._music_json(),
+            self._music_json(title=''),
+            'music',
+            self._music_json(release_date='2000-13-01'),
+            self._music_json(number_views='many'),
+        ]
+
+        response = self._post(musics)
+
+        self.assertEqual(status.HTTP_201_CREATED, response.status_code)
+        self.assertEqual([0], [item.get('index') for item in response.data.get('created')])
+        self.assertEqual([
+            {'index': 1, 'message': messages.TITLE_IS_REQUIRED},
+            {'index': 2, 'message': messages.MUSIC_MUST_BE_AN_OBJECT},
+            {'index': 3, 'message': messages.get_invalid_date('2000-13-01')},
+            {'index': 4, 'message': messages.NUMBER_VIEWS_MUST_BE_INTEGER},
+        ], response.data.get('errors'))
+        self.assertEqual(1, Music.objects.filter(user=self.db_user1).count())
+
+    def test_bulk_create_reuses_existing_musics(self):
+
+        db_music = MusicFactory(user=self.db_user1, title='Title Test',
+                                artist='Artist Test', release_date=datetime.date.today(),
+                                duration=datetime.time(0, 3), number_views=0,
+                                feat=False)
+
+        response = self._post([self._music_json(), self._music_json('Other'),
+                               self._music_json('Other')])
+
+        created = response.data.get('created')
+
+        self.assertEqual(db_music.id, created[0].get('id'))
+        self.assertEqual(created[1].get('id'), created[2].get('id'))
+        self.assertEqual(2, Music.objects.filter(user=self.db_user1).count())
+        self.assertEqual(2, MusicCounter.objects.get(user=self.db_user1).active_count)
+
+    def test_bulk_create_titles_differing_in_case(self):
+
+        MusicFactory(user=self.db_user1, title='song', artist='Artist Test',
+                     release_date=datetime.date.today(), duration=datetime.time(0, 3),
+                     number_views=0, feat=False)
+
+        response = self._post([self._music_json('Song'), self._music_json('song')])
+
+        created = response.data.get('created')
+
+        self.assertEqual(status.HTTP_201_CREATED, response.status_code)
+        self.assertTrue(all(item.get('id') for item in created))
+
+    def test_bulk_create_numeric_title(self):
+
+        response = self._post([self._music_json(123), self._music_json(123)])
+
+        created = response.data.get('created')
+
+        self.assertEqual(status.HTTP_201_CREATED, response.status_code)
+        self.assertEqual(created[0].get('id'), created[1].get('id'))
+        self.assertEqual('123', Music.objects.get(id=created[0].get('id')).title)
+
+    def test_bulk_create_invalidates_negative_cache_entries(self):
+
+        next_id = (Music.objects.order_by('-id').values_list('id', flat=True).first() or 0) + 1
+        url = reverse('get_update_delete_music', kwargs={'id': next_id})
+
+        self.assertEqual(404, client.get(url, **self.header_user1).status_code)
+
+        self._post([self._music_json()])
+
+        self.assertEqual(200, client.get(url, **self.header_user1).status_code)
+
+    def test_bulk_create_without_list(self):
+
+        response = self._post(self._music_json())
+
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code)
+        self.assertEqual(messages.MUSICS_MUST_BE_A_LIST, response.data.get('message'))
+
+    @override_settings(MUSIC_BULK_LIMIT=2)
+    def test_bulk_create_too_many_musics(self):
+
+        response = self._post([self._music_json(str(i)) for i in range(3)])
+
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code)
+        self.assertEqual(messages.get_too_many_musics(2), response.data.get('message'))
+        self.assertFalse(Music.objects.filter(user=self.db_user1).exists())
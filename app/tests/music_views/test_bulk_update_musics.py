@@ -0,0 +1,137 @@
+import datetime
+import json
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from app import messages
+from app.models import Music, MusicCounter
+from app.tests import base_tdd
+from app.tests.factories import MusicFactory, create_user
+from app.views.music_views import music_cache
+
+client = base_tdd.get_client()
+
+
+class BulkUpdateMusicsTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+
+        cls.db_user1 = create_user()
+        cls.header_user1 = base_tdd.generate_header(cls.db_user1)
+
+        cls.musics = MusicFactory.create_batch(3, user=cls.db_user1)
+        cls.deleted_music = MusicFactory(deleted=True, user=cls.db_user1)
+        cls.other_music = MusicFactory(user=create_user('2'))
+
+    def setUp(self):
+        music_cache.clear()
+
+    def _music_json(self, id, title='Title Test', **kwargs):
+        return {
+            'id': id,
+            'title': title,
+            'artist': 'Artist Test',
+            'release_date': str(datetime.date.today()),
+            'duration': '00:03:00',
+            **kwargs,
+        }
+
+    def _put(self, data):
+        return client.put(reverse('post_put_musics_bulk'), data=json.dumps(data),
+                          content_type='application/json', **self.header_user1)
+
+    def test_bulk_update_musics(self):
+
+        MusicCounter.objects.for_user(self.db_user1)
+        musics = [self._music_json(music.id, 'Title {}'.format(i), number_views=i)
+                  for (i, music) in enumerate(self.musics)]
+
+        # ownership and identity lookups, update and counter touch inside
+        # one savepoint
+        with self.assertNumQueries(6):
+            response = self._put(musics)
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertEqual([], response.data.get('errors'))
+        self.assertEqual([{'index': i, 'id': music.id} for (i, music) in enumerate(self.musics)],
+                         response.data.get('updated'))
+
+        for (i, music) in enumerate(self.musics):
+
+            db_music = Music.objects.get(id=music.id)
+
+            self.assertEqual('Title {}'.format(i), db_music.title)
+            self.assertEqual(i, db_music.number_views)
+            self.assertEqual(music.feat, db_music.feat)
+            self.assertGreater(db_music.updated_at, music.updated_at)
+
+    def test_bulk_update_reports_item_errors(self):
+
+        response = self._put([
+            self._music_json(self.musics[0].id),
+            self._music_json(None),
+            self._music_json(self.musics[1].id, title=''),
+            self._music_json(self.deleted_music.id),
+            self._music_json(self.other_music.id),
+            self._music_json(999),
+            'music',
+        ])
+
+        self.assertEqual([{'index': 0, 'id': self.musics[0].id}], response.data.get('updated'))
+        self.assertEqual([
+            {'index': 1, 'message': messages.ID_IS_REQUIRED},
+            {'index': 2, 'message': messages.TITLE_IS_REQUIRED},
+            {'index': 3, 'message': messages.MUSIC_NOT_FOUND},
+            {'index': 4, 'message': messages.MUSIC_NOT_FOUND},
+            {'index': 5, 'message': messages.MUSIC_NOT_FOUND},
+            {'index': 6, 'message': messages.MUSIC_MUST_BE_AN_OBJECT},
+        ], response.data.get('errors'))
+
+        self.assertEqual(self.other_music.title,
+                         Music.objects.get(id=self.other_music.id).title)
+        self.assertEqual(self.deleted_music.title,
+                         Music.objects.get(id=self.deleted_music.id).title)
+
+    @override_settings(MUSIC_BULK_BATCH_SIZE=2)
+    def test_bulk_update_in_batches(self):
+
+        response = self._put([self._music_json(music.id, 'Title {}'.format(i))
+                              for (i, music) in enumerate(self.musics)])
+
+        self.assertEqual(3, len(response.data.get('updated')))
+        self.assertEqual(3, Music.objects.filter(title__startswith='Title ').count())
+
+    def test_bulk_update_rejects_existing_identities(self):
+
+        taken = self.musics[2]
+        taken_json = self._music_json(self.musics[0].id, taken.title,
+                                      artist=taken.artist,
+                                      release_date=str(taken.release_date),
+                                      duration=str(taken.duration),
+                                      number_views=taken.number_views,
+                                      feat=taken.feat)
+
+        response = self._put([
+            taken_json,
+            self._music_json(self.musics[1].id, 'Same'),
+            self._music_json(self.musics[2].id, 'Same'),
+        ])
+
+        self.assertEqual([{'index': 1, 'id': self.musics[1].id}], response.data.get('updated'))
+        self.assertEqual([
+            {'index': 0, 'message': messages.MUSIC_ALREADY_EXISTS},
+            {'index': 2, 'message': messages.MUSIC_ALREADY_EXISTS},
+        ], response.data.get('errors'))
+        self.assertEqual(self.musics[0].title, Music.objects.get(id=self.musics[0].id).title)
+
+    def test_bulk_update_invalidates_cached_musics(self):
+
+        url = reverse('get_update_delete_music', kwargs={'id': self.musics[0].id})
+        client.get(url, **self.header_user1)
+
+        self._put([self._music_json(self.musics[0].id)])
+
+        response = client.get(url, **self.header_user1)
+
+        self.assertEqual('Title Test', response.data.get('title'))
@@ -0,0 +1,173 @@
+import datetime
+import json
+from django.test import TestCase
+from django.urls import reverse
+from django.utils.http import http_date
+from app.models import Music
+from app.tests import base_tdd
+from app.tests.factories import MusicFactory, create_user
+from app.views.music_views import music_cache
+
+client = base_tdd.get_client()
+
+
+class ConditionalReadsTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+
+        cls.db_user1 = create_user()
+        cls.header_user1 = base_tdd.generate_header(cls.db_user1)
+        cls.header_user2 = base_tdd.generate_header(create_user('2'))
+
+        MusicFactory.create_batch(3, user=cls.db_user1)
+        MusicFactory.create_batch(2, deleted=True, user=cls.db_user1)
+
+    def setUp(self):
+        music_cache.clear()
+
+    def _music_json(self):
+        return {
+            'title': 'Title Test',
+            'artist': 'Artist Test',
+            'release_date': str(datetime.date.today()),
+            'duration': '00:03:00',
+        }
+
+    def test_get_musics_with_matching_etag(self):
+
+        response = client.get(reverse('get_post_musics'), **self.header_user1)
+        etag = response['ETag']
+
+        with self.assertNumQueries(1):
+            response = client.get(reverse('get_post_musics'),
+                                  HTTP_IF_NONE_MATCH=etag, **self.header_user1)
+
+        self.assertEqual(304, response.status_code)
+        self.assertEqual(etag, response['ETag'])
+        self.assertIn('Last-Modified', response)
+
+    def test_get_musics_etag_depends_on_query(self):
+
+        response = client.get(reverse('get_post_musics'), **self.header_user1)
+        etag = response['ETag']
+
+        response = client.get(reverse('get_post_musics'), {'size': 2},
+                              HTTP_IF_NONE_MATCH=etag, **self.header_user1)
+
+        self.assertEqual(200, response.status_code)
+        self.assertNotEqual(etag, response['ETag'])
+
+    def test_get_musics_etag_depends_on_user(self):
+
+        etag = client.get(reverse('get_post_musics'),
+                          **self.header_user1)['ETag']
+
+        response = client.get(reverse('get_post_musics'),
+                              HTTP_IF_NONE_MATCH=etag, **self.header_user2)
+
+        self.assertEqual(200, response.status_code)
+
+    def test_get_musics_by_cursor_with_matching_etag(self):
+
+        response = client.get(reverse('get_post_musics'), {'cursor': ''},
+                              **self.header_user1)
+
+        response = client.get(reverse('get_post_musics'), {'cursor': ''},
+                              HTTP_IF_NONE_MATCH=response['ETag'],
+                              **self.header_user1)
+
+        self.assertEqual(304, response.status_code)
+
+    def test_get_deleted_musics_with_matching_etag(self):
+
+        response = client.get(reverse('get_deleted_musics'), **self.header_user1)
+
+        response = client.get(reverse('get_deleted_musics'),
+                              HTTP_IF_NONE_MATCH=response['ETag'],
+                              **self.header_user1)
+
+        self.assertEqual(304, response.status_code)
+
+    def test_get_musics_etag_changes_after_writes(self):
+
+        music = Music.objects.library(self.db_user1).first()
+        url = reverse('get_update_delete_music', kwargs={'id': music.id})
+        music_json = self._music_json()
+
+        writes = [
+            lambda: client.put(url, data=json.dumps(music_json),
+                               content_type='application/json',
+                               **self.header_user1),
+            lambda: client.delete(url, **self.header_user1),
+            lambda: client.post(reverse('restore_deleted_musics'),
+                                data=json.dumps([{'id': music.id}]),
+                                content_type='application/json',
+                                **self.header_user1),
+            lambda: client.post(reverse('get_post_musics'),
+                                data=json.dumps(self._music_json()),
+                                content_type='application/json',
+                                **self.header_user1),
+        ]
+
+        for write in writes:
+
+            etag = client.get(reverse('get_post_musics'),
+                              **self.header_user1)['ETag']
+            write()
+
+            response = client.get(reverse('get_post_musics'),
+                                  HTTP_IF_NONE_MATCH=etag, **self.header_user1)
+
+            self.assertEqual(200, response.status_code)
+
+    def test_get_musics_with_if_modified_since(self):
+
+        response = client.get(reverse('get_post_musics'), **self.header_user1)
+
+        response = client.get(reverse('get_post_musics'),
+                              HTTP_IF_MODIFIED_SINCE=response['Last-Modified'],
+                              **self.header_user1)
+
+        self.assertEqual(304, response.status_code)
+
+    def test_get_music_by_id_with_matching_etag(self):
+
+        music = Music.objects.library(self.db_user1).first()
+        url = reverse('get_update_delete_music', kwargs={'id': music.id})
+
+        response = client.get(url, **self.header_user1)
+        self.assertEqual(http_date(music.updated_at.timestamp()),
+                         response['Last-Modified'])
+
+        response = client.get(url, HTTP_IF_NONE_MATCH=response['ETag'],
+                              **self.header_user1)
+
+        self.assertEqual(304, response.status_code)
+
+    def test_get_music_by_id_etag_depends_on_fields(self):
+
+        music = Music.objects.library(self.db_user1).first()
+        url = reverse('get_update_delete_music', kwargs={'id': music.id})
+
+        etag = client.get(url, **self.header_user1)['ETag']
+
+        response = client.get(url, {'fields': 'title'},
+                              HTTP_IF_NONE_MATCH=etag, **self.header_user1)
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(['title'], list(response.data))
+
+    def test_get_music_by_id_etag_changes_after_put(self):
+
+        music = Music.objects.library(self.db_user1).first()
+        url = reverse('get_update_delete_music', kwargs={'id': music.id})
+
+        etag = client.get(url, **self.header_user1)['ETag']
+
+        client.put(url, data=json.dumps(self._music_json()),
+                   content_type='application/json', **self.header_user1)
+
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag, **self.header_user1)
+
+        self.assertEqual(200, response.status_code)
@@ -1,11 +1,13 @@
+from unittest import mock
 from rest_framework import status
 from django.test import TestCase
 from django.urls import reverse
 from parameterized import parameterized
 from app import messages
-from app.models import Music
+from app.models import Music, MusicCounter
 from app.tests import base_tdd
 from app.tests.factories import MusicFactory, create_user
+from app.views import music_views
 
 client = base_tdd.get_client()
 
@@ -48,6 +50,31 @@ class DefinitiveDeleteMusicTest(TestCase):
         self.assertIsNone(response.data)
         self.assertEqual(status.HTTP_200_OK, response.status_code)
 
+    def test_definitive_delete_music_deleted_concurrently(self):
+
+        get_music = music_views._get_music_if_not_exists
+        MusicCounter.objects.for_user(self.db_user1)
+
+        # Another request deletes the music between this request's SELECT
+        # and its DELETE.
+        def get_music_then_delete(request, id):
+            music = get_music(request, id)
+            Music.objects.filter(id=id).delete()
+            MusicCounter.objects.adjust(self.db_user1, deleted=-1)
+            return music
+
+        with mock.patch.object(music_views, '_get_music_if_not_exists', get_music_then_delete):
+            response = client.delete(
+                reverse('definitive_delete_music', kwargs={'id': self.deleted_music.id}),
+                **self.header_user1
+            )
+
+        counter = MusicCounter.objects.for_user(self.db_user1)
+
+        self.assertEqual(messages.MUSIC_NOT_FOUND, response.data.get('message'))
+        self.assertEqual(status.HTTP_404_NOT_FOUND, response.status_code)
+        self.assertEqual((1, 0), (counter.active_count, counter.deleted_count))
+
     def test_definitive_delete_nonexistent_music_by_id(self):
 
         response = client.delete(
@@ -0,0 +1,148 @@
+import json
+from rest_framework import status
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from parameterized import parameterized
+from app import messages
+from app.models import Music, MusicCounter
+from app.tests import base_tdd
+from app.tests.factories import MusicFactory, create_user
+
+client = base_tdd.get_client()
+
+
+class DefinitiveDeleteMusicsTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+
+        cls.db_user1 = create_user()
+        cls.header_user1 = base_tdd.generate_header(cls.db_user1)
+
+        cls.db_user2 = create_user('2')
+        cls.header_user2 = base_tdd.generate_header(cls.db_user2)
+
+    def setUp(self):
+
+        self.deleted_musics = MusicFactory.create_batch(10, deleted=True,
+                                                        user=self.db_user1)
+        self.musics = MusicFactory.create_batch(1, user=self.db_user1)
+        MusicFactory.create_batch(10, deleted=True, user=self.db_user2)
+
+    def _ids(self, musics):
+        return json.dumps([{'id': music.id} for music in musics])
+
+    def test_definitive_delete_musics(self):
+
+        response = client.post(
+            reverse('definitive_delete_musics'),
+            data=self._ids(self.deleted_musics),
+            content_type='application/json',
+            **self.header_user1
+        )
+
+        count_musics_user1 = Music.objects.filter(user=self.db_user1).count()
+        count_deleted_musics_user2 = Music.objects.filter(deleted=True,
+                                                          user=self.db_user2).count()
+        counter = MusicCounter.objects.get(user=self.db_user1)
+
+        self.assertEqual(10, response.data)
+        self.assertEqual(1, count_musics_user1)
+        self.assertEqual(10, count_deleted_musics_user2)
+        self.assertEqual((1, 0), (counter.active_count, counter.deleted_count))
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+
+    @override_settings(MUSIC_BULK_BATCH_SIZE=3)
+    def test_definitive_delete_musics_in_chunks(self):
+
+        with CaptureQueriesContext(connection) as context:
+            response = client.post(
+                reverse('definitive_delete_musics'),
+                data=self._ids(self.deleted_musics),
+                content_type='application/json',
+                **self.header_user1
+            )
+
+        deletes = [query for query in context.captured_queries
+                   if query['sql'].startswith('DELETE') and 'musics' in query['sql']]
+
+        self.assertEqual(10, response.data)
+        self.assertEqual(4, len(deletes))
+
+    def test_definitive_delete_non_deleted_and_other_users_musics(self):
+
+        response = client.post(
+            reverse('definitive_delete_musics'),
+            data=self._ids(self.musics),
+            content_type='application/json',
+            **self.header_user1
+        )
+
+        self.assertEqual(0, response.data)
+
+        response = client.post(
+            reverse('definitive_delete_musics'),
+            data=self._ids(self.deleted_musics),
+            content_type='application/json',
+            **self.header_user2
+        )
+
+        self.assertEqual(0, response.data)
+        self.assertEqual(11, Music.objects.filter(user=self.db_user1).count())
+
+    def test_definitive_delete_musics_without_id_field(self):
+
+        response = client.post(
+            reverse('definitive_delete_musics'),
+            data=self._ids(self.deleted_musics).replace('id', 'none', 1),
+            content_type='application/json',
+            **self.header_user1
+        )
+
+        self.assertEqual(messages.ID_IS_REQUIRED, response.data.get('message'))
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code)
+
+    @parameterized.expand([
+        ({'id': 1}, messages.MUSICS_MUST_BE_A_LIST),
+        ([1, 2], messages.MUSIC_MUST_BE_AN_OBJECT),
+    ])
+    def test_definitive_delete_musics_with_invalid_payload(self, payload, expected_message):
+
+        response = client.post(
+            reverse('definitive_delete_musics'),
+            data=json.dumps(payload),
+            content_type='application/json',
+            **self.header_user1
+        )
+
+        self.assertEqual(expected_message, response.data.get('message'))
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code)
+
+    def test_definitive_delete_musics_with_non_numeric_ids(self):
+
+        ids = [{'id': 'abc'}, {'id': -1}, {'id': self.deleted_musics[0].id}]
+
+        response = client.post(
+            reverse('definitive_delete_musics'),
+            data=json.dumps(ids),
+            content_type='application/json',
+            **self.header_user1
+        )
+
+        self.assertEqual(1, response.data)
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+
+    def test_definitive_delete_musics_without_authorization_header(self):
+
+        response = client.post(
+            reverse('definitive_delete_musics'),
+            data=self._ids(self.deleted_musics),
+            content_type='application/json'
+        )
+
+        expected_message = messages.HEADER_AUTHORIZATION_NOT_PRESENT
+
+        self.assertEqual(expected_message, response.data.get('message'))
+        self.assertEqual(status.HTTP_401_UNAUTHORIZED, response.status_code)
@@ -1,12 +1,14 @@
+from unittest import mock
 from rest_framework import status
 from django.test import TestCase
 from django.urls import reverse
 from parameterized import parameterized
 from app import messages
-from app.models import Music
+from app.models import Music, MusicCounter
 from app.serializers import MusicSerializer
 from app.tests import base_tdd
 from app.tests.factories import MusicFactory, create_user
+from app.views import music_views
 
 client = base_tdd.get_client()
 
@@ -26,6 +28,31 @@ class DeleteMusicTest(TestCase):
         self.deleted_music = MusicFactory.create(deleted=True,
                                                  user=self.db_user1)
 
+    def test_delete_music_deleted_concurrently(self):
+
+        get_music = music_views._get_music_if_exists
+        MusicCounter.objects.for_user(self.db_user1)
+
+        # Another request moves the music to the trash between this request's
+        # SELECT and its UPDATE.
+        def get_music_then_delete(request, id):
+            music = get_music(request, id)
+            Music.objects.filter(id=id).update(deleted=True)
+            MusicCounter.objects.adjust(self.db_user1, active=-1, deleted=1)
+            return music
+
+        with mock.patch.object(music_views, '_get_music_if_exists', get_music_then_delete):
+            response = client.delete(
+                reverse('get_update_delete_music', kwargs={'id': self.music.id}),
+                **self.header_user1
+            )
+
+        counter = MusicCounter.objects.for_user(self.db_user1)
+
+        self.assertEqual(messages.MUSIC_NOT_FOUND, response.data.get('message'))
+        self.assertEqual(status.HTTP_404_NOT_FOUND, response.status_code)
+        self.assertEqual((0, 2), (counter.active_count, counter.deleted_count))
+
     def test_delete_music(self):
 
         response = client.delete(
@@ -1,9 +1,12 @@
 from rest_framework import status
-from django.test import TestCase
+from django.conf import settings
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from parameterized import parameterized
-from app import messages
-from app.models import Music
+from app import jobs, messages
+from app.models import Job, Music, MusicCounter
 from app.tests import base_tdd
 from app.tests.factories import MusicFactory, create_user
 
@@ -92,3 +95,34 @@ class EmptyListTest(TestCase):
 
         self.assertEqual(expected_message, response.data.get('message'))
         self.assertEqual(status.HTTP_401_UNAUTHORIZED, response.status_code)
+
+    @override_settings(MUSIC_PURGE=dict(settings.MUSIC_PURGE, BATCH_SIZE=3))
+    def test_empty_list_deletes_in_batches(self):
+
+        with CaptureQueriesContext(connection) as context:
+            response = client.delete(reverse('empty_list'), **self.header_user1)
+
+        deletes = [query['sql'] for query in context.captured_queries
+                   if query['sql'].startswith('DELETE FROM "musics"')]
+
+        self.assertEqual(10, response.data)
+        self.assertEqual(4, len(deletes))
+        self.assertEqual(0, MusicCounter.objects.for_user(self.db_user1).deleted_count)
+
+    @override_settings(MUSIC_PURGE=dict(settings.MUSIC_PURGE, INLINE_LIMIT=5))
+    def test_empty_list_with_large_trash(self):
+
+        response = client.delete(reverse('empty_list'), **self.header_user1)
+
+        job = Job.objects.get(id=response.data.get('id'))
+
+        self.assertEqual(('purge_musics', Job.QUEUED, 10), (job.kind, job.status, job.total))
+        self.assertEqual(self.db_user1, job.user)
+        self.assertEqual(10, Music.objects.library(self.db_user1, deleted=True).count())
+        self.assertEqual(status.HTTP_202_ACCEPTED, response.status_code)
+
+        jobs.run_next('test')
+
+        self.assertEqual(Job.DONE, Job.objects.get(id=job.id).status)
+        self.assertEqual(10, Job.objects.get(id=job.id).progress)
+        self.assertFalse(Music.objects.library(self.db_user1, deleted=True).exists())
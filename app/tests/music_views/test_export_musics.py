@@ -0,0 +1,140 @@
+import csv
+import io
+import json
+import tracemalloc
+from rest_framework import status
+from django.conf import settings
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from app import messages
+from app.models import Music
+from app.tests import base_tdd
+from app.tests.factories import MusicFactory, create_user
+
+client = base_tdd.get_client()
+
+
+def _content(response):
+    return b''.join(response.streaming_content).decode('utf-8')
+
+
+class ExportMusicsTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+
+        cls.db_user1 = create_user()
+        cls.header_user1 = base_tdd.generate_header(cls.db_user1)
+
+        MusicFactory.create_batch(7, user=cls.db_user1)
+        MusicFactory.create_batch(2, deleted=True, user=cls.db_user1)
+        MusicFactory.create_batch(3, user=create_user('2'))
+
+    @override_settings(MUSIC_EXPORT=dict(settings.MUSIC_EXPORT, CHUNK_SIZE=3))
+    def test_export_musics_ndjson(self):
+
+        response = client.get(reverse('export_musics'), **self.header_user1)
+
+        rows = [json.loads(line) for line in _content(response).splitlines()]
+        musics = Music.objects.library(self.db_user1).order_by('artist', 'title', 'id')
+
+        self.assertEqual([music.id for music in musics], [row['id'] for row in rows])
+        self.assertEqual(musics[0].title, rows[0]['title'])
+        self.assertEqual(musics[0].release_date.isoformat(), rows[0]['release_date'])
+        self.assertTrue(base_tdd.match_date_time(rows[0]['created_at']))
+        self.assertEqual('application/x-ndjson', response['Content-Type'])
+        self.assertIn('musics.ndjson', response['Content-Disposition'])
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+
+    def test_export_musics_csv(self):
+
+        response = client.get(reverse('export_musics'),
+                              {'format': 'csv', 'fields': 'id,title,feat'},
+                              **self.header_user1)
+
+        rows = list(csv.reader(io.StringIO(_content(response))))
+        music = Music.objects.library(self.db_user1).order_by('artist', 'title', 'id')[0]
+
+        self.assertEqual(['id', 'title', 'feat'], rows[0])
+        self.assertEqual([str(music.id), music.title, str(music.feat)], rows[1])
+        self.assertEqual(8, len(rows))
+        self.assertEqual('text/csv; charset=utf-8', response['Content-Type'])
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+
+    def test_export_musics_negotiated_by_accept_header(self):
+
+        for (media_type, export_format) in [('text/csv', 'csv'),
+                                            ('application/x-ndjson', 'ndjson')]:
+            response = client.get(reverse('export_musics'), HTTP_ACCEPT=media_type,
+                                  **self.header_user1)
+
+            self.assertIn(media_type, response['Content-Type'])
+            self.assertIn('musics.{}'.format(export_format), response['Content-Disposition'])
+            self.assertEqual(status.HTTP_200_OK, response.status_code)
+
+    def test_export_musics_errors_are_json(self):
+
+        response = client.get(reverse('export_musics'), {'fields': 'id,user'},
+                              HTTP_ACCEPT='text/csv', **self.header_user1)
+
+        self.assertEqual('application/json', response['Content-Type'])
+        self.assertEqual(messages.get_unknown_fields(['user']), response.json().get('message'))
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code)
+
+    def test_export_musics_with_unknown_fields(self):
+
+        response = client.get(reverse('export_musics'), {'fields': 'id,user'},
+                              **self.header_user1)
+
+        self.assertEqual(messages.get_unknown_fields(['user']), response.data.get('message'))
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code)
+
+    def test_export_musics_without_authorization_header(self):
+
+        response = client.get(reverse('export_musics'), {'format': 'csv'})
+
+        expected_message = messages.HEADER_AUTHORIZATION_NOT_PRESENT
+
+        self.assertEqual(expected_message, response.data.get('message'))
+        self.assertEqual(status.HTTP_401_UNAUTHORIZED, response.status_code)
+
+
+@override_settings(MUSIC_EXPORT={'CHUNK_SIZE': 50})
+class ExportMusicsMemoryTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+
+        cls.db_user1 = create_user()
+        cls.db_user2 = create_user('2')
+
+        Music.objects.bulk_create(MusicFactory.build_batch(400, user=cls.db_user1))
+        Music.objects.bulk_create(MusicFactory.build_batch(2000, user=cls.db_user2))
+
+    def _peak(self, user, export_format):
+
+        response = client.get(reverse('export_musics'), {'format': export_format},
+                              **base_tdd.generate_header(user))
+
+        tracemalloc.start()
+        try:
+
+            size = sum(len(chunk) for chunk in response.streaming_content)
+            (_, peak) = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        return (size, peak)
+
+    def test_export_memory_does_not_grow_with_library(self):
+
+        for export_format in ['ndjson', 'csv']:
+            # The first runs fill import, query and connection caches.
+            self._peak(self.db_user1, export_format)
+            self._peak(self.db_user2, export_format)
+
+            (small_size, small_peak) = self._peak(self.db_user1, export_format)
+            (large_size, large_peak) = self._peak(self.db_user2, export_format)
+
+            self.assertGreater(large_size, small_size * 4)
+            self.assertLess(large_peak, small_peak * 1.5)
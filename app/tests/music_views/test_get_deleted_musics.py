@@ -54,6 +54,28 @@ class GetDeletedMusicsTest(TestCase):
         self.assertEqual(len(db_musics), response.data.get('total'))
         self.assertEqual(status.HTTP_200_OK, response.status_code)
 
+    def test_get_deleted_musics_following_cursors(self):
+
+        contents = []
+        cursor = ''
+
+        while cursor is not None:
+
+            response = client.get(
+                reverse('get_deleted_musics'),
+                {'cursor': cursor, 'size': 3},
+                **self.header_user1
+            )
+
+            contents.extend(response.data.get('content'))
+            cursor = response.data.get('next_cursor')
+
+        db_musics = Music.objects.filter(deleted=True, user=self.db_user1)
+        serializer = MusicSerializer(
+            db_musics.order_by('artist', 'title', 'id'), many=True)
+
+        self.assertEqual(serializer.data, contents)
+
     @parameterized.expand([
         (base_tdd.INVALID_TOKEN_HEADER, messages.INVALID_TOKEN),
         (base_tdd.EMPTY_AUTHORIZATION_HEADER,
@@ -56,6 +56,42 @@ class GetMusicByIdTest(TestCase):
 
         self.assertEqual(status.HTTP_200_OK, response.status_code)
 
+    def test_get_music_by_id_with_fields(self):
+
+        response = client.get(
+            reverse(
+                'get_update_delete_music',
+                kwargs={
+                    'id': self.music.id
+                }
+            ),
+            {'fields': 'id,title'},
+            **self.header_user1
+        )
+
+        expected = {'id': self.music.id, 'title': self.music.title}
+
+        self.assertEqual(expected, response.data)
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+
+    def test_get_music_by_id_with_unknown_fields(self):
+
+        response = client.get(
+            reverse(
+                'get_update_delete_music',
+                kwargs={
+                    'id': self.music.id
+                }
+            ),
+            {'fields': 'id,deleted'},
+            **self.header_user1
+        )
+
+        expected_message = messages.get_unknown_fields(['deleted'])
+
+        self.assertEqual(expected_message, response.data.get('message'))
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code)
+
     def test_get_nonexistent_music_by_id(self):
 
         response = client.get(
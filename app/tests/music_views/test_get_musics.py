@@ -54,6 +54,117 @@ class GetMusicsTest(TestCase):
         self.assertEqual(len(db_musics), response.data.get('total'))
         self.assertEqual(status.HTTP_200_OK, response.status_code)
 
+    def test_get_musics_with_cursor(self):
+
+        response = client.get(
+            reverse('get_post_musics'),
+            {'cursor': '', 'size': 4},
+            **self.header_user1
+        )
+
+        db_musics = Music.objects.filter(deleted=False, user=self.db_user1)
+        serializer = MusicSerializer(
+            db_musics.order_by('artist', 'title', 'id')[:4], many=True)
+
+        self.assertEqual(serializer.data, response.data.get('content'))
+        self.assertIsNotNone(response.data.get('next_cursor'))
+        self.assertIsNone(response.data.get('total'))
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+
+    def test_get_musics_following_cursors(self):
+
+        contents = []
+        cursor = ''
+
+        while cursor is not None:
+
+            response = client.get(
+                reverse('get_post_musics'),
+                {'cursor': cursor, 'size': 4},
+                **self.header_user1
+            )
+
+            contents.extend(response.data.get('content'))
+            cursor = response.data.get('next_cursor')
+
+        db_musics = Music.objects.filter(deleted=False, user=self.db_user1)
+        serializer = MusicSerializer(
+            db_musics.order_by('artist', 'title', 'id'), many=True)
+
+        self.assertEqual(serializer.data, contents)
+
+    @parameterized.expand([
+        ('invalid', messages.INVALID_CURSOR, 5),
+        ('', messages.INVALID_SIZE, 0),
+        ('', messages.INVALID_SIZE, 'a'),
+    ])
+    def test_get_musics_with_invalid_cursor_params(self, cursor, expected_message, size):
+
+        response = client.get(
+            reverse('get_post_musics'),
+            {'cursor': cursor, 'size': size},
+            **self.header_user1
+        )
+
+        self.assertEqual(expected_message, response.data.get('message'))
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code)
+
+    def test_get_musics_with_fields(self):
+
+        response = client.get(
+            reverse('get_post_musics'),
+            {'fields': 'title,id,artist'},
+            **self.header_user1
+        )
+
+        db_musics = Music.objects.filter(deleted=False, user=self.db_user1)
+        expected = [{'id': music.id, 'title': music.title, 'artist': music.artist}
+                    for music in db_musics[:5]]
+
+        self.assertEqual(expected, response.data.get('content'))
+        self.assertEqual(len(db_musics), response.data.get('total'))
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+
+    def test_get_musics_with_fields_following_cursors(self):
+
+        contents = []
+        cursor = ''
+
+        while cursor is not None:
+
+            response = client.get(
+                reverse('get_post_musics'),
+                {'cursor': cursor, 'size': 4, 'fields': 'duration'},
+                **self.header_user1
+            )
+
+            contents.extend(response.data.get('content'))
+            cursor = response.data.get('next_cursor')
+
+        db_musics = Music.objects.filter(deleted=False, user=self.db_user1)
+        expected = [{'duration': music.duration.isoformat()}
+                    for music in db_musics.order_by('artist', 'title', 'id')]
+
+        self.assertEqual(expected, contents)
+
+    @parameterized.expand([
+        ({'fields': 'id,deleted,user'},),
+        ({'fields': 'id,deleted', 'cursor': ''},),
+    ])
+    def test_get_musics_with_unknown_fields(self, params):
+
+        response = client.get(
+            reverse('get_post_musics'),
+            params,
+            **self.header_user1
+        )
+
+        unknown = [field for field in params['fields'].split(',') if field != 'id']
+
+        self.assertEqual(messages.get_unknown_fields(unknown),
+                         response.data.get('message'))
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code)
+
     @parameterized.expand([
         (base_tdd.INVALID_TOKEN_HEADER, messages.INVALID_TOKEN),
         (base_tdd.EMPTY_AUTHORIZATION_HEADER,
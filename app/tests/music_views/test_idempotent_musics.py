@@ -0,0 +1,175 @@
+import datetime
+import json
+from io import StringIO
+from unittest import mock
+from rest_framework import status
+from django.conf import settings
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from app import idempotency, messages
+from app.models import IdempotencyKey, Music
+from app.tests import base_tdd
+from app.tests.factories import create_user
+
+client = base_tdd.get_client()
+
+MUSIC = {'title': 'Title', 'artist': 'Artist', 'release_date': '2021-01-02',
+         'duration': '00:03:25'}
+
+
+class IdempotentMusicsTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+
+        cls.db_user1 = create_user()
+        cls.header_user1 = base_tdd.generate_header(cls.db_user1)
+
+        cls.db_user2 = create_user('2')
+        cls.header_user2 = base_tdd.generate_header(cls.db_user2)
+
+    def _post(self, url, data, key='key-1', header=None):
+        return client.post(url, data=json.dumps(data), content_type='application/json',
+                           HTTP_IDEMPOTENCY_KEY=key, **(header or self.header_user1))
+
+    def test_post_music_is_replayed(self):
+
+        response = self._post(reverse('get_post_musics'), MUSIC)
+
+        with CaptureQueriesContext(connection) as context:
+            replayed = self._post(reverse('get_post_musics'), MUSIC)
+
+        musics_queries = [query['sql'] for query in context.captured_queries
+                          if '"musics"' in query['sql']]
+
+        self.assertEqual(response.data, replayed.data)
+        self.assertEqual(status.HTTP_201_CREATED, replayed.status_code)
+        self.assertEqual('true', replayed['Idempotent-Replayed'])
+        self.assertFalse(response.has_header('Idempotent-Replayed'))
+        self.assertEqual([], musics_queries)
+        self.assertEqual(1, Music.objects.filter(user=self.db_user1).count())
+
+    def test_bulk_post_musics_is_replayed(self):
+
+        musics = [MUSIC, dict(MUSIC, title='Title 2'), {}]
+
+        response = self._post(reverse('post_put_musics_bulk'), musics)
+        replayed = self._post(reverse('post_put_musics_bulk'), musics)
+
+        self.assertEqual(response.data, replayed.data)
+        self.assertEqual('true', replayed['Idempotent-Replayed'])
+        self.assertEqual(2, Music.objects.filter(user=self.db_user1).count())
+
+    def test_client_errors_are_replayed(self):
+
+        self._post(reverse('get_post_musics'), {})
+
+        with mock.patch('app.views.music_views._post_music') as post_music:
+            replayed = self._post(reverse('get_post_musics'), {})
+
+        post_music.assert_not_called()
+        self.assertEqual(messages.TITLE_IS_REQUIRED, replayed.data.get('message'))
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, replayed.status_code)
+
+    def test_key_reused_with_another_request(self):
+
+        self._post(reverse('get_post_musics'), MUSIC)
+
+        response = self._post(reverse('get_post_musics'), dict(MUSIC, title='Other'))
+
+        self.assertEqual(messages.IDEMPOTENCY_KEY_REUSED, response.data.get('message'))
+        self.assertEqual(status.HTTP_422_UNPROCESSABLE_ENTITY, response.status_code)
+
+    def test_keys_are_per_user(self):
+
+        self._post(reverse('get_post_musics'), MUSIC)
+
+        response = self._post(reverse('get_post_musics'), MUSIC, header=self.header_user2)
+
+        self.assertFalse(response.has_header('Idempotent-Replayed'))
+        self.assertEqual(1, Music.objects.filter(user=self.db_user2).count())
+
+    def test_expired_key_runs_again(self):
+
+        self._post(reverse('delete_musics'), [])
+        IdempotencyKey.objects.update(expires_at=timezone.now())
+
+        response = self._post(reverse('delete_musics'), [])
+
+        self.assertFalse(response.has_header('Idempotent-Replayed'))
+        self.assertEqual(1, IdempotencyKey.objects.count())
+
+    def test_key_too_long(self):
+
+        response = self._post(reverse('get_post_musics'), MUSIC, key='k' * 256)
+
+        self.assertEqual(messages.IDEMPOTENCY_KEY_TOO_LONG, response.data.get('message'))
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code)
+        self.assertFalse(Music.objects.exists())
+
+    def test_concurrent_duplicate_waits_for_first_response(self):
+
+        record = self._in_progress_record()
+
+        def finish(seconds):
+            IdempotencyKey.objects.filter(id=record.id).update(
+                status_code=status.HTTP_201_CREATED, response={'id': 1})
+
+        with mock.patch.object(idempotency.time, 'sleep', side_effect=finish):
+            response = self._post(reverse('get_post_musics'), MUSIC)
+
+        self.assertEqual({'id': 1}, response.data)
+        self.assertEqual('true', response['Idempotent-Replayed'])
+        self.assertEqual(1, Music.objects.count())
+
+    @override_settings(IDEMPOTENCY=dict(settings.IDEMPOTENCY, WAIT=0))
+    def test_concurrent_duplicate_in_progress(self):
+
+        self._in_progress_record()
+
+        response = self._post(reverse('get_post_musics'), MUSIC)
+
+        self.assertEqual(messages.IDEMPOTENCY_KEY_IN_PROGRESS, response.data.get('message'))
+        self.assertEqual(status.HTTP_409_CONFLICT, response.status_code)
+        self.assertEqual(1, Music.objects.count())
+
+    def test_in_progress_with_expired_lock_runs_again(self):
+
+        record = self._in_progress_record()
+        Music.objects.all().delete()
+        IdempotencyKey.objects.update(locked_until=timezone.now() - datetime.timedelta(seconds=1))
+
+        response = self._post(reverse('get_post_musics'), MUSIC)
+        record.refresh_from_db()
+
+        self.assertFalse(response.has_header('Idempotent-Replayed'))
+        self.assertEqual(status.HTTP_201_CREATED, response.status_code)
+        self.assertEqual((status.HTTP_201_CREATED, None), (record.status_code, record.locked_until))
+        self.assertEqual(1, Music.objects.count())
+
+    def test_clear_idempotency_keys(self):
+
+        self._post(reverse('get_post_musics'), MUSIC)
+        self._post(reverse('get_post_musics'), MUSIC, key='key-2')
+        IdempotencyKey.objects.filter(key='key-1').update(
+            expires_at=timezone.now() - datetime.timedelta(seconds=1))
+        out = StringIO()
+
+        call_command('clear_idempotency_keys', stdout=out)
+
+        self.assertEqual(['key-2'], list(IdempotencyKey.objects.values_list('key', flat=True)))
+        self.assertIn('1 idempotency key(s) deleted.', out.getvalue())
+
+    def _in_progress_record(self):
+
+        # A stored key without a status code is a request still running.
+        self._post(reverse('get_post_musics'), MUSIC)
+        IdempotencyKey.objects.update(
+            status_code=None, response=None,
+            locked_until=timezone.now() + datetime.timedelta(seconds=60))
+
+        return IdempotencyKey.objects.get()
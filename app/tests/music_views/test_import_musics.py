@@ -0,0 +1,189 @@
+import json
+import tempfile
+from unittest import mock
+from rest_framework import status
+from django.conf import settings
+from django.core.files.storage import FileSystemStorage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from app import imports, jobs, messages
+from app.models import Job, Music, MusicCounter
+from app.tests import base_tdd
+from app.tests.factories import MusicFactory, create_user
+
+client = base_tdd.get_client()
+
+
+def _music(title, **kwargs):
+    return {'title': title, 'artist': 'Artist', 'release_date': '2021-01-02',
+            'duration': '00:03:25', **kwargs}
+
+
+def _ndjson(*lines):
+    return '\n'.join(line if isinstance(line, str) else json.dumps(line)
+                     for line in lines).encode('utf-8')
+
+
+class ImportMusicsTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+
+        cls.db_user1 = create_user()
+        cls.header_user1 = base_tdd.generate_header(cls.db_user1)
+
+        MusicFactory.create(user=cls.db_user1, **_music('Existing', number_views=0, feat=False))
+
+    def _import(self, content, import_format='ndjson', **header):
+
+        upload = SimpleUploadedFile('musics.{}'.format(import_format), content)
+
+        return client.post('{}?format={}'.format(reverse('import_musics'), import_format),
+                           {'file': upload}, **(header or self.header_user1))
+
+    def test_import_musics_ndjson(self):
+
+        content = _ndjson(
+            _music('Title 1', number_views=10, feat=True),
+            '{"title": ',
+            '',
+            _music('Title 2'),
+            _music('', artist='Artist 2'),
+            _music('Title 2'),
+            _music('Existing'),
+            [1, 2],
+        )
+
+        response = self._import(content)
+
+        expected_errors = [
+            {'line': 2, 'message': messages.INVALID_JSON_LINE},
+            {'line': 5, 'message': messages.TITLE_IS_REQUIRED},
+            {'line': 8, 'message': messages.MUSIC_MUST_BE_AN_OBJECT},
+        ]
+        music = Music.objects.get(user=self.db_user1, title='Title 1')
+
+        self.assertEqual({'imported': 2, 'existing': 2, 'failed': 3,
+                          'errors': expected_errors}, response.data)
+        self.assertEqual((10, True), (music.number_views, music.feat))
+        self.assertEqual(3, Music.objects.library(self.db_user1).count())
+        self.assertEqual(3, MusicCounter.objects.for_user(self.db_user1).active_count)
+        self.assertEqual(status.HTTP_201_CREATED, response.status_code)
+
+    def test_import_musics_csv(self):
+
+        content = '\n'.join([
+            'id,title,artist,release_date,duration,number_views,feat',
+            '7,Title 1,Artist,2021-01-02,00:03:25,10,True',
+            ',Title 2,Artist,2021-01-02,00:03:25,,false',
+            ',Title 3,Artist,2021-13-02,00:03:25,,',
+            ',"Title, 4",Artist,2021-01-02,00:03:25,x,',
+        ]).encode('utf-8')
+
+        response = self._import(content, 'csv')
+
+        expected_errors = [
+            {'line': 4, 'message': messages.get_invalid_date('2021-13-02')},
+            {'line': 5, 'message': messages.NUMBER_VIEWS_MUST_BE_INTEGER},
+        ]
+        musics = Music.objects.library(self.db_user1).filter(
+            title__in=['Title 1', 'Title 2']).order_by('title')
+
+        self.assertEqual(expected_errors, response.data.get('errors'))
+        self.assertEqual(2, response.data.get('imported'))
+        self.assertEqual([(10, True), (0, False)],
+                         [(music.number_views, music.feat) for music in musics])
+        self.assertEqual(status.HTTP_201_CREATED, response.status_code)
+
+    def test_import_musics_csv_with_invalid_encoding(self):
+
+        content = 'title,artist,release_date,duration\nT\xe9,A,2021-01-02,00:03:25\n'.encode('latin-1')
+
+        response = self._import(content, 'csv')
+
+        self.assertEqual([{'line': 2, 'message': messages.INVALID_CSV_LINE}],
+                         response.data.get('errors'))
+        self.assertEqual(0, response.data.get('imported'))
+
+    def test_import_musics_format_from_upload(self):
+
+        content = 'title,artist,release_date,duration\nTitle 1,Artist,2021-01-02,00:03:25\n'
+
+        for upload in [SimpleUploadedFile('musics.csv', content.encode('utf-8')),
+                       SimpleUploadedFile('musics', content.encode('utf-8'), 'text/csv')]:
+            response = client.post(reverse('import_musics'), {'file': upload},
+                                   **self.header_user1)
+
+            self.assertEqual([], response.data.get('errors'))
+            self.assertEqual(status.HTTP_201_CREATED, response.status_code)
+
+    def test_import_musics_with_unknown_format(self):
+
+        upload = SimpleUploadedFile('musics.txt', _ndjson(_music('Title 1')))
+        responses = [
+            client.post(reverse('import_musics'), {'file': upload}, **self.header_user1),
+            self._import(_ndjson(_music('Title 1')), 'json'),
+        ]
+
+        for response in responses:
+            self.assertEqual(messages.INVALID_IMPORT_FORMAT, response.data.get('message'))
+            self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code)
+
+    @override_settings(MUSIC_IMPORT=dict(settings.MUSIC_IMPORT, BATCH_SIZE=2, MAX_ERRORS=1))
+    def test_import_musics_in_batches(self):
+
+        content = _ndjson(*[_music('Title {}'.format(n)) for n in range(5)], '{', '{')
+
+        with CaptureQueriesContext(connection) as context:
+            response = self._import(content)
+
+        inserts = [query['sql'] for query in context.captured_queries
+                   if query['sql'].startswith('INSERT INTO "musics"')]
+
+        self.assertEqual(3, len(inserts))
+        self.assertEqual(5, response.data.get('imported'))
+        self.assertEqual(2, response.data.get('failed'))
+        self.assertEqual([{'line': 6, 'message': messages.INVALID_JSON_LINE}],
+                         response.data.get('errors'))
+
+    @override_settings(MUSIC_IMPORT=dict(settings.MUSIC_IMPORT, INLINE_LIMIT=10))
+    def test_import_large_file_through_job(self):
+
+        storage = FileSystemStorage(location=tempfile.mkdtemp())
+        content = _ndjson(_music('Title 1'), _music('Title 2'))
+
+        with mock.patch.object(imports, 'import_storage', storage):
+
+            response = self._import(content)
+            job = Job.objects.get(id=response.data.get('id'))
+
+            self.assertEqual(status.HTTP_202_ACCEPTED, response.status_code)
+            self.assertEqual(1, Music.objects.library(self.db_user1).count())
+
+            jobs.run_next('test')
+
+        job.refresh_from_db()
+
+        self.assertEqual(Job.DONE, job.status)
+        self.assertEqual(2, job.result['imported'])
+        self.assertEqual(3, Music.objects.library(self.db_user1).count())
+        self.assertEqual(([], []), storage.listdir(''))
+
+    def test_import_musics_without_file(self):
+
+        response = client.post(reverse('import_musics'), {}, **self.header_user1)
+
+        self.assertEqual(messages.FILE_IS_REQUIRED, response.data.get('message'))
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code)
+
+    def test_import_musics_without_authorization_header(self):
+
+        response = client.post(reverse('import_musics'))
+
+        expected_message = messages.HEADER_AUTHORIZATION_NOT_PRESENT
+
+        self.assertEqual(expected_message, response.data.get('message'))
+        self.assertEqual(status.HTTP_401_UNAUTHORIZED, response.status_code)
@@ -0,0 +1,132 @@
+import datetime
+import json
+from django.test import TestCase
+from django.urls import reverse
+from app.models import Music, MusicCounter
+from app.tests import base_tdd
+from app.tests.factories import MusicFactory, create_user
+from app.views.music_views import music_cache
+
+client = base_tdd.get_client()
+
+
+class MusicCacheTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+
+        cls.db_user1 = create_user()
+        cls.header_user1 = base_tdd.generate_header(cls.db_user1)
+        cls.header_user2 = base_tdd.generate_header(create_user('2'))
+
+        cls.music = MusicFactory(user=cls.db_user1)
+        cls.deleted_music = MusicFactory(deleted=True, user=cls.db_user1)
+
+    def setUp(self):
+
+        music_cache.clear()
+        self.url = reverse('get_update_delete_music', kwargs={'id': self.music.id})
+
+    def _music_json(self):
+        return {
+            'title': 'Title Test',
+            'artist': 'Artist Test',
+            'release_date': str(datetime.date.today()),
+            'duration': '00:03:00',
+        }
+
+    def test_repeated_reads_are_served_from_cache(self):
+
+        response = client.get(self.url, **self.header_user1)
+
+        with self.assertNumQueries(0):
+            cached = client.get(self.url, **self.header_user1)
+
+        self.assertEqual(200, cached.status_code)
+        self.assertEqual(response.data, cached.data)
+
+        with self.assertNumQueries(0):
+            cached = client.get(self.url, {'fields': 'title'}, **self.header_user1)
+
+        self.assertEqual({'title': self.music.title}, cached.data)
+
+    def test_write_from_another_process_retires_cached_music(self):
+
+        client.get(self.url, **self.header_user1)
+
+        # A write handled by another worker process does not delete this
+        # entry, but it does bump the version kept in the cache backend.
+        Music.objects.filter(id=self.music.id).update(deleted=True)
+        MusicCounter.objects.adjust(self.db_user1, active=-1, deleted=1)
+
+        response = client.get(self.url, **self.header_user1)
+
+        self.assertEqual(404, response.status_code)
+
+    def test_cached_music_is_not_served_to_other_users(self):
+
+        client.get(self.url, **self.header_user1)
+        response = client.get(self.url, **self.header_user2)
+
+        self.assertEqual(404, response.status_code)
+
+    def test_missing_music_is_negatively_cached(self):
+
+        url = reverse('get_update_delete_music', kwargs={'id': 999})
+
+        client.get(url, **self.header_user1)
+
+        with self.assertNumQueries(0):
+            response = client.get(url, **self.header_user1)
+
+        self.assertEqual(404, response.status_code)
+
+    def test_created_music_replaces_negative_entry(self):
+
+        next_id = Music.objects.order_by('-id').first().id + 1
+        url = reverse('get_update_delete_music', kwargs={'id': next_id})
+
+        self.assertEqual(404, client.get(url, **self.header_user1).status_code)
+
+        response = client.post(reverse('get_post_musics'),
+                               data=json.dumps(self._music_json()),
+                               content_type='application/json',
+                               **self.header_user1)
+        self.assertEqual(next_id, response.data.get('id'))
+
+        self.assertEqual(200, client.get(url, **self.header_user1).status_code)
+
+    def test_put_invalidates_cached_music(self):
+
+        client.get(self.url, **self.header_user1)
+        client.put(self.url, data=json.dumps(self._music_json()),
+                   content_type='application/json', **self.header_user1)
+
+        response = client.get(self.url, **self.header_user1)
+
+        self.assertEqual('Title Test', response.data.get('title'))
+
+    def test_delete_and_restore_invalidate_cached_music(self):
+
+        client.get(self.url, **self.header_user1)
+        client.delete(self.url, **self.header_user1)
+
+        self.assertEqual(404, client.get(self.url, **self.header_user1).status_code)
+
+        client.post(reverse('restore_deleted_musics'),
+                    data=json.dumps([{'id': self.music.id}]),
+                    content_type='application/json', **self.header_user1)
+
+        self.assertEqual(200, client.get(self.url, **self.header_user1).status_code)
+
+    def test_definitive_delete_invalidates_cached_music(self):
+
+        url = reverse('get_update_delete_music', kwargs={'id': self.deleted_music.id})
+
+        client.get(url, **self.header_user1)
+        client.delete(reverse('definitive_delete_music',
+                              kwargs={'id': self.deleted_music.id}),
+                      **self.header_user1)
+
+        self.assertIsNone(music_cache.backend.get(
+            music_cache.key(self.deleted_music.id)))
@@ -0,0 +1,95 @@
+import datetime
+import json
+from django.test import TestCase
+from django.urls import reverse
+from app.authentication import user_cache
+from app.models import Music, MusicCounter
+from app.tests import base_tdd
+from app.tests.factories import MusicFactory, create_user
+
+client = base_tdd.get_client()
+
+
+class MusicCountersTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+
+        cls.db_user1 = create_user()
+        cls.header_user1 = base_tdd.generate_header(cls.db_user1)
+
+        MusicFactory.create_batch(3, user=cls.db_user1)
+        MusicFactory.create_batch(2, deleted=True, user=cls.db_user1)
+
+    def _assert_counter_matches_musics(self):
+
+        counter = MusicCounter.objects.get(user=self.db_user1)
+
+        self.assertEqual(Music.objects.library(self.db_user1).count(),
+                         counter.active_count)
+
+        self.assertEqual(Music.objects.library(self.db_user1, deleted=True).count(),
+                         counter.deleted_count)
+
+    def test_counter_is_created_from_existing_musics(self):
+
+        response = client.get(
+            reverse('get_post_musics'),
+            **self.header_user1
+        )
+
+        self.assertEqual(3, response.data.get('total'))
+        self._assert_counter_matches_musics()
+
+    def test_list_and_count_do_not_count_musics(self):
+
+        MusicCounter.objects.for_user(self.db_user1)
+        user_cache.clear()
+
+        with self.assertNumQueries(3):
+            client.get(reverse('get_deleted_musics'), **self.header_user1)
+
+        with self.assertNumQueries(1):
+            response = client.get(reverse('count_deleted_musics'),
+                                  **self.header_user1)
+
+        self.assertEqual(2, response.data)
+
+    def test_counter_follows_music_writes(self):
+
+        MusicCounter.objects.for_user(self.db_user1)
+
+        music = {
+            'title': 'Title Test',
+            'artist': 'Artist Test',
+            'release_date': str(datetime.date.today()),
+            'duration': '00:03:00',
+        }
+        response = client.post(reverse('get_post_musics'),
+                               data=json.dumps(music),
+                               content_type='application/json',
+                               **self.header_user1)
+        self._assert_counter_matches_musics()
+
+        client.post(reverse('get_post_musics'), data=json.dumps(music),
+                    content_type='application/json', **self.header_user1)
+        self._assert_counter_matches_musics()
+
+        music_id = response.data.get('id')
+        client.delete(reverse('get_update_delete_music', kwargs={'id': music_id}),
+                      **self.header_user1)
+        self._assert_counter_matches_musics()
+
+        client.post(reverse('restore_deleted_musics'),
+                    data=json.dumps([{'id': music_id}]),
+                    content_type='application/json', **self.header_user1)
+        self._assert_counter_matches_musics()
+
+        client.delete(reverse('get_update_delete_music', kwargs={'id': music_id}),
+                      **self.header_user1)
+        client.delete(reverse('definitive_delete_music', kwargs={'id': music_id}),
+                      **self.header_user1)
+        self._assert_counter_matches_musics()
+
+        client.delete(reverse('empty_list'), **self.header_user1)
+        self._assert_counter_matches_musics()
@@ -0,0 +1,101 @@
+import json
+from django.test import TestCase
+from django.urls import reverse
+from app.models import Music
+from app.tests import base_tdd
+from app.tests.factories import MusicFactory, create_user
+from app.views.music_views import music_page_cache
+
+client = base_tdd.get_client()
+
+
+class MusicPageCacheTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+
+        cls.db_user1 = create_user()
+        cls.header_user1 = base_tdd.generate_header(cls.db_user1)
+        cls.header_user2 = base_tdd.generate_header(create_user('2'))
+
+        MusicFactory.create_batch(6, user=cls.db_user1)
+        MusicFactory.create_batch(2, deleted=True, user=cls.db_user1)
+
+    def setUp(self):
+        music_page_cache.clear()
+
+    def test_repeated_page_is_served_from_cache(self):
+
+        response = client.get(reverse('get_post_musics'), {'page': 2, 'size': 2},
+                              **self.header_user1)
+        self.assertEqual('MISS', response['X-Cache'])
+
+        with self.assertNumQueries(1):
+            cached = client.get(reverse('get_post_musics'), {'page': 2, 'size': 2},
+                                **self.header_user1)
+
+        self.assertEqual('HIT', cached['X-Cache'])
+        self.assertIn('page-cache', cached['Server-Timing'])
+        self.assertEqual(response.data, cached.data)
+
+        stats = music_page_cache.stats()
+        self.assertEqual(1, stats['hits'])
+        self.assertEqual(1, stats['misses'])
+        self.assertEqual(0.5, stats['hit_ratio'])
+
+    def test_cache_key_depends_on_query(self):
+
+        client.get(reverse('get_post_musics'), **self.header_user1)
+
+        requests = [
+            (reverse('get_post_musics'), {'page': 2}),
+            (reverse('get_post_musics'), {'size': 2}),
+            (reverse('get_post_musics'), {'fields': 'title'}),
+            (reverse('get_post_musics'), {'cursor': ''}),
+            (reverse('get_deleted_musics'), {}),
+        ]
+
+        for (url, params) in requests:
+            response = client.get(url, params, **self.header_user1)
+            self.assertEqual('MISS', response['X-Cache'], params)
+
+    def test_cache_key_depends_on_user(self):
+
+        client.get(reverse('get_post_musics'), **self.header_user1)
+        response = client.get(reverse('get_post_musics'), **self.header_user2)
+
+        self.assertEqual('MISS', response['X-Cache'])
+        self.assertEqual(0, response.data.get('total'))
+
+    def test_cursor_pages_are_cached(self):
+
+        client.get(reverse('get_post_musics'), {'cursor': '', 'size': 2},
+                   **self.header_user1)
+        response = client.get(reverse('get_post_musics'), {'cursor': '', 'size': 2},
+                              **self.header_user1)
+
+        self.assertEqual('HIT', response['X-Cache'])
+        self.assertEqual(2, len(response.data.get('content')))
+
+    def test_writes_invalidate_cached_pages(self):
+
+        music = Music.objects.library(self.db_user1).first()
+        url = reverse('get_update_delete_music', kwargs={'id': music.id})
+
+        client.get(reverse('get_post_musics'), **self.header_user1)
+        client.delete(url, **self.header_user1)
+
+        response = client.get(reverse('get_post_musics'), **self.header_user1)
+
+        self.assertEqual('MISS', response['X-Cache'])
+        self.assertEqual(5, response.data.get('total'))
+
+        client.get(reverse('get_deleted_musics'), **self.header_user1)
+        client.post(reverse('restore_deleted_musics'),
+                    data=json.dumps([{'id': music.id}]),
+                    content_type='application/json', **self.header_user1)
+
+        response = client.get(reverse('get_deleted_musics'), **self.header_user1)
+
+        self.assertEqual('MISS', response['X-Cache'])
+        self.assertEqual(2, response.data.get('total'))
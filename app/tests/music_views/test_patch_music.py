@@ -0,0 +1,162 @@
+import json
+from rest_framework import status
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from app import messages
+from app.models import Music
+from app.serializers import MusicSerializer
+from app.tests import base_tdd
+from app.tests.factories import MusicFactory, create_user
+from app.views.music_views import music_cache
+
+client = base_tdd.get_client()
+
+
+def music_queries(context):
+    return [query['sql'] for query in context.captured_queries
+            if 'musics' in query['sql']]
+
+
+class PatchMusicTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+
+        cls.db_user1 = create_user()
+        cls.header_user1 = base_tdd.generate_header(cls.db_user1)
+        cls.header_user2 = base_tdd.generate_header(create_user('2'))
+
+        cls.music = MusicFactory.create(user=cls.db_user1)
+        cls.deleted_music = MusicFactory.create(deleted=True, user=cls.db_user1)
+
+    def setUp(self):
+        music_cache.clear()
+
+    def _patch(self, id, data, header=None):
+        return client.patch(
+            reverse('get_update_delete_music', kwargs={'id': id}),
+            data=json.dumps(data),
+            content_type='application/json',
+            **(header or self.header_user1)
+        )
+
+    def test_patch_music(self):
+
+        with CaptureQueriesContext(connection) as context:
+            response = self._patch(self.music.id, {'title': 'Patched'})
+
+        db_music = Music.objects.get(id=self.music.id)
+        expected = MusicSerializer(db_music).data
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertEqual(expected, response.data)
+        self.assertEqual('Patched', db_music.title)
+        self.assertEqual(self.music.artist, db_music.artist)
+        self.assertEqual(self.music.number_views, db_music.number_views)
+        self.assertGreater(db_music.updated_at, self.music.updated_at)
+
+        queries = music_queries(context)
+        self.assertTrue(queries[0].startswith('UPDATE'))
+        self.assertNotIn('artist', queries[0].split('WHERE')[0])
+
+    def test_patch_music_validates_present_fields(self):
+
+        response = self._patch(self.music.id, {'duration': '3:15'})
+
+        self.assertEqual(messages.WRONG_DURATION_FORMAT, response.data.get('message'))
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code)
+
+        response = self._patch(self.music.id, {'title': ''})
+
+        self.assertEqual(messages.TITLE_IS_REQUIRED, response.data.get('message'))
+        self.assertEqual(self.music.title, Music.objects.get(id=self.music.id).title)
+
+    def test_patch_music_without_fields(self):
+
+        response = self._patch(self.music.id, {})
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertEqual(self.music.title, response.data.get('title'))
+
+    def test_patch_music_to_existing_identity(self):
+
+        other_music = MusicFactory.create(user=self.db_user1)
+
+        response = self._patch(self.music.id, MusicSerializer(other_music).data)
+
+        self.assertEqual(messages.MUSIC_ALREADY_EXISTS, response.data.get('message'))
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code)
+
+    def test_patch_nonexistent_deleted_and_other_users_music(self):
+
+        for (id, header) in [(100, None), (self.deleted_music.id, None),
+                             (self.music.id, self.header_user2)]:
+
+            response = self._patch(id, {'title': 'Patched'}, header)
+
+            self.assertEqual(messages.MUSIC_NOT_FOUND, response.data.get('message'))
+            self.assertEqual(status.HTTP_404_NOT_FOUND, response.status_code)
+
+        self.assertEqual(self.music.title, Music.objects.get(id=self.music.id).title)
+
+    def test_patch_music_invalidates_cached_music(self):
+
+        url = reverse('get_update_delete_music', kwargs={'id': self.music.id})
+        client.get(url, **self.header_user1)
+
+        self._patch(self.music.id, {'title': 'Patched'})
+
+        self.assertEqual('Patched', client.get(url, **self.header_user1).data.get('title'))
+
+
+class ChangedColumnsTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+
+        cls.db_user1 = create_user()
+        cls.header_user1 = base_tdd.generate_header(cls.db_user1)
+
+    def setUp(self):
+
+        self.music = MusicFactory.create(user=self.db_user1)
+        self.url = reverse('get_update_delete_music', kwargs={'id': self.music.id})
+
+    def test_put_writes_changed_columns_only(self):
+
+        music_json = MusicSerializer(self.music).data
+        music_json['title'] = 'Changed'
+
+        with CaptureQueriesContext(connection) as context:
+            client.put(self.url, data=json.dumps(music_json),
+                       content_type='application/json', **self.header_user1)
+
+        update = [sql for sql in music_queries(context) if sql.startswith('UPDATE')]
+
+        self.assertEqual(1, len(update))
+        self.assertIn('title', update[0])
+        self.assertNotIn('artist', update[0])
+
+    def test_put_without_changes_does_not_write(self):
+
+        music_json = MusicSerializer(self.music).data
+
+        with CaptureQueriesContext(connection) as context:
+            response = client.put(self.url, data=json.dumps(music_json),
+                                  content_type='application/json', **self.header_user1)
+
+        self.assertEqual(music_json, response.data)
+        self.assertFalse([sql for sql in music_queries(context) if sql.startswith('UPDATE')])
+
+    def test_delete_writes_deleted_flag_only(self):
+
+        with CaptureQueriesContext(connection) as context:
+            client.delete(self.url, **self.header_user1)
+
+        update = [sql for sql in music_queries(context) if sql.startswith('UPDATE')]
+
+        self.assertEqual(1, len(update))
+        self.assertIn('deleted', update[0])
+        self.assertNotIn('title', update[0])
@@ -1,11 +1,13 @@
 import datetime
 import json
 from rest_framework import status
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from parameterized import parameterized
 from app import messages
-from app.models import Music
+from app.models import Music, MusicCounter
 from app.serializers import MusicSerializer
 from app.tests import base_tdd
 from app.tests.factories import create_user
@@ -169,6 +171,39 @@ class PostMusicTest(TestCase):
 
         self.assertEqual(status.HTTP_201_CREATED, response.status_code)
 
+    def test_post_existing_music(self):
+
+        responses = [client.post(
+            reverse('get_post_musics'),
+            data=json.dumps(self.all_attributes_music),
+            content_type='application/json',
+            **self.header_user1
+        ) for _ in range(2)]
+
+        self.assertEqual(responses[0].data.get('id'), responses[1].data.get('id'))
+        self.assertEqual(responses[0].data, responses[1].data)
+        self.assertEqual(1, Music.objects.filter(user=self.db_user1).count())
+        self.assertEqual(1, MusicCounter.objects.get(user=self.db_user1).active_count)
+        self.assertEqual(status.HTTP_201_CREATED, responses[1].status_code)
+
+    def test_post_music_is_a_single_insert(self):
+
+        MusicCounter.objects.for_user(self.db_user1)
+
+        with CaptureQueriesContext(connection) as context:
+            client.post(
+                reverse('get_post_musics'),
+                data=json.dumps(self.all_attributes_music),
+                content_type='application/json',
+                **self.header_user1
+            )
+
+        music_queries = [query['sql'] for query in context.captured_queries
+                         if 'musics' in query['sql']]
+
+        self.assertEqual(1, len(music_queries))
+        self.assertTrue(music_queries[0].startswith('INSERT'))
+
     @parameterized.expand([
         ('title', messages.TITLE_IS_REQUIRED),
         ('artist', messages.ARTIST_IS_REQUIRED),
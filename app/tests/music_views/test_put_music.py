@@ -226,6 +226,27 @@ class PutMusicTest(TestCase):
 
         self.assertEqual(status.HTTP_200_OK, response.status_code)
 
+    def test_put_music_with_existing_identity(self):
+
+        other_music = MusicFactory.create(user=self.db_user1)
+        other_music_json = MusicSerializer(other_music).data
+
+        response = client.put(
+            reverse(
+                'get_update_delete_music',
+                kwargs={
+                    'id': self.music.id
+                }
+            ),
+            data=json.dumps(other_music_json),
+            content_type='application/json',
+            **self.header_user1
+        )
+
+        self.assertEqual(messages.MUSIC_ALREADY_EXISTS, response.data.get('message'))
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code)
+        self.assertEqual(self.music.title, Music.objects.get(id=self.music.id).title)
+
     def test_put_nonexistent_music_by_id(self):
 
         response = client.put(
@@ -0,0 +1,129 @@
+import json
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from app.models import Music
+from app.tests import base_tdd
+from app.tests.factories import MusicFactory, create_user
+from app.views.music_views import music_cache
+
+client = base_tdd.get_client()
+
+MUSIC_INDEXES = ['musics_user_deleted_order_idx', 'musics_user_deleted_upd_idx']
+
+
+def explain(sql):
+
+    with connection.cursor() as cursor:
+
+        if connection.vendor == 'sqlite':
+            cursor.execute('EXPLAIN QUERY PLAN {}'.format(sql))
+            return [row[-1] for row in cursor.fetchall()]
+
+        cursor.execute('EXPLAIN {}'.format(sql))
+        columns = [column[0] for column in cursor.description]
+
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+
+def uses_music_index(plan):
+
+    if connection.vendor == 'sqlite':
+        return any(index in line for line in plan for index in MUSIC_INDEXES)
+
+    return any(row.get('key') in MUSIC_INDEXES for row in plan)
+
+
+def scans_or_sorts(plan):
+
+    if connection.vendor == 'sqlite':
+        return any(line.startswith('SCAN musics') or 'TEMP B-TREE' in line
+                   for line in plan)
+
+    return any(row.get('type') == 'ALL' or 'filesort' in (row.get('Extra') or '')
+               for row in plan)
+
+
+class QueryPlansTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+
+        cls.db_user1 = create_user()
+        cls.header_user1 = base_tdd.generate_header(cls.db_user1)
+
+        MusicFactory.create_batch(10, user=cls.db_user1)
+        MusicFactory.create_batch(10, deleted=True, user=cls.db_user1)
+        MusicFactory.create_batch(10, user=create_user('2'))
+
+    def setUp(self):
+        music_cache.clear()
+
+    def _music_queries(self, method, url, **kwargs):
+
+        with CaptureQueriesContext(connection) as context:
+            getattr(client, method)(url, **kwargs, **self.header_user1)
+
+        return [query['sql'] for query in context.captured_queries
+                if '"musics"' in query['sql'] or '`musics`' in query['sql']]
+
+    def _assert_library_queries_use_indexes(self, method, url, **kwargs):
+
+        queries = self._music_queries(method, url, **kwargs)
+        self.assertTrue(queries)
+
+        for sql in queries:
+            plan = explain(sql)
+            self.assertTrue(uses_music_index(plan), (sql, plan))
+            self.assertFalse(scans_or_sorts(plan), (sql, plan))
+
+    def test_get_musics_query_plans(self):
+        self._assert_library_queries_use_indexes(
+            'get', reverse('get_post_musics'), data={'page': 2, 'size': 4})
+
+    def test_get_musics_by_cursor_query_plans(self):
+
+        response = client.get(reverse('get_post_musics'),
+                              {'cursor': '', 'size': 4}, **self.header_user1)
+
+        self._assert_library_queries_use_indexes(
+            'get', reverse('get_post_musics'),
+            data={'cursor': response.data.get('next_cursor'), 'size': 4})
+
+    def test_get_deleted_musics_query_plans(self):
+        self._assert_library_queries_use_indexes(
+            'get', reverse('get_deleted_musics'))
+
+    def test_count_deleted_musics_query_plans(self):
+        self._assert_library_queries_use_indexes(
+            'get', reverse('count_deleted_musics'))
+
+    def test_restore_deleted_musics_query_plans(self):
+
+        music_ids = Music.objects.library(self.db_user1, deleted=True).values('id')
+
+        self._assert_library_queries_use_indexes(
+            'post', reverse('restore_deleted_musics'),
+            data=json.dumps(list(music_ids)), content_type='application/json')
+
+    def test_empty_list_query_plans(self):
+        self._assert_library_queries_use_indexes(
+            'delete', reverse('empty_list'))
+
+    def test_single_music_query_plans(self):
+
+        music = Music.objects.library(self.db_user1).first()
+        deleted_music = Music.objects.library(self.db_user1, deleted=True).first()
+
+        urls = [
+            ('get', reverse('get_update_delete_music', kwargs={'id': music.id})),
+            ('delete', reverse('get_update_delete_music', kwargs={'id': music.id})),
+            ('delete', reverse('definitive_delete_music',
+                               kwargs={'id': deleted_music.id})),
+        ]
+
+        for (method, url) in urls:
+            for sql in self._music_queries(method, url):
+                plan = explain(sql)
+                self.assertFalse(scans_or_sorts(plan), (sql, plan))
@@ -0,0 +1,170 @@
+import time
+from unittest import mock
+import jwt
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import exceptions
+from app import messages
+from app.authentication import BearerAuthentication, token_cache, user_cache
+from app.models import MusicCounter
+from app.tests import base_tdd
+from app.tests.factories import create_user
+
+client = base_tdd.get_client()
+
+
+class UserCacheTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+
+        cls.db_user1 = create_user()
+        cls.header_user1 = base_tdd.generate_header(cls.db_user1)
+
+    def setUp(self):
+
+        user_cache.clear()
+        MusicCounter.objects.for_user(self.db_user1)
+
+    def test_authenticated_user_is_cached(self):
+
+        with self.assertNumQueries(2):
+            client.get(reverse('count_deleted_musics'), **self.header_user1)
+
+        with self.assertNumQueries(1):
+            client.get(reverse('count_deleted_musics'), **self.header_user1)
+
+        self.assertEqual(1, user_cache.stats()['hits'])
+        self.assertEqual(1, user_cache.stats()['misses'])
+
+    def test_cached_user_is_not_shared_between_requests(self):
+
+        authentication = BearerAuthentication()
+
+        (first, _) = authentication.authenticate_credentials(self.db_user1.id)
+        first.username = 'changed'
+        (second, _) = authentication.authenticate_credentials(self.db_user1.id)
+
+        self.assertIsNot(first, second)
+        self.assertEqual(self.db_user1.username, second.username)
+        self.assertEqual(self.db_user1, second)
+
+    def test_cached_user_is_invalidated_on_save(self):
+
+        client.get(reverse('count_deleted_musics'), **self.header_user1)
+
+        self.db_user1.username = 'changed'
+        self.db_user1.save()
+
+        self.assertIsNone(user_cache.get(self.db_user1.id))
+
+    def test_cached_user_is_invalidated_on_delete(self):
+
+        client.get(reverse('count_deleted_musics'), **self.header_user1)
+
+        user_id = self.db_user1.id
+        self.db_user1.delete()
+
+        response = client.get(reverse('count_deleted_musics'),
+                              **self.header_user1)
+
+        self.assertIsNone(user_cache.get(user_id))
+        self.assertEqual(401, response.status_code)
+
+
+class TokenCacheTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+
+        cls.db_user1 = create_user()
+        cls.header_user1 = base_tdd.generate_header(cls.db_user1)
+
+    def setUp(self):
+        token_cache.clear()
+
+    def _token(self, header):
+        return header['HTTP_AUTHORIZATION'].split()[1].encode('utf-8')
+
+    def test_verified_token_is_memoized(self):
+
+        with mock.patch('app.authentication.jwt.decode',
+                        wraps=jwt.decode) as decode:
+
+            client.get(reverse('count_deleted_musics'), **self.header_user1)
+            client.get(reverse('count_deleted_musics'), **self.header_user1)
+
+        self.assertEqual(1, decode.call_count)
+        self.assertIsNotNone(token_cache.get(self._token(self.header_user1)))
+
+    def test_rejected_tokens_are_not_memoized(self):
+
+        header = base_tdd.get_expired_token_header(self.db_user1.id)
+
+        response = client.get(reverse('count_deleted_musics'), **header)
+
+        self.assertEqual(messages.TOKEN_EXPIRED, response.data.get('message'))
+        self.assertEqual(0, len(token_cache))
+
+    @mock.patch('app.authentication.time.time')
+    def test_memoized_token_does_not_outlive_its_expiration(self, wall_time):
+
+        token = self._token(self.header_user1)
+        payload = jwt.decode(token, options={'verify_signature': False})
+
+        wall_time.return_value = payload['exp'] - 1
+        client.get(reverse('count_deleted_musics'), **self.header_user1)
+
+        with mock.patch('app.cache.time.monotonic',
+                        return_value=time.monotonic() + 2):
+            self.assertIsNone(token_cache.get(token))
+
+
+@override_settings(AUTH_STATELESS_PRINCIPAL=True)
+class StatelessPrincipalTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.db_user1 = create_user()
+
+    def setUp(self):
+
+        self.header_user1 = base_tdd.generate_header(self.db_user1)
+        user_cache.clear()
+        MusicCounter.objects.for_user(self.db_user1)
+
+    def test_login_embeds_principal_claims(self):
+
+        token = self.header_user1['HTTP_AUTHORIZATION'].split()[1]
+        payload = jwt.decode(token, options={'verify_signature': False})
+
+        self.assertEqual(self.db_user1.id, payload.get('user_id'))
+        self.assertEqual(self.db_user1.username, payload.get('username'))
+        self.assertEqual(self.db_user1.email, payload.get('email'))
+
+    def test_music_endpoints_do_not_query_users(self):
+
+        with self.assertNumQueries(1):
+            response = client.get(reverse('count_deleted_musics'),
+                                  **self.header_user1)
+
+        self.assertEqual(200, response.status_code)
+
+    def test_principal_loads_other_attributes_lazily(self):
+
+        token = self.header_user1['HTTP_AUTHORIZATION'].split()[1]
+        payload = jwt.decode(token, options={'verify_signature': False})
+
+        with self.assertNumQueries(0):
+            principal = BearerAuthentication().stateless_principal(payload)
+            self.assertEqual(self.db_user1.pk, principal.pk)
+            self.assertEqual(self.db_user1.email, principal.email)
+            self.assertTrue(principal.is_authenticated)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(self.db_user1.date_joined, principal.date_joined)
+
+    def test_token_without_user_id_is_rejected(self):
+
+        with self.assertRaises(exceptions.AuthenticationFailed):
+            BearerAuthentication().stateless_principal({'email': 'a@a.com'})
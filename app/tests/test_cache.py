@@ -0,0 +1,120 @@
+import tempfile
+from unittest import mock
+from django.test import SimpleTestCase, override_settings
+from app.cache import LRUCache, VersionedCache
+
+
+class LRUCacheTest(SimpleTestCase):
+
+    def test_get_counts_hits_and_misses(self):
+
+        cache = LRUCache(maxsize=2, ttl=60)
+        cache.set('a', 1)
+
+        self.assertEqual(1, cache.get('a'))
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual({'hits': 1, 'misses': 1, 'hit_ratio': 0.5,
+                          'size': 1, 'maxsize': 2}, cache.stats())
+
+    def test_least_recently_used_entry_is_evicted(self):
+
+        cache = LRUCache(maxsize=2, ttl=60)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+
+        self.assertEqual(1, cache.get('a'))
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(3, cache.get('c'))
+
+    @mock.patch('app.cache.time.monotonic')
+    def test_expired_entries_are_misses(self, monotonic):
+
+        cache = LRUCache(maxsize=2, ttl=60)
+
+        monotonic.return_value = 0
+        cache.set('a', 1)
+        cache.set('b', 2, ttl=10)
+
+        monotonic.return_value = 30
+        self.assertEqual(1, cache.get('a'))
+        self.assertIsNone(cache.get('b'))
+
+        monotonic.return_value = 60
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(0, len(cache))
+
+    def test_entry_ttl_is_bounded_by_cache_ttl(self):
+
+        cache = LRUCache(maxsize=2, ttl=60)
+        cache.set('a', 1, ttl=0)
+
+        self.assertIsNone(cache.get('a'))
+
+    def test_delete_and_clear(self):
+
+        cache = LRUCache(maxsize=2, ttl=60)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.delete('a')
+
+        self.assertIsNone(cache.get('a'))
+
+        cache.clear()
+
+        self.assertEqual(0, len(cache))
+        self.assertEqual(0, cache.stats()['hits'])
+
+
+class VersionedCacheTest(SimpleTestCase):
+
+    def setUp(self):
+
+        self.cache = VersionedCache(alias='music_pages', timeout=60, prefix='test')
+        self.cache.clear()
+
+    def test_bumping_version_hides_previous_entries(self):
+
+        key = self.cache.key(1, 'page', 1)
+        self.cache.set(key, 'v1', version=1)
+
+        self.assertEqual('v1', self.cache.get(key, version=1))
+        self.assertIsNone(self.cache.get(key, version=2))
+
+    def test_key_depends_on_every_part(self):
+
+        self.assertEqual(self.cache.key(1, 'page', 1), self.cache.key(1, 'page', 1))
+        self.assertNotEqual(self.cache.key(1, 'page', 1), self.cache.key(1, 'page', 2))
+        self.assertNotEqual(self.cache.key(1, 'page', 1), self.cache.key(2, 'page', 1))
+
+    def test_stats_report_hit_ratio_and_latency(self):
+
+        self.cache.record(True, 0.001)
+        self.cache.record(False, 0.003)
+        self.cache.record(False, 0.005)
+
+        stats = self.cache.stats()
+
+        self.assertEqual(1, stats['hits'])
+        self.assertEqual(2, stats['misses'])
+        self.assertAlmostEqual(1 / 3, stats['hit_ratio'])
+        self.assertAlmostEqual(1.0, stats['hit_latency_ms'])
+        self.assertAlmostEqual(4.0, stats['miss_latency_ms'])
+
+    def test_file_backend(self):
+
+        with tempfile.TemporaryDirectory() as directory:
+
+            caches_setting = {'music_pages': {
+                'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+                'LOCATION': directory,
+            }}
+
+            with override_settings(CACHES=caches_setting):
+
+                key = self.cache.key(1, 'page', 1)
+                self.cache.set(key, {'total': 1}, version=3)
+
+                self.assertEqual({'total': 1}, self.cache.get(key, version=3))
+                self.assertIsNone(self.cache.get(key, version=4))
@@ -0,0 +1,70 @@
+import threading
+import time
+from asgiref.sync import async_to_sync
+from django.test import SimpleTestCase
+from app.hashing import HashingUnavailable, PasswordHashingPool
+
+
+class PasswordHashingPoolTest(SimpleTestCase):
+
+    def setUp(self):
+
+        self.release = threading.Event()
+        self.pool = PasswordHashingPool(workers=1, queue_size=1, timeout=0.2)
+
+    def tearDown(self):
+        self.release.set()
+
+    def _block(self):
+        self.release.wait(5)
+
+    def test_run_returns_result(self):
+        self.assertEqual(3, self.pool.run(sum, [1, 2]))
+
+    def test_async_run_returns_result(self):
+        self.assertEqual(3, async_to_sync(self.pool.arun)(sum, [1, 2]))
+
+    def test_submissions_beyond_the_queue_are_rejected(self):
+
+        self.pool.submit(self._block)
+        self.pool.submit(self._block)
+
+        with self.assertRaises(HashingUnavailable):
+            self.pool.submit(self._block)
+
+    def test_slots_are_released_when_work_finishes(self):
+
+        running = self.pool.submit(self._block)
+        queued = self.pool.submit(self._block)
+        self.release.set()
+        running.result()
+        queued.result()
+
+        self.assertEqual(3, self.pool.run(sum, [1, 2]))
+
+    def test_sync_run_fails_fast_when_workers_are_busy(self):
+
+        pool = PasswordHashingPool(workers=1, queue_size=4, timeout=5)
+        running = threading.Event()
+
+        def block():
+            running.set()
+            self._block()
+
+        blocked = threading.Thread(target=pool.run, args=(block,))
+        blocked.start()
+        self.addCleanup(blocked.join)
+        running.wait(5)
+
+        started = time.monotonic()
+        with self.assertRaises(HashingUnavailable):
+            pool.run(sum, [1, 2])
+
+        self.assertLess(time.monotonic() - started, 1)
+
+    def test_run_times_out(self):
+
+        self.pool.submit(self._block)
+
+        with self.assertRaises(HashingUnavailable):
+            self.pool.run(sum, [1, 2])
@@ -0,0 +1,89 @@
+import datetime
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from app import jobs, messages
+from app.models import Job
+from app.tests.factories import create_user
+
+
+@jobs.handler('test_echo')
+def echo(job, value):
+    jobs.report(job, 1)
+    return {'value': value}
+
+
+@jobs.handler('test_crash')
+def crash(job):
+    raise ValueError('boom')
+
+
+@override_settings(JOBS={'PROCESSES': 1, 'LEASE_SECONDS': 60, 'MAX_ATTEMPTS': 2,
+                         'RETRY_DELAY': 30, 'POLL_INTERVAL': 0})
+class JobsTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.db_user = create_user()
+
+    def test_run_next_completes_job(self):
+
+        job = jobs.enqueue(self.db_user, 'test_echo', {'value': 'x'})
+
+        self.assertEqual(job.id, jobs.run_next('worker-1').id)
+
+        job.refresh_from_db()
+        self.assertEqual(Job.DONE, job.status)
+        self.assertEqual({'value': 'x'}, job.result)
+        self.assertEqual((1, 1), (job.progress, job.attempts))
+        self.assertIsNone(job.leased_until)
+        self.assertIsNone(jobs.run_next('worker-1'))
+
+    def test_claim_is_exclusive(self):
+
+        job = jobs.enqueue(self.db_user, 'test_echo', {'value': 'x'})
+
+        self.assertEqual(job.id, Job.objects.claim('worker-1', 60).id)
+        self.assertIsNone(Job.objects.claim('worker-2', 60))
+
+    def test_expired_lease_is_claimed_again(self):
+
+        job = jobs.enqueue(self.db_user, 'test_echo', {'value': 'x'})
+        Job.objects.claim('worker-1', 60)
+        Job.objects.filter(id=job.id).update(
+            leased_until=timezone.now() - datetime.timedelta(seconds=1))
+
+        claimed = Job.objects.claim('worker-2', 60)
+
+        self.assertEqual(('worker-2', 2), (claimed.worker, claimed.attempts))
+
+    def test_failed_job_is_retried_then_failed(self):
+
+        job = jobs.enqueue(self.db_user, 'test_crash')
+
+        jobs.run_next('worker-1')
+        job.refresh_from_db()
+
+        self.assertEqual(Job.QUEUED, job.status)
+        self.assertEqual('ValueError: boom', job.error)
+        self.assertGreater(job.run_after, timezone.now())
+        self.assertIsNone(jobs.run_next('worker-1'))
+
+        Job.objects.filter(id=job.id).update(run_after=timezone.now())
+        jobs.run_next('worker-1')
+        job.refresh_from_db()
+
+        self.assertEqual((Job.FAILED, 2), (job.status, job.attempts))
+
+    def test_expired_lease_on_last_attempt_fails_job(self):
+
+        job = jobs.enqueue(self.db_user, 'test_echo', {'value': 'x'})
+        Job.objects.filter(id=job.id).update(
+            status=Job.RUNNING, attempts=2, worker='worker-1',
+            leased_until=timezone.now() - datetime.timedelta(seconds=1))
+
+        self.assertIsNone(Job.objects.claim('worker-2', 60))
+
+        job.refresh_from_db()
+        self.assertEqual((Job.FAILED, 2), (job.status, job.attempts))
+        self.assertEqual(messages.JOB_LEASE_EXPIRED, job.error)
+        self.assertIsNone(job.leased_until)
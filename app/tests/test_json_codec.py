@@ -0,0 +1,60 @@
+import datetime
+import decimal
+import io
+from unittest import mock
+from django.test import SimpleTestCase
+from django.utils.translation import gettext_lazy
+from parameterized import parameterized
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from app.parsers import FastJSONParser
+from app.renderers import FastJSONRenderer
+
+
+class FastJSONRendererTest(SimpleTestCase):
+
+    @parameterized.expand([
+        ({'content': [{'id': 1, 'title': 'Título \u2028\u2029'}], 'total': 1},),
+        ({'release_date': datetime.date(2021, 1, 2),
+          'duration': datetime.time(0, 3, 25),
+          'created_at': datetime.datetime(2021, 10, 1, 17, 9, 30, 123456)},),
+        ({'created_at': datetime.datetime(2021, 10, 1, 17, 9, 30,
+                                          tzinfo=datetime.timezone.utc)},),
+        ({1: decimal.Decimal('1.5'), 'message': gettext_lazy('Music not found!')},),
+        ([1, 2.5, None, True, 'a'],),
+    ])
+    def test_output_is_identical_to_json_renderer(self, data):
+        self.assertEqual(JSONRenderer().render(data),
+                         FastJSONRenderer().render(data))
+
+    def test_indented_output_uses_json_renderer(self):
+
+        data = {'id': 1}
+        media_type = 'application/json; indent=4'
+
+        self.assertEqual(JSONRenderer().render(data, media_type),
+                         FastJSONRenderer().render(data, media_type))
+
+    @mock.patch('app.renderers.orjson', None)
+    def test_falls_back_without_orjson(self):
+        self.assertEqual(b'{"id":1}', FastJSONRenderer().render({'id': 1}))
+
+
+class FastJSONParserTest(SimpleTestCase):
+
+    def test_output_is_identical_to_json_parser(self):
+
+        body = '[{"id": 1, "title": "Título"}, {"id": null}]'.encode('utf-8')
+
+        self.assertEqual(JSONParser().parse(io.BytesIO(body)),
+                         FastJSONParser().parse(io.BytesIO(body)))
+
+    def test_invalid_json_raises_parse_error(self):
+
+        with self.assertRaises(ParseError):
+            FastJSONParser().parse(io.BytesIO(b'[{"id": 1'))
+
+    @mock.patch('app.parsers.orjson', None)
+    def test_falls_back_without_orjson(self):
+        self.assertEqual({'id': 1}, FastJSONParser().parse(io.BytesIO(b'{"id": 1}')))
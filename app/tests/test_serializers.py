@@ -0,0 +1,46 @@
+import datetime
+from django.test import SimpleTestCase
+from parameterized import parameterized
+from rest_framework.renderers import JSONRenderer
+from app.models import Music
+from app.serializers import MusicReadSerializer, MusicSerializer
+
+
+def music_row(music):
+    return tuple(getattr(music, field) for field in MusicReadSerializer.FIELDS)
+
+
+class MusicReadSerializerTest(SimpleTestCase):
+
+    @parameterized.expand([
+        (datetime.datetime(2021, 10, 1, 17, 9, 30, 123456), 10, True),
+        (datetime.datetime(2021, 10, 1, 17, 9, 30), 0, False),
+        (datetime.datetime(2021, 10, 1, 0, 0, 0, 999), None, None),
+        (None, 1, True),
+    ])
+    def test_output_is_identical_to_music_serializer(self, timestamp, number_views, feat):
+
+        music = Music(
+            id=1,
+            title='Title Test',
+            artist='Artist Test',
+            release_date=datetime.date(2021, 1, 2),
+            duration=datetime.time(0, 3, 25),
+            number_views=number_views,
+            feat=feat,
+            created_at=timestamp,
+            updated_at=timestamp
+        )
+
+        expected = JSONRenderer().render(MusicSerializer([music], many=True).data)
+        actual = JSONRenderer().render(MusicReadSerializer([music_row(music)]).data)
+
+        self.assertEqual(expected, actual)
+
+    def test_output_with_selected_fields(self):
+
+        row = (1, 'Title Test', 'Artist Test')
+
+        serializer = MusicReadSerializer([row], fields=['id', 'title'])
+
+        self.assertEqual([{'id': 1, 'title': 'Title Test'}], serializer.data)
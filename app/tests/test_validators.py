@@ -0,0 +1,126 @@
+import datetime
+from django.core.exceptions import FieldError
+from django.test import SimpleTestCase
+from parameterized import parameterized
+from app import messages
+from app.validators import music_validator
+
+
+class MusicValidatorTest(SimpleTestCase):
+
+    def setUp(self):
+
+        self.music = {
+            'title': 'Title',
+            'artist': 'Artist',
+            'release_date': '2020-02-29',
+            'duration': '00:03:15',
+        }
+
+    def _assert_message(self, expected_message, **changes):
+
+        with self.assertRaisesMessage(FieldError, expected_message):
+            music_validator.validate({**self.music, **changes})
+
+    def test_validate_returns_parsed_values(self):
+
+        values = music_validator.validate({**self.music, 'number_views': '7',
+                                           'feat': 1})
+
+        self.assertEqual({
+            'title': 'Title',
+            'artist': 'Artist',
+            'release_date': datetime.date(2020, 2, 29),
+            'duration': datetime.time(0, 3, 15),
+            'number_views': 7,
+            'feat': True,
+        }, values)
+
+    def test_title_and_artist_are_strings(self):
+
+        values = music_validator.validate({**self.music, 'title': 123, 'artist': 4.5})
+
+        self.assertEqual(('123', '4.5'), (values['title'], values['artist']))
+
+    def test_optional_fields_are_left_out_when_missing(self):
+        self.assertNotIn('number_views', music_validator.validate(self.music))
+
+    @parameterized.expand([
+        ('title', messages.TITLE_IS_REQUIRED),
+        ('artist', messages.ARTIST_IS_REQUIRED),
+        ('release_date', messages.RELEASE_DATE_IS_REQUIRED),
+        ('duration', messages.DURATION_IS_REQUIRED),
+    ])
+    def test_required_fields(self, field, expected_message):
+        self._assert_message(expected_message, **{field: ''})
+
+    @parameterized.expand([
+        ('20-01-01', messages.WRONG_RELEASE_DATE_FORMAT),
+        (20200101, messages.WRONG_RELEASE_DATE_FORMAT),
+        ('2020-02-30', messages.get_invalid_date('2020-02-30')),
+        ('2020-01-01T00', messages.get_invalid_date('2020-01-01T00')),
+        ('0000-01-01', messages.get_invalid_date('0000-01-01')),
+    ])
+    def test_invalid_release_dates(self, release_date, expected_message):
+        self._assert_message(expected_message, release_date=release_date)
+
+    def test_future_release_date(self):
+
+        tomorrow = datetime.date.today() + datetime.timedelta(days=1)
+
+        self._assert_message(messages.RELEASE_DATE_CANNOT_BE_FUTURE,
+                             release_date=str(tomorrow))
+
+    def test_today_release_date(self):
+
+        values = music_validator.validate({**self.music,
+                                           'release_date': str(datetime.date.today())})
+
+        self.assertEqual(datetime.date.today(), values['release_date'])
+
+    @parameterized.expand([
+        ('3:15', messages.WRONG_DURATION_FORMAT),
+        ('24:00:00', messages.get_invalid_time('24:00:00')),
+        ('00:00:60', messages.get_invalid_time('00:00:60')),
+        ('00:03:15.5', messages.get_invalid_time('00:03:15.5')),
+    ])
+    def test_invalid_durations(self, duration, expected_message):
+        self._assert_message(expected_message, duration=duration)
+
+    @parameterized.expand([
+        ('title', messages.get_too_long('Title', 100)),
+        ('artist', messages.get_too_long('Artist', 100)),
+    ])
+    def test_too_long_fields(self, field, expected_message):
+        self._assert_message(expected_message, **{field: 'a' * 101})
+
+    def test_number_views_must_be_integer(self):
+        self._assert_message(messages.NUMBER_VIEWS_MUST_BE_INTEGER, number_views='many')
+
+    @parameterized.expand([
+        (True, True), (1, True), ('true', True), ('T', True), ('1', True),
+        (False, False), (0, False), ('false', False), ('F', False), ('0', False),
+    ])
+    def test_feat_values(self, feat, expected_feat):
+        self.assertEqual(expected_feat, music_validator.validate({**self.music, 'feat': feat})['feat'])
+
+    @parameterized.expand([('yes',), ('',), (2,), ([],)])
+    def test_feat_must_be_boolean(self, feat):
+        self._assert_message(messages.FEAT_MUST_BE_BOOLEAN, feat=feat)
+
+    def test_validate_many(self):
+
+        (valid, errors) = music_validator.validate_many([
+            self.music,
+            'music',
+            {**self.music, 'id': 1},
+            {**self.music, 'id': 2, 'title': ''},
+        ], id_required=True)
+
+        self.assertEqual([2], [index for (index, _) in valid])
+        self.assertEqual(1, valid[0][1]['id'])
+        self.assertEqual([
+            {'index': 0, 'message': messages.ID_IS_REQUIRED},
+            {'index': 1, 'message': messages.MUSIC_MUST_BE_AN_OBJECT},
+            {'index': 3, 'message': messages.TITLE_IS_REQUIRED},
+        ], errors)
@@ -0,0 +1,114 @@
+import json
+from unittest import mock
+from asgiref.sync import async_to_sync
+from rest_framework import status
+from django.test import TestCase, Client
+from django.test.client import AsyncRequestFactory
+from django.urls import reverse
+from app import messages
+from app.hashing import HashingUnavailable
+from app.models import User
+from app.tests.factories import create_user
+from app.views import user_views
+
+client = Client()
+factory = AsyncRequestFactory()
+
+
+class AsyncUserViewsTest(TestCase):
+
+    def setUp(self):
+        self.db_user1 = create_user()
+
+    def _post(self, view, data):
+
+        request = factory.post('/', data=json.dumps(data),
+                               content_type='application/json')
+        response = async_to_sync(view)(request)
+
+        return (response.status_code, json.loads(response.content))
+
+    def test_login_async(self):
+
+        (status_code, data) = self._post(user_views.login_async, {
+            'email': self.db_user1.email,
+            'password': '123'
+        })
+
+        self.assertTrue(data.get('token'))
+        self.assertEqual(self.db_user1.username, data.get('username'))
+        self.assertEqual(status.HTTP_200_OK, status_code)
+
+    def test_login_async_with_non_matching_password(self):
+
+        (status_code, data) = self._post(user_views.login_async, {
+            'email': self.db_user1.email,
+            'password': '321'
+        })
+
+        expected_message = messages.get_password_does_not_match_with_email(
+            self.db_user1.email)
+
+        self.assertEqual(expected_message, data.get('message'))
+        self.assertEqual(status.HTTP_401_UNAUTHORIZED, status_code)
+
+    def test_login_async_with_invalid_body(self):
+
+        request = factory.post('/', data='[', content_type='application/json')
+        response = async_to_sync(user_views.login_async)(request)
+
+        self.assertEqual(messages.INVALID_JSON_BODY,
+                         json.loads(response.content).get('message'))
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code)
+
+    def test_create_user_async(self):
+
+        (status_code, data) = self._post(user_views.create_user_async, {
+            'username': 'user2',
+            'email': 'user2@email.com',
+            'password': '123'
+        })
+
+        db_user = User.objects.get(id=data.get('id'))
+
+        self.assertEqual('user2@email.com', data.get('email'))
+        self.assertTrue(db_user.check_password('123'))
+        self.assertEqual(status.HTTP_201_CREATED, status_code)
+
+
+class BusyPasswordHashingTest(TestCase):
+
+    def setUp(self):
+        self.db_user1 = create_user()
+
+    @mock.patch('app.hashing.password_pool.submit',
+                side_effect=HashingUnavailable)
+    def test_login_when_hashing_pool_is_full(self, submit):
+
+        response = client.post(
+            reverse('login'),
+            data=json.dumps({'email': self.db_user1.email, 'password': '123'}),
+            content_type='application/json'
+        )
+
+        self.assertEqual(messages.PASSWORD_HASHING_BUSY,
+                         response.data.get('message'))
+        self.assertEqual(status.HTTP_503_SERVICE_UNAVAILABLE,
+                         response.status_code)
+
+    @mock.patch('app.hashing.password_pool.submit',
+                side_effect=HashingUnavailable)
+    def test_create_user_when_hashing_pool_is_full(self, submit):
+
+        response = client.post(
+            reverse('create_user'),
+            data=json.dumps({'username': 'user2', 'email': 'user2@email.com',
+                             'password': '123'}),
+            content_type='application/json'
+        )
+
+        self.assertFalse(User.objects.filter(email='user2@email.com').exists())
+        self.assertEqual(messages.PASSWORD_HASHING_BUSY,
+                         response.data.get('message'))
+        self.assertEqual(status.HTTP_503_SERVICE_UNAVAILABLE,
+                         response.status_code)
@@ -34,6 +34,7 @@ class LoginTest(TestCase):
         response_serializer = response.data
 
         self.assertFalse(not response_serializer.get('token'))
+        self.assertFalse(not response_serializer.get('refresh_token'))
         self.assertEqual(self.db_user1.username,
                          response_serializer.get('username'))
 
@@ -43,7 +44,7 @@ class LoginTest(TestCase):
         self.assertIsNone(response.data.get('password'))
         self.assertEqual(status.HTTP_200_OK, response.status_code)
 
-    def test_token_lasts_24_hours(self):
+    def test_token_lasts_access_token_lifetime(self):
 
         response = client.post(
             reverse('login'),
@@ -54,8 +55,8 @@ class LoginTest(TestCase):
         payload = jwt.decode(response.data.get('token'),
                              settings.SECRET_KEY, algorithms='HS256')
 
-        same_time_tomorrow = datetime.datetime.today() + datetime.timedelta(days=1)
-        timestamp = int(same_time_tomorrow.timestamp())
+        expiration = datetime.datetime.today() + settings.ACCESS_TOKEN_LIFETIME
+        timestamp = int(expiration.timestamp())
 
         self.assertEqual(timestamp, payload.get('exp'))
 
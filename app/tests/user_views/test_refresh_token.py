@@ -0,0 +1,118 @@
+import datetime
+import json
+from rest_framework import status
+from django.test import TestCase, Client
+from django.urls import reverse
+from parameterized import parameterized
+from app import messages
+from app.models import RefreshToken
+from app.tests.factories import create_user
+
+client = Client()
+
+
+class RefreshTokenTest(TestCase):
+
+    def setUp(self):
+
+        self.db_user1 = create_user()
+
+        response = client.post(
+            reverse('login'),
+            data=json.dumps({'email': self.db_user1.email, 'password': '123'}),
+            content_type='application/json'
+        )
+
+        self.refresh_token = response.data.get('refresh_token')
+
+    def _refresh(self, refresh_token):
+
+        return client.post(
+            reverse('refresh_token'),
+            data=json.dumps({'refresh_token': refresh_token}),
+            content_type='application/json'
+        )
+
+    def test_refresh_token(self):
+
+        response = self._refresh(self.refresh_token)
+
+        header = {
+            'HTTP_AUTHORIZATION': 'Bearer {}'.format(response.data.get('token'))
+        }
+        musics_response = client.get(reverse('get_post_musics'), **header)
+
+        self.assertFalse(not response.data.get('token'))
+        self.assertNotEqual(self.refresh_token,
+                            response.data.get('refresh_token'))
+        self.assertEqual(status.HTTP_200_OK, musics_response.status_code)
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+
+    def test_refresh_token_rotates(self):
+
+        rotated_token = self._refresh(self.refresh_token).data.get('refresh_token')
+
+        response = self._refresh(rotated_token)
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+
+    def test_reused_refresh_token_revokes_family(self):
+
+        rotated_token = self._refresh(self.refresh_token).data.get('refresh_token')
+
+        reuse_response = self._refresh(self.refresh_token)
+        rotated_response = self._refresh(rotated_token)
+
+        self.assertEqual(messages.INVALID_REFRESH_TOKEN,
+                         reuse_response.data.get('message'))
+        self.assertEqual(status.HTTP_401_UNAUTHORIZED,
+                         reuse_response.status_code)
+        self.assertEqual(status.HTTP_401_UNAUTHORIZED,
+                         rotated_response.status_code)
+
+    def test_expired_refresh_token(self):
+
+        yesterday = datetime.datetime.today() - datetime.timedelta(days=1)
+        RefreshToken.objects.update(expires_at=yesterday)
+
+        response = self._refresh(self.refresh_token)
+
+        self.assertEqual(messages.REFRESH_TOKEN_EXPIRED,
+                         response.data.get('message'))
+        self.assertEqual(status.HTTP_401_UNAUTHORIZED, response.status_code)
+
+    @parameterized.expand([
+        ('', messages.REFRESH_TOKEN_IS_REQUIRED, status.HTTP_400_BAD_REQUEST),
+        ('123', messages.INVALID_REFRESH_TOKEN, status.HTTP_401_UNAUTHORIZED),
+    ])
+    def test_refresh_with_inappropriate_tokens(self, refresh_token, expected_message, expected_status):
+
+        response = self._refresh(refresh_token)
+
+        self.assertEqual(expected_message, response.data.get('message'))
+        self.assertEqual(expected_status, response.status_code)
+
+    def test_refresh_token_is_not_a_bearer_token(self):
+
+        header = {
+            'HTTP_AUTHORIZATION': 'Bearer {}'.format(self.refresh_token)
+        }
+
+        response = client.get(reverse('get_post_musics'), **header)
+
+        self.assertEqual(messages.INVALID_TOKEN, response.data.get('message'))
+        self.assertEqual(status.HTTP_401_UNAUTHORIZED, response.status_code)
+
+    def test_revoke_token(self):
+
+        response = client.post(
+            reverse('revoke_token'),
+            data=json.dumps({'refresh_token': self.refresh_token}),
+            content_type='application/json'
+        )
+
+        refresh_response = self._refresh(self.refresh_token)
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertEqual(status.HTTP_401_UNAUTHORIZED,
+                         refresh_response.status_code)
@@ -0,0 +1,84 @@
+import hashlib
+import secrets
+import uuid
+import jwt
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from app import messages
+from app.authentication import PRINCIPAL_CLAIMS
+from app.models import RefreshToken
+
+
+class InvalidRefreshToken(Exception):
+    pass
+
+
+def access_token(user):
+
+    expiration = timezone.now() + settings.ACCESS_TOKEN_LIFETIME
+    claims = {'user_id': user.id, 'exp': int(expiration.timestamp())}
+    if settings.AUTH_STATELESS_PRINCIPAL:
+        claims.update({claim: getattr(user, claim) for claim in PRINCIPAL_CLAIMS})
+
+    return jwt.encode(claims, settings.SECRET_KEY, algorithm='HS256')
+
+
+def refresh_token(user, family=None):
+
+    token = secrets.token_urlsafe(32)
+    RefreshToken.objects.create(
+        token_hash=_hash(token),
+        family=family or uuid.uuid4(),
+        expires_at=timezone.now() + settings.REFRESH_TOKEN_LIFETIME,
+        user=user
+    )
+
+    return token
+
+
+def rotate_refresh_token(token):
+
+    stored = _get_refresh_token(token)
+    if stored.expires_at <= timezone.now():
+        raise InvalidRefreshToken(messages.REFRESH_TOKEN_EXPIRED)
+
+    if not stored.user.is_active:
+        raise InvalidRefreshToken(messages.INVALID_REFRESH_TOKEN)
+
+    with transaction.atomic():
+
+        revoked = RefreshToken.objects.filter(
+            id=stored.id, revoked=False).update(revoked=True)
+        if revoked:
+            return (stored.user, refresh_token(stored.user, stored.family))
+
+    # A rotated token presented again means it leaked: revoke the whole
+    # family so neither holder can keep refreshing.
+    _revoke_family(stored.family)
+
+    raise InvalidRefreshToken(messages.INVALID_REFRESH_TOKEN)
+
+
+def revoke_refresh_token(token):
+
+    stored = _get_refresh_token(token)
+    _revoke_family(stored.family)
+
+
+def _get_refresh_token(token):
+
+    try:
+
+        return RefreshToken.objects.select_related('user').get(
+            token_hash=_hash(token))
+    except RefreshToken.DoesNotExist:
+        raise InvalidRefreshToken(messages.INVALID_REFRESH_TOKEN)
+
+
+def _revoke_family(family):
+    RefreshToken.objects.filter(family=family, revoked=False).update(revoked=True)
+
+
+def _hash(token):
+    return hashlib.sha256(token.encode('utf-8')).hexdigest()
@@ -1,19 +1,30 @@
+from django.conf import settings
 from django.conf.urls import url
-from app.views import music_views, user_views
+from app.views import job_views, music_views, user_views
 
 urlpatterns = [
 
     # User URL's
     url(
         r'^login/?$',
-        user_views.login,
+        user_views.login_async if settings.ASYNC_PASSWORD_VIEWS else user_views.login,
         name='login'
     ),
     url(
         r'^users/?$',
-        user_views.create_user,
+        user_views.create_user_async if settings.ASYNC_PASSWORD_VIEWS else user_views.create_user,
         name='create_user'
     ),
+    url(
+        r'^token/refresh/?$',
+        user_views.refresh_token,
+        name='refresh_token'
+    ),
+    url(
+        r'^token/revoke/?$',
+        user_views.revoke_token,
+        name='revoke_token'
+    ),
 
     # Music URL's
     url(
@@ -21,6 +32,21 @@ urlpatterns = [
         music_views.get_update_delete_music,
         name='get_update_delete_music'
     ),
+    url(
+        r'^musics/bulk/?$',
+        music_views.post_put_musics_bulk,
+        name='post_put_musics_bulk'
+    ),
+    url(
+        r'^musics/export/?$',
+        music_views.export_musics,
+        name='export_musics'
+    ),
+    url(
+        r'^musics/import/?$',
+        music_views.import_musics,
+        name='import_musics'
+    ),
     url(
         r'^musics/?$',
         music_views.get_post_musics,
@@ -41,6 +67,16 @@ urlpatterns = [
         music_views.restore_deleted_musics,
         name='restore_deleted_musics'
     ),
+    url(
+        r'^musics/delete/?$',
+        music_views.delete_musics,
+        name='delete_musics'
+    ),
+    url(
+        r'^musics/definitive/?$',
+        music_views.definitive_delete_musics,
+        name='definitive_delete_musics'
+    ),
     url(
         r'^musics/definitive/(?P<id>[0-9]+)$',
         music_views.definitive_delete_music,
@@ -51,4 +87,11 @@ urlpatterns = [
         music_views.empty_list,
         name='empty_list'
     ),
+
+    # Job URL's
+    url(
+        r'^jobs/(?P<id>[0-9]+)$',
+        job_views.get_job,
+        name='get_job'
+    ),
 ]
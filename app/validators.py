@@ -0,0 +1,136 @@
+import datetime
+import re
+from django.core.exceptions import FieldError
+from app import messages
+
+
+class MusicValidator:
+
+    REQUIRED_FIELDS = [
+        ('title', messages.TITLE_IS_REQUIRED),
+        ('artist', messages.ARTIST_IS_REQUIRED),
+        ('release_date', messages.RELEASE_DATE_IS_REQUIRED),
+        ('duration', messages.DURATION_IS_REQUIRED),
+    ]
+
+    # Longer values would be truncated or rejected by the database.
+    MAX_LENGTHS = [
+        ('title', 'Title', 100),
+        ('artist', 'Artist', 100),
+    ]
+
+    def __init__(self):
+
+        # The *_format patterns only check the prefix, like the original
+        # re.match calls did; the *_value patterns must match the whole
+        # string, as datetime.strptime did.
+        self._date_format = re.compile(r'\d{4}-\d{2}-\d{2}')
+        self._date_value = re.compile(r'(\d{4})-(\d{2})-(\d{2})')
+        self._time_format = re.compile(r'\d{2}:\d{2}:\d{2}')
+        self._time_value = re.compile(r'(\d{2}):(\d{2}):(\d{2})')
+
+    def validate(self, data, today=None, id_required=False, partial=False):
+
+        if not isinstance(data, dict):
+            raise FieldError(messages.MUSIC_MUST_BE_AN_OBJECT)
+
+        if id_required and data.get('id') is None:
+            raise FieldError(messages.ID_IS_REQUIRED)
+
+        # Partial payloads only have the fields they carry validated.
+        for (field, message) in self.REQUIRED_FIELDS:
+            if (field in data or not partial) and not data.get(field):
+                raise FieldError(message)
+
+        for (field, label, max_length) in self.MAX_LENGTHS:
+            if field in data and len(str(data[field])) > max_length:
+                raise FieldError(messages.get_too_long(label, max_length))
+
+        # Stored as text, like CharField.to_python: identities built from these
+        # values must match what the database gives back.
+        values = {field: str(data[field]) for field in ['title', 'artist'] if field in data}
+
+        if 'release_date' in data:
+            values['release_date'] = self._release_date(
+                data['release_date'], today or datetime.date.today())
+
+        if 'duration' in data:
+            values['duration'] = self._duration(data['duration'])
+
+        if data.get('number_views') not in (None, ''):
+            try:
+
+                values['number_views'] = int(data['number_views'])
+            except (TypeError, ValueError):
+                raise FieldError(messages.NUMBER_VIEWS_MUST_BE_INTEGER)
+
+        if data.get('feat') is not None:
+            values['feat'] = self._feat(data['feat'])
+
+        if id_required:
+            values['id'] = data['id']
+
+        return values
+
+    def validate_many(self, payloads, id_required=False):
+
+        today = datetime.date.today()
+        (valid, errors) = ([], [])
+
+        for (index, data) in enumerate(payloads):
+            try:
+
+                valid.append((index, self.validate(data, today, id_required)))
+            except FieldError as e:
+                errors.append({'index': index, 'message': str(e)})
+
+        return (valid, errors)
+
+    def _feat(self, value):
+
+        # Same values BooleanField.to_python accepts, ignoring case, so
+        # form and CSV strings like "false" are not truthy.
+        if value in (True, False):
+            return bool(value)
+
+        if isinstance(value, str):
+            if value.strip().lower() in ('t', 'true', '1'):
+                return True
+            if value.strip().lower() in ('f', 'false', '0'):
+                return False
+
+        raise FieldError(messages.FEAT_MUST_BE_BOOLEAN)
+
+    def _release_date(self, value, today):
+
+        if not isinstance(value, str) or not self._date_format.match(value):
+            raise FieldError(messages.WRONG_RELEASE_DATE_FORMAT)
+
+        match = self._date_value.fullmatch(value)
+
+        try:
+
+            release_date = datetime.date(*map(int, match.groups()))
+        except (AttributeError, ValueError):
+            raise FieldError(messages.get_invalid_date(value))
+
+        if release_date > today:
+            raise FieldError(messages.RELEASE_DATE_CANNOT_BE_FUTURE)
+
+        return release_date
+
+    def _duration(self, value):
+
+        if not isinstance(value, str) or not self._time_format.match(value):
+            raise FieldError(messages.WRONG_DURATION_FORMAT)
+
+        match = self._time_value.fullmatch(value)
+
+        try:
+
+            return datetime.time(*map(int, match.groups()))
+        except (AttributeError, ValueError):
+            raise FieldError(messages.get_invalid_time(value))
+
+
+music_validator = MusicValidator()
@@ -0,0 +1,16 @@
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+from rest_framework import status
+from app import messages
+from app.models import Job
+from app.serializers import JobSerializer
+
+
+@api_view(['GET'])
+def get_job(request, id):
+
+    job = Job.objects.filter(id=id, user=request.user).first()
+    if job is None:
+        return Response({'message': messages.JOB_NOT_FOUND}, status=status.HTTP_404_NOT_FOUND)
+
+    return Response(JobSerializer(job).data)
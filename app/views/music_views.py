@@ -1,17 +1,32 @@
-import re
-from datetime import datetime
-from django.core.paginator import Paginator
+import csv
+import os
+import time
+from operator import itemgetter
+from django.conf import settings
 from django.core.exceptions import FieldError
+from django.db import IntegrityError, transaction
+from django.http import StreamingHttpResponse
 from django.utils import timezone
-from rest_framework.decorators import api_view
+from rest_framework.decorators import api_view, renderer_classes
 from rest_framework.response import Response
 from rest_framework import status
-from app import messages
-from app.models import Music
-from app.serializers import MusicSerializer
+from app import imports, messages
+from app.cache import music_cache, music_page_cache
+from app.conditional import make_etag, not_modified, set_validators
+from app.idempotency import idempotent
+from app.models import Music, MusicCounter
+from app.jobs import enqueue
+from app.purge import purge_musics
+from app.renderers import CSVRenderer, FastJSONRenderer, NDJSONRenderer
+from app.pagination import KEYSET_ORDERING, CountedPaginator, keyset_page
+from app.serializers import JobSerializer, MusicReadSerializer, MusicSerializer
+from app.validators import music_validator
+
+MUSIC_IDENTITY = Music.IDENTITY_FIELDS
 
 
 @api_view(['GET', 'POST'])
+@idempotent
 def get_post_musics(request):
 
     if request.method == 'GET':
@@ -21,31 +36,142 @@ def get_post_musics(request):
         return _post_music(request)
 
 
-@api_view(['GET', 'PUT', 'DELETE'])
+@api_view(['POST', 'PUT'])
+@idempotent
+def post_put_musics_bulk(request):
+
+    if not isinstance(request.data, list):
+        return Response({'message': messages.MUSICS_MUST_BE_A_LIST}, status=status.HTTP_400_BAD_REQUEST)
+
+    limit = settings.MUSIC_BULK_LIMIT
+    if len(request.data) > limit:
+        return Response({'message': messages.get_too_many_musics(limit)}, status=status.HTTP_400_BAD_REQUEST)
+
+    if request.method == 'POST':
+        return _post_musics(request)
+
+    if request.method == 'PUT':
+        return _put_musics(request)
+
+
+def _post_musics(request):
+
+    (valid, errors) = music_validator.validate_many(request.data)
+
+    # Items sharing an identity resolve to one music, like in POST /musics.
+    indexes = {}
+    for (index, values) in valid:
+        indexes.setdefault(Music.identity(values), []).append(index)
+
+    with transaction.atomic():
+
+        ids = _music_ids(request.user, indexes)
+        musics = [Music(user=request.user, **dict(zip(MUSIC_IDENTITY, identity)))
+                  for identity in indexes if identity not in ids]
+
+        # Musics inserted concurrently by another request are skipped here
+        # and picked up by the lookup below.
+        inserted = Music.objects.bulk_insert_or_ignore(
+            musics, batch_size=settings.MUSIC_BULK_BATCH_SIZE)
+        MusicCounter.objects.adjust(request.user, active=inserted)
+
+        new_ids = _music_ids(request.user, indexes.keys() - ids.keys())
+        ids.update(new_ids)
+
+    music_cache.delete_many(new_ids.values())
+
+    created = sorted(({'index': index, 'id': ids[identity]}
+                      for (identity, positions) in indexes.items()
+                      for index in positions), key=itemgetter('index'))
+
+    return Response({'created': created, 'errors': errors}, status=status.HTTP_201_CREATED)
+
+
+def _put_musics(request):
+
+    (valid, errors) = music_validator.validate_many(request.data, id_required=True)
+    values = {index: (music_values.pop('id'), music_values)
+              for (index, music_values) in valid}
+
+    try:
+
+        with transaction.atomic():
+
+            musics = _musics_by_id(request.user, [id for (id, _) in values.values()])
+
+            changes = []
+            for (index, (id, music_values)) in values.items():
+
+                music = musics.get(str(id))
+                if music is None:
+                    errors.append({'index': index, 'message': messages.MUSIC_NOT_FOUND})
+                    continue
+
+                identity = tuple(music_values.get(field, getattr(music, field))
+                                 for field in MUSIC_IDENTITY)
+                changes.append((index, music, music_values, identity))
+
+            # Identities already held by another music would break the
+            # unique constraint, so those items are rejected up front.
+            owners = _music_ids(request.user, [identity for (*_, identity) in changes])
+
+            (updated, changed) = ([], [])
+            for (index, music, music_values, identity) in changes:
+
+                if owners.setdefault(identity, music.id) != music.id:
+                    errors.append({'index': index, 'message': messages.MUSIC_ALREADY_EXISTS})
+                    continue
+
+                for (field, value) in music_values.items():
+                    setattr(music, field, value)
+
+                # bulk_update skips auto_now, so updated_at is set here.
+                music.updated_at = timezone.now()
+                updated.append({'index': index, 'id': music.id})
+                changed.append(music)
+
+            Music.objects.bulk_update(changed, MUSIC_IDENTITY + ['updated_at'],
+                                      batch_size=settings.MUSIC_BULK_BATCH_SIZE)
+            if updated:
+                MusicCounter.objects.touch(request.user)
+    except IntegrityError:
+        return Response({'message': messages.MUSIC_ALREADY_EXISTS}, status=status.HTTP_400_BAD_REQUEST)
+
+    music_cache.delete_many([music.id for music in changed])
+
+    errors.sort(key=itemgetter('index'))
+
+    return Response({'updated': updated, 'errors': errors})
+
+
+@api_view(['GET', 'PUT', 'PATCH', 'DELETE'])
 def get_update_delete_music(request, id):
 
+    if request.method == 'GET':
+        return _get_music_by_id(request, id)
+
+    if request.method == 'PATCH':
+        return _patch_music(request, id)
+
     try:
 
         music = _get_music_if_exists(request, id)
     except Music.DoesNotExist:
         return Response({'message': messages.MUSIC_NOT_FOUND}, status=status.HTTP_404_NOT_FOUND)
 
-    if request.method == 'GET':
-        return _get_music_by_id(music)
-
     if request.method == 'PUT':
         return _put_music(music, request)
 
     if request.method == 'DELETE':
-        return _delete_music(music)
+        return _delete_music(music, request)
 
 
 @api_view(['GET'])
 def count_deleted_musics(request):
 
-    result = Music.objects.filter(deleted=True, user=request.user).count()
+    counter = MusicCounter.objects.for_user(request.user)
 
-    return Response(result)
+    return Response(counter.deleted_count)
 
 
 @api_view(['GET'])
@@ -54,15 +180,45 @@ def get_deleted_musics(request):
 
 
 @api_view(['POST'])
+@idempotent
 def restore_deleted_musics(request):
 
-    music_ids = [music.get('id') for music in request.data]
-    if music_ids.count(None) > 0:
-        return Response({'message': messages.ID_IS_REQUIRED}, status=status.HTTP_400_BAD_REQUEST)
+    try:
 
-    result = Music.objects.filter(id__in=music_ids, deleted=True,
-                                  user=request.user).update(deleted=False,
-                                                            updated_at=timezone.now())
+        music_ids = _valid_music_ids(request.data)
+    except FieldError as e:
+        return Response({'message': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    with transaction.atomic():
+        result = sum(Music.objects.library(request.user, deleted=True).filter(
+            id__in=chunk).update(deleted=False, updated_at=timezone.now())
+            for chunk in _chunks(music_ids))
+        MusicCounter.objects.adjust(request.user, active=result,
+                                    deleted=-result)
+
+    music_cache.delete_many(music_ids)
+
+    return Response(result)
+
+
+@api_view(['POST'])
+@idempotent
+def delete_musics(request):
+
+    try:
+
+        music_ids = _valid_music_ids(request.data)
+    except FieldError as e:
+        return Response({'message': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    with transaction.atomic():
+        result = sum(Music.objects.library(request.user).filter(
+            id__in=chunk).update(deleted=True, updated_at=timezone.now())
+            for chunk in _chunks(music_ids))
+        MusicCounter.objects.adjust(request.user, active=-result,
+                                    deleted=result)
+
+    music_cache.delete_many(music_ids)
 
     return Response(result)
 
@@ -73,19 +229,156 @@ def definitive_delete_music(request, id):
     try:
 
         music = _get_music_if_not_exists(request, id)
-        music.delete()
+
+        # The counter moves by the rows this request deleted, so concurrent
+        # deletes of the same music cannot both count it.
+        with transaction.atomic():
+            (deleted, _) = Music.objects.library(request.user, deleted=True).filter(
+                id=music.id).delete()
+            MusicCounter.objects.adjust(request.user, deleted=-deleted)
+
+        if not deleted:
+            raise Music.DoesNotExist
+
+        music_cache.delete_many([id])
 
         return Response()
     except Music.DoesNotExist:
         return Response({'message': messages.MUSIC_NOT_FOUND}, status=status.HTTP_404_NOT_FOUND)
 
 
+@api_view(['POST'])
+@idempotent
+def definitive_delete_musics(request):
+
+    try:
+
+        music_ids = _valid_music_ids(request.data)
+    except FieldError as e:
+        return Response({'message': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    with transaction.atomic():
+        result = sum(Music.objects.library(request.user, deleted=True).filter(
+            id__in=chunk).delete()[0] for chunk in _chunks(music_ids))
+        MusicCounter.objects.adjust(request.user, deleted=-result)
+
+    music_cache.delete_many(music_ids)
+
+    return Response(result)
+
+
 @api_view(['DELETE'])
 def empty_list(request):
 
-    result = Music.objects.filter(deleted=True, user=request.user).delete()
+    counter = MusicCounter.objects.for_user(request.user)
+    if counter.deleted_count > settings.MUSIC_PURGE['INLINE_LIMIT']:
+        job = enqueue(request.user, 'purge_musics', total=counter.deleted_count)
+        return Response(JobSerializer(job).data, status=status.HTTP_202_ACCEPTED)
+
+    return Response(purge_musics(request.user))
+
+
+@api_view(['GET'])
+@renderer_classes([NDJSONRenderer, CSVRenderer])
+def export_musics(request):
+
+    try:
+
+        fields = _valid_fields(request)
+    except FieldError as e:
+        return Response({'message': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    columns = fields + [field for field in KEYSET_ORDERING if field not in fields]
+    key = itemgetter(*[columns.index(field) for field in KEYSET_ORDERING])
+
+    chunks = _library_chunks(request.user, columns, key)
+    serializer = MusicReadSerializer([], fields)
+    export_format = request.accepted_renderer.format
+
+    if export_format == 'csv':
+        response = StreamingHttpResponse(_csv_lines(chunks, serializer),
+                                         content_type='text/csv; charset=utf-8')
+    else:
+        response = StreamingHttpResponse(_ndjson_lines(chunks, serializer),
+                                         content_type='application/x-ndjson')
+
+    response['Content-Disposition'] = 'attachment; filename="musics.{}"'.format(export_format)
+
+    return response
+
+
+@api_view(['POST'])
+@renderer_classes([FastJSONRenderer, NDJSONRenderer, CSVRenderer])
+def import_musics(request):
+
+    upload = request.FILES.get('file')
+    if upload is None:
+        return Response({'message': messages.FILE_IS_REQUIRED}, status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+
+        import_format = _import_format(request, upload)
+    except FieldError as e:
+        return Response({'message': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    if upload.size > settings.MUSIC_IMPORT['INLINE_LIMIT']:
+        name = imports.import_storage.save('{}.{}'.format(request.user.id, import_format), upload)
+        job = enqueue(request.user, 'import_musics',
+                      {'name': name, 'import_format': import_format})
+        return Response(JobSerializer(job).data, status=status.HTTP_202_ACCEPTED)
+
+    report = imports.import_musics(request.user, upload, import_format)
+
+    return Response(report, status=status.HTTP_201_CREATED)
+
 
-    return Response(result[0])
+def _library_chunks(user, columns, key):
+
+    # Keyset pages rather than QuerySet.iterator(): MySQLdb reads the whole
+    # result set into memory, so only bounded queries keep the export flat.
+    musics = Music.objects.library(user).values_list(*columns)
+    cursor = None
+
+    while True:
+        (rows, cursor) = keyset_page(musics, cursor,
+                                     settings.MUSIC_EXPORT['CHUNK_SIZE'], key)
+        yield rows
+
+        if cursor is None:
+            return
+
+
+def _ndjson_lines(chunks, serializer):
+
+    renderer = FastJSONRenderer()
+
+    for rows in chunks:
+        yield b''.join(renderer.render(serializer.to_representation(row)) + b'\n'
+                       for row in rows)
+
+
+class _Lines:
+
+    def write(self, line):
+        return line
+
+
+def _csv_lines(chunks, serializer):
+
+    writer = csv.writer(_Lines())
+    yield writer.writerow(serializer.fields)
+
+    for rows in chunks:
+        yield ''.join(writer.writerow(serializer.to_representation(row).values())
+                      for row in rows)
+
+
+def _chunks(ids):
+
+    # Keeps each IN list below the bound-parameter limits of the backends.
+    batch_size = settings.MUSIC_BULK_BATCH_SIZE
+    for start in range(0, len(ids), batch_size):
+        yield ids[start:start + batch_size]
 
 
 def _get_music_if_exists(request, id):
@@ -97,81 +390,246 @@ def _get_music_if_exists(request, id):
     return music
 
 
-def _get_music_by_id(music):
+def _get_music_by_id(request, id):
 
-    serializer = MusicSerializer(music)
+    try:
 
-    return Response(serializer.data)
+        fields = _valid_fields(request)
+    except FieldError as e:
+        return Response({'message': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    # Cached entries are shared by every user, so ownership is checked on
+    # each read instead of being part of the key.
+    music = music_cache.get_or_load(id, _load_music, music_cache.version(request.user.id))
+    if music is None or music['user_id'] != request.user.id or music['deleted']:
+        return Response({'message': messages.MUSIC_NOT_FOUND}, status=status.HTTP_404_NOT_FOUND)
+
+    updated_at = music['updated_at']
+    etag = make_etag(id, updated_at.isoformat(), *fields)
+
+    response = not_modified(request, etag, updated_at)
+    if response is not None:
+        return response
+
+    data = {field: music['data'][field] for field in fields}
+
+    return set_validators(Response(data), etag, updated_at)
+
+
+def _load_music(id):
+
+    row = Music.objects.filter(id=id).values_list(
+        'user_id', 'deleted', *MusicReadSerializer.FIELDS).first()
+    if row is None:
+        return None
+
+    (user_id, deleted, *values) = row
+
+    return {
+        'user_id': user_id,
+        'deleted': deleted,
+        'updated_at': values[MusicReadSerializer.FIELDS.index('updated_at')],
+        'data': MusicReadSerializer([values]).data[0],
+    }
 
 
 def _get_musics(request, deleted=False):
 
+    if 'cursor' in request.GET:
+        return _get_musics_by_cursor(request, deleted)
+
     page = request.GET.get('page') or 1
     size = request.GET.get('size') or 5
 
-    musics = Music.objects.filter(deleted=deleted, user=request.user)
-    paginator = Paginator(musics, size)
-    serializer = MusicSerializer(paginator.get_page(page), many=True)
+    try:
 
-    return Response({'content': serializer.data, 'total': paginator.count})
+        fields = _valid_fields(request)
+    except FieldError as e:
+        return Response({'message': str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
+    counter = MusicCounter.objects.for_user(request.user)
+    total = counter.deleted_count if deleted else counter.active_count
 
-def _valid_music(request):
+    def build_page():
 
-    title = request.data.get('title')
-    if not title:
-        raise FieldError(messages.TITLE_IS_REQUIRED)
+        musics = Music.objects.library(request.user, deleted=deleted).values_list(
+            *fields)
+        paginator = CountedPaginator(musics, size, total)
+        serializer = MusicReadSerializer(paginator.get_page(page), fields)
 
-    artist = request.data.get('artist')
-    if not artist:
-        raise FieldError(messages.ARTIST_IS_REQUIRED)
+        return {'content': serializer.data, 'total': paginator.count}
 
-    release_date = request.data.get('release_date')
-    if not release_date:
-        raise FieldError(messages.RELEASE_DATE_IS_REQUIRED)
+    return _library_response(request, counter, deleted,
+                             ['page', page, size, ','.join(fields)], build_page)
 
-    duration = request.data.get('duration')
-    if not duration:
-        raise FieldError(messages.DURATION_IS_REQUIRED)
 
-    if not re.match('\d{4}-\d{2}-\d{2}', release_date):
-        raise FieldError(messages.WRONG_RELEASE_DATE_FORMAT)
+def _get_musics_by_cursor(request, deleted=False):
 
     try:
 
-        release_date_obj = datetime.strptime(release_date, '%Y-%m-%d')
-    except ValueError:
-        raise FieldError(messages.get_invalid_date(release_date))
+        size = _valid_size(request)
+        fields = _valid_fields(request)
+
+        # The cursor keys are selected even when they are not returned.
+        columns = fields + [field for field in KEYSET_ORDERING
+                            if field not in fields]
+        key = itemgetter(*[columns.index(field) for field in KEYSET_ORDERING])
+
+        cursor = request.GET.get('cursor')
+        counter = MusicCounter.objects.for_user(request.user)
+
+        def build_page():
+
+            musics = Music.objects.library(request.user, deleted=deleted).values_list(
+                *columns)
+            (page, next_cursor) = keyset_page(musics, cursor, size, key)
+            serializer = MusicReadSerializer(page, fields)
+
+            return {'content': serializer.data, 'next_cursor': next_cursor}
+
+        return _library_response(request, counter, deleted,
+                                 ['cursor', cursor, size, ','.join(fields)],
+                                 build_page)
+    except FieldError as e:
+        return Response({'message': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+
+def _library_response(request, counter, deleted, key_parts, build_page):
+
+    etag = _library_etag(request, counter, deleted)
+    response = not_modified(request, etag, counter.updated_at)
+    if response is not None:
+        return response
+
+    # Writes bump counter.version, which orphans every cached page of the
+    # library at once; updated_at keeps a recreated counter from matching
+    # pages cached for a previous owner of the same user id.
+    start = time.perf_counter()
+    key = music_page_cache.key(counter.user_id, counter.updated_at.timestamp(),
+                               deleted, *key_parts)
+
+    data = music_page_cache.get(key, counter.version)
+    hit = data is not None
+    if not hit:
+        data = build_page()
+        music_page_cache.set(key, data, counter.version)
+
+    elapsed = time.perf_counter() - start
+    music_page_cache.record(hit, elapsed)
+
+    response = Response(data)
+    response['X-Cache'] = 'HIT' if hit else 'MISS'
+    response['Server-Timing'] = 'page-cache;desc="{}";dur={:.3f}'.format(
+        response['X-Cache'], elapsed * 1e3)
 
-    if release_date_obj > datetime.today():
-        raise FieldError(messages.RELEASE_DATE_CANNOT_BE_FUTURE)
+    return set_validators(response, etag, counter.updated_at)
 
-    if not re.match('\d{2}:\d{2}:\d{2}', duration):
-        raise FieldError(messages.WRONG_DURATION_FORMAT)
+
+def _library_etag(request, counter, deleted):
+
+    # Every write bumps the library version, so a (version, query) pair
+    # always maps to the same page body.
+    params = sorted((key, request.GET.getlist(key)) for key in request.GET)
+
+    return make_etag(counter.user_id, counter.version, deleted, params)
+
+
+def _import_format(request, upload):
+
+    # An explicit ?format= wins; otherwise the upload's content type, then
+    # its extension, tell the format. Nothing is guessed beyond that.
+    if 'format' in request.query_params:
+        import_format = request.query_params['format']
+    else:
+        import_format = (imports.CONTENT_TYPE_FORMATS.get(upload.content_type) or
+                         imports.EXTENSION_FORMATS.get(os.path.splitext(upload.name)[1].lower()))
+
+    if import_format not in imports.FORMATS:
+        raise FieldError(messages.INVALID_IMPORT_FORMAT)
+
+    return import_format
+
+
+def _valid_fields(request):
+
+    requested = [field.strip() for field in request.GET.get('fields', '').split(',')
+                 if field.strip()]
+    if not requested:
+        return MusicReadSerializer.FIELDS
+
+    unknown = [field for field in requested
+               if field not in MusicReadSerializer.FIELDS]
+    if unknown:
+        raise FieldError(messages.get_unknown_fields(unknown))
+
+    return [field for field in MusicReadSerializer.FIELDS if field in requested]
+
+
+def _valid_size(request):
 
     try:
 
-        datetime.strptime(duration, '%H:%M:%S')
+        size = int(request.GET.get('size') or 5)
     except ValueError:
-        raise FieldError(messages.get_invalid_time(duration))
+        raise FieldError(messages.INVALID_SIZE)
+
+    if size < 1:
+        raise FieldError(messages.INVALID_SIZE)
+
+    return size
+
+
+def _music_ids(user, identities):
+    return Music.objects.ids_by_identity(user, identities,
+                                         settings.MUSIC_BULK_BATCH_SIZE)
+
+
+def _valid_music_ids(data):
+
+    if not isinstance(data, list):
+        raise FieldError(messages.MUSICS_MUST_BE_A_LIST)
+
+    if not all(isinstance(music, dict) for music in data):
+        raise FieldError(messages.MUSIC_MUST_BE_AN_OBJECT)
+
+    music_ids = [music.get('id') for music in data]
+    if music_ids.count(None) > 0:
+        raise FieldError(messages.ID_IS_REQUIRED)
+
+    # Ids that cannot be a primary key match no music, as in _musics_by_id.
+    return [id for id in music_ids if str(id).isdigit()]
 
-    return (title, artist, release_date, duration)
+
+def _musics_by_id(user, ids):
+
+    ids = [id for id in ids if str(id).isdigit()]
+    musics = {}
+
+    for chunk in _chunks(ids):
+        for music in Music.objects.library(user).filter(id__in=chunk):
+            musics[str(music.id)] = music
+
+    return musics
 
 
 def _post_music(request):
 
     try:
 
-        (title, artist, release_date, duration) = _valid_music(request)
-        (music, _) = Music.objects.get_or_create(
-            title=title,
-            artist=artist,
-            release_date=release_date,
-            duration=duration,
-            number_views=request.data.get('number_views') or 0,
-            feat=request.data.get('feat') or False,
-            user=request.user
-        )
+        values = music_validator.validate(request.data)
+        with transaction.atomic():
+            (music, created) = Music.objects.insert_or_get(
+                number_views=values.pop('number_views', None) or 0,
+                feat=values.pop('feat', None) or False,
+                user=request.user,
+                **values
+            )
+            if created:
+                MusicCounter.objects.adjust(request.user, active=1)
+
+        if created:
+            music_cache.delete_many([music.id])
+
         serializer = MusicSerializer(music)
 
         return Response(serializer.data, status=status.HTTP_201_CREATED)
@@ -183,20 +641,77 @@ def _put_music(music, request):
 
     try:
 
-        _valid_music(request)
-        serializer = MusicSerializer(music, request.data)
-        serializer.is_valid()
-        serializer.save()
+        values = music_validator.validate(request.data)
+        changed = [field for (field, value) in values.items()
+                   if getattr(music, field) != value]
+
+        for field in changed:
+            setattr(music, field, values[field])
+
+        if changed:
+            with transaction.atomic():
+                music.save(update_fields=changed + ['updated_at'])
+                MusicCounter.objects.touch(request.user)
+
+        serializer = MusicSerializer(music)
 
         return Response(serializer.data)
     except FieldError as e:
         return Response({'message': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    except IntegrityError:
+        return Response({'message': messages.MUSIC_ALREADY_EXISTS}, status=status.HTTP_400_BAD_REQUEST)
+
+
+def _patch_music(request, id):
+
+    try:
+
+        values = music_validator.validate(request.data, partial=True)
+
+        # Ownership and the deleted flag are part of the WHERE clause, so the
+        # write needs no prior SELECT.
+        musics = Music.objects.library(request.user).filter(id=id)
+        with transaction.atomic():
+            if values:
+                found = musics.update(updated_at=timezone.now(), **values)
+                if found:
+                    MusicCounter.objects.touch(request.user)
+            else:
+                found = musics.exists()
+
+        if not found:
+            return Response({'message': messages.MUSIC_NOT_FOUND}, status=status.HTTP_404_NOT_FOUND)
+
+        music_cache.delete_many([id])
+        music = music_cache.get_or_load(id, _load_music, music_cache.version(request.user.id))
+        if music is None:
+            return Response({'message': messages.MUSIC_NOT_FOUND}, status=status.HTTP_404_NOT_FOUND)
+
+        return Response(music['data'])
+    except FieldError as e:
+        return Response({'message': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    except IntegrityError:
+        return Response({'message': messages.MUSIC_ALREADY_EXISTS}, status=status.HTTP_400_BAD_REQUEST)
 
 
-def _delete_music(music):
+def _delete_music(music, request):
 
     music.deleted = True
-    music.save()
+    music.updated_at = timezone.now()
+
+    # Only the request whose UPDATE still finds the music active moves it to
+    # the trash and adjusts the counter.
+    with transaction.atomic():
+        deleted = Music.objects.library(request.user).filter(id=music.id).update(
+            deleted=True, updated_at=music.updated_at)
+        if deleted:
+            MusicCounter.objects.adjust(request.user, active=-1, deleted=1)
+
+    if not deleted:
+        return Response({'message': messages.MUSIC_NOT_FOUND}, status=status.HTTP_404_NOT_FOUND)
+
+    music_cache.delete_many([music.id])
+
     serializer = MusicSerializer(music)
 
     return Response(serializer.data)
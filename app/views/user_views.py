@@ -1,14 +1,13 @@
-import datetime
-import jwt
-from django.core.validators import validate_email
-from django.db import IntegrityError
-from django.conf import settings
+import json
+from asgiref.sync import sync_to_async
+from django.http import HttpResponseNotAllowed, JsonResponse
 from django.core.validators import validate_email
 from django.core.exceptions import FieldError, ValidationError
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
 from rest_framework import status
-from app import messages
+from app import hashing, messages, tokens
+from app.hashing import HashingUnavailable
 from app.models import User
 from app.serializers import UserSerializer
 
@@ -18,17 +17,14 @@ def create_user(request):
 
     try:
 
-        (username, email, password) = _valid_user(request)
+        (username, email, password) = _valid_user(request.data)
 
         if User.objects.filter(email=email).exists():
             message = messages.get_email_already_registered(email)
             return Response({'message': message}, status=status.HTTP_400_BAD_REQUEST)
 
-        user = User.objects.create_user(
-            username=username,
-            email=email,
-            password=password
-        )
+        user = _new_user(username, email, hashing.make_password(password))
+        user.save()
         serializer = UserSerializer(user)
 
         return Response(serializer.data, status=status.HTTP_201_CREATED)
@@ -36,6 +32,8 @@ def create_user(request):
         return Response({'message': str(e)}, status=status.HTTP_400_BAD_REQUEST)
     except ValidationError:
         return Response({'message': messages.EMAIL_INVALID}, status=status.HTTP_400_BAD_REQUEST)
+    except HashingUnavailable:
+        return Response({'message': messages.PASSWORD_HASHING_BUSY}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
 
 
 @api_view(['POST'])
@@ -43,55 +41,175 @@ def login(request):
 
     try:
 
-        (email, password) = _valid_login(request)
+        (email, password) = _valid_login(request.data)
         user = User.objects.get(email=email)
-        if not user.check_password(password):
+        if not hashing.check_password(user, password):
             message = messages.get_password_does_not_match_with_email(email)
             return Response({'message': message}, status=status.HTTP_401_UNAUTHORIZED)
 
-        token = jwt.encode({'user_id': user.id, 'exp': _token_expiration_time()},
-                           settings.SECRET_KEY, algorithm='HS256')
-
-        return Response({
-            'token': token,
-            'username': user.username,
-            'email': user.email,
-        }, status=status.HTTP_200_OK)
+        return Response(_login_data(user), status=status.HTTP_200_OK)
     except User.DoesNotExist:
         return Response({'message': messages.get_user_not_found_by_email(email)}, status=status.HTTP_401_UNAUTHORIZED)
     except FieldError as e:
         return Response({'message': str(e)}, status=status.HTTP_400_BAD_REQUEST)
     except ValidationError:
         return Response({'message': messages.EMAIL_INVALID}, status=status.HTTP_400_BAD_REQUEST)
+    except HashingUnavailable:
+        return Response({'message': messages.PASSWORD_HASHING_BUSY}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+
+
+@api_view(['POST'])
+def refresh_token(request):
+
+    try:
+
+        (user, new_refresh_token) = tokens.rotate_refresh_token(
+            _refresh_token_data(request.data))
+
+        return Response({
+            'token': tokens.access_token(user),
+            'refresh_token': new_refresh_token,
+        }, status=status.HTTP_200_OK)
+    except FieldError as e:
+        return Response({'message': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    except tokens.InvalidRefreshToken as e:
+        return Response({'message': str(e)}, status=status.HTTP_401_UNAUTHORIZED)
+
+
+@api_view(['POST'])
+def revoke_token(request):
+
+    try:
+
+        tokens.revoke_refresh_token(_refresh_token_data(request.data))
+
+        return Response()
+    except FieldError as e:
+        return Response({'message': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    except tokens.InvalidRefreshToken as e:
+        return Response({'message': str(e)}, status=status.HTTP_401_UNAUTHORIZED)
+
+
+async def create_user_async(request):
+
+    if request.method != 'POST':
+        return HttpResponseNotAllowed(['POST'])
+
+    try:
+
+        (username, email, password) = _valid_user(_json_data(request))
+
+        if await sync_to_async(User.objects.filter(email=email).exists)():
+            message = messages.get_email_already_registered(email)
+            return JsonResponse({'message': message}, status=status.HTTP_400_BAD_REQUEST)
 
+        user = _new_user(username, email, await hashing.amake_password(password))
+        await sync_to_async(user.save)()
+        serializer = UserSerializer(user)
+
+        return JsonResponse(serializer.data, status=status.HTTP_201_CREATED)
+    except FieldError as e:
+        return JsonResponse({'message': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    except ValidationError:
+        return JsonResponse({'message': messages.EMAIL_INVALID}, status=status.HTTP_400_BAD_REQUEST)
+    except HashingUnavailable:
+        return JsonResponse({'message': messages.PASSWORD_HASHING_BUSY}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+
+
+async def login_async(request):
+
+    if request.method != 'POST':
+        return HttpResponseNotAllowed(['POST'])
+
+    try:
+
+        (email, password) = _valid_login(_json_data(request))
+        user = await sync_to_async(User.objects.get)(email=email)
+        if not await hashing.acheck_password(user, password):
+            message = messages.get_password_does_not_match_with_email(email)
+            return JsonResponse({'message': message}, status=status.HTTP_401_UNAUTHORIZED)
+
+        data = await sync_to_async(_login_data)(user)
+
+        return JsonResponse(data, status=status.HTTP_200_OK)
+    except User.DoesNotExist:
+        return JsonResponse({'message': messages.get_user_not_found_by_email(email)}, status=status.HTTP_401_UNAUTHORIZED)
+    except FieldError as e:
+        return JsonResponse({'message': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    except ValidationError:
+        return JsonResponse({'message': messages.EMAIL_INVALID}, status=status.HTTP_400_BAD_REQUEST)
+    except HashingUnavailable:
+        return JsonResponse({'message': messages.PASSWORD_HASHING_BUSY}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
 
-def _valid_login(request):
 
-    email = request.data.get('email')
+# Plain async views are not wrapped by DRF, and csrf_exempt() in this Django
+# version would turn them back into sync callables.
+create_user_async.csrf_exempt = True
+login_async.csrf_exempt = True
+
+
+def _valid_login(data):
+
+    email = data.get('email')
     if not email:
         raise FieldError(messages.EMAIL_IS_REQUIRED)
 
     validate_email(email)
 
-    password = request.data.get('password')
+    password = data.get('password')
     if not password:
         raise FieldError(messages.PASSWORD_IS_REQUIRED)
 
     return (email, password)
 
 
-def _valid_user(request):
+def _valid_user(data):
 
-    username = request.data.get('username')
+    username = data.get('username')
     if not username:
         raise FieldError(messages.USERNAME_IS_REQUIRED)
 
-    (email, password) = _valid_login(request)
+    (email, password) = _valid_login(data)
     return (username, email, password)
 
 
-def _token_expiration_time():
+def _json_data(request):
+
+    try:
+
+        data = json.loads(request.body or b'{}')
+    except ValueError:
+        raise FieldError(messages.INVALID_JSON_BODY)
+
+    if not isinstance(data, dict):
+        raise FieldError(messages.INVALID_JSON_BODY)
+
+    return data
+
+
+def _new_user(username, email, password_hash):
+
+    return User(
+        username=User.normalize_username(username),
+        email=User.objects.normalize_email(email),
+        password=password_hash
+    )
+
+
+def _login_data(user):
+
+    return {
+        'token': tokens.access_token(user),
+        'refresh_token': tokens.refresh_token(user),
+        'username': user.username,
+        'email': user.email,
+    }
+
+
+def _refresh_token_data(data):
 
-    same_time_tomorrow = datetime.datetime.today() + datetime.timedelta(days=1)
+    token = data.get('refresh_token')
+    if not token:
+        raise FieldError(messages.REFRESH_TOKEN_IS_REQUIRED)
 
-    return int(same_time_tomorrow.timestamp())
+    return token